@@ -1,9 +1,11 @@
 """FastAPI 서버 - LangChain RAG 시스템 API."""
 
+import asyncio
 import os
 from typing import List, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from langchain_openai import ChatOpenAI
@@ -15,6 +17,16 @@ from sqlalchemy.exc import DataError
 # 우분투: app/ 폴더가 없고 루트에 파일들이 직접 있으면 절대 import 사용
 try:
     from .app import get_vector_store, test_pgvector, wait_for_postgres
+    from .repository.vector_repository import (
+        ensure_collection_id_index,
+        ensure_fulltext_index,
+    )
+    from .service.perf_tracing import (
+        end_request_trace,
+        get_perf_metrics,
+        is_perf_tracing_enabled,
+        start_request_trace,
+    )
     from .models import (
         get_llm_provider,
         set_llm_provider,
@@ -22,14 +34,25 @@ try:
     )
     # ChatMidm은 선택적 import (우분투에서는 사용하지 않을 수 있음)
     try:
-        from .models import ChatMidm
+        from .models import ChatMidm, get_midm_model_registry
     except ImportError:
         ChatMidm = None
+        get_midm_model_registry = None
     from .router.rag_router import router as rag_router
     from .router.chat_router import router as chat_router
 except ImportError as e:
     # 우분투 환경: 절대 import 사용
     from app import get_vector_store, test_pgvector, wait_for_postgres
+    from repository.vector_repository import (
+        ensure_collection_id_index,
+        ensure_fulltext_index,
+    )
+    from service.perf_tracing import (
+        end_request_trace,
+        get_perf_metrics,
+        is_perf_tracing_enabled,
+        start_request_trace,
+    )
     from models import (
         get_llm_provider,
         set_llm_provider,
@@ -37,9 +60,10 @@ except ImportError as e:
     )
     # ChatMidm은 선택적 import (우분투에서는 사용하지 않을 수 있음)
     try:
-        from models import ChatMidm
+        from models import ChatMidm, get_midm_model_registry
     except ImportError:
         ChatMidm = None
+        get_midm_model_registry = None
     try:
         from router.rag_router import router as rag_router
         from router.chat_router import router as chat_router
@@ -60,6 +84,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 성능 추적 (RAG_PERF_TRACING=1일 때만 등록하여 비활성화 시 오버헤드 없음)
+if is_perf_tracing_enabled():
+
+    @app.middleware("http")
+    async def perf_tracing_middleware(request: Request, call_next):
+        """요청별 단계 시간을 수집해 Server-Timing 헤더와 /metrics에 반영합니다."""
+        trace, token = start_request_trace()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            response.headers["Server-Timing"] = trace.server_timing()
+            return response
+        finally:
+            route = request.scope.get("route")
+            get_perf_metrics().observe(
+                trace,
+                route=getattr(route, "path", "unmatched"),
+                method=request.method,
+                status=status,
+                seconds=trace.elapsed(),
+            )
+            end_request_trace(token)
+
+    print("✅ 요청별 성능 추적 활성화 (Server-Timing 헤더, /metrics)")
+
 # 라우터 등록
 if rag_router:
     app.include_router(rag_router)
@@ -80,6 +130,25 @@ class SearchRequest(BaseModel):
 
     query: str
     k: int = 5
+    # ANN 인덱스 검색 설정 (None이면 환경 변수 또는 서버 기본값)
+    ef_search: Optional[int] = None
+    probes: Optional[int] = None
+
+
+class VectorIndexRequest(BaseModel):
+    """ANN 인덱스 생성 요청 모델."""
+
+    method: str = "hnsw"
+    m: int = 16
+    ef_construction: int = 64
+    lists: Optional[int] = None
+
+
+class DeleteDocumentsRequest(BaseModel):
+    """메타데이터 필터 문서 삭제 요청 모델."""
+
+    metadata_filter: dict
+    collection_name: str = "langchain"
 
 
 class DocumentResponse(BaseModel):
@@ -136,6 +205,10 @@ class SearchAndChatResponse(BaseModel):
 # 전역 변수
 _vector_store = None
 _llm_initialized = False
+# Mi:dm 모델 워밍업 태스크 (None이면 Mi:dm을 사용하지 않음)
+_midm_warmup_task: Optional[asyncio.Task] = None
+# 시작 시 ANN 인덱스 구축 태스크
+_vector_index_task: Optional[asyncio.Task] = None
 
 
 def get_vector_store_instance():
@@ -165,6 +238,86 @@ def _initialize_default_llm() -> ChatOpenAI:
     )
 
 
+def _get_rag_service():
+    """rag_service 모듈을 가져옵니다."""
+    try:
+        from .service import rag_service
+    except ImportError:
+        from service import rag_service
+    return rag_service
+
+
+def _get_vector_index_method() -> Optional[str]:
+    """VECTOR_INDEX_METHOD 환경 변수(hnsw/ivfflat)를 반환합니다. 없으면 None."""
+    method = os.getenv("VECTOR_INDEX_METHOD", "").lower()
+    return method or None
+
+
+def _build_vector_index(method: str) -> None:
+    """ANN 인덱스를 구축합니다 (백그라운드 스레드에서 실행).
+
+    Args:
+        method: 인덱스 종류 ("hnsw" 또는 "ivfflat").
+    """
+    try:
+        result = _get_rag_service().get_vector_index_manager().ensure_index(
+            method=method,
+            m=int(os.getenv("HNSW_M", "16")),
+            ef_construction=int(os.getenv("HNSW_EF_CONSTRUCTION", "64")),
+        )
+    except Exception as e:
+        print(f"⚠️  벡터 인덱스 구축 실패: {e}")
+        return
+    state = "생성 완료" if result["created"] else "이미 존재"
+    print(f"✅ 벡터 인덱스 {state}: {result['name']}")
+
+
+def _reindex_vector_index() -> None:
+    """대량 인제스트 후 ANN 인덱스를 재구축합니다 (백그라운드에서 실행)."""
+    try:
+        names = _get_rag_service().get_vector_index_manager().reindex()
+    except Exception as e:
+        print(f"⚠️  벡터 인덱스 재구축 실패: {e}")
+        return
+    print(f"✅ 벡터 인덱스 재구축 완료: {', '.join(names) or '없음'}")
+
+
+def _vacuum_collection(collection_name: str) -> None:
+    """대량 삭제 후 테이블을 정리하고 ANN 인덱스를 다시 만듭니다 (백그라운드에서 실행).
+
+    Args:
+        collection_name: 삭제가 일어난 컬렉션 이름.
+    """
+    try:
+        manager = _get_rag_service().get_vector_index_manager(collection_name)
+        manager.vacuum()
+        method = _get_vector_index_method()
+        if method:
+            manager.ensure_index(method=method)
+    except Exception as e:
+        print(f"⚠️  벡터 테이블 정리 실패: {e}")
+        return
+    print(f"✅ 벡터 테이블 정리 완료 (컬렉션: {collection_name})")
+
+
+def _warm_up_midm(midm_model) -> None:
+    """Mi:dm 모델을 로드하고 워밍업합니다 (백그라운드 스레드에서 실행).
+
+    Args:
+        midm_model: 워밍업할 ChatMidm 인스턴스.
+    """
+    try:
+        midm_model.warmup()
+    except Exception as e:
+        print(f"⚠️  Mi:dm 모델 워밍업 실패: {e}")
+        return
+    for metrics in get_midm_model_registry().metrics():
+        print(
+            f"✅ Mi:dm 모델 준비 완료! (로딩 {metrics['load_seconds']:.1f}s, "
+            f"워밍업 {metrics['warmup_seconds']:.1f}s)"
+        )
+
+
 @app.on_event("startup")
 async def startup_event():
     """서버 시작 시 초기화."""
@@ -193,8 +346,24 @@ async def startup_event():
     # 벡터 스토어 초기화
     get_vector_store_instance()
 
+    # 컬렉션별 검색/삭제용 collection_id 인덱스 (이미 있으면 건너뜀)
+    ensure_collection_id_index(connection_string)
+
+    # 하이브리드 검색용 전문 검색 인덱스 (이미 있으면 건너뜀)
+    if os.getenv("RETRIEVAL_MODE", "dense").lower() == "hybrid":
+        ensure_fulltext_index(connection_string)
+        print("✅ 전문 검색 인덱스 확인 완료 (하이브리드 검색)")
+
+    # ANN 인덱스 (대용량 컬렉션은 구축에 오래 걸리므로 백그라운드에서 실행)
+    global _vector_index_task
+    vector_index_method = _get_vector_index_method()
+    if vector_index_method:
+        _vector_index_task = asyncio.create_task(
+            asyncio.to_thread(_build_vector_index, vector_index_method)
+        )
+
     # LLM 프로바이더 초기화 (한번만 실행되도록 체크)
-    global _llm_initialized
+    global _llm_initialized, _midm_warmup_task
     if not _llm_initialized:
         provider = get_llm_provider()
         try:
@@ -218,10 +387,20 @@ async def startup_event():
                             model_path=local_model_dir,  # None이면 기본 경로 사용
                             temperature=0.7,
                             max_tokens=512,
+                            # 동시 요청을 하나의 generate 호출로 묶는 동적 배칭
+                            max_batch_size=int(os.getenv("MIDM_MAX_BATCH_SIZE", "8")),
+                            max_batch_wait_ms=float(os.getenv("MIDM_MAX_BATCH_WAIT_MS", "10")),
+                            # RAG 시스템 프롬프트 등 공통 프리픽스의 KV 캐시
+                            prefix_cache_mb=float(os.getenv("MIDM_PREFIX_CACHE_MB", "256")),
                         )
                         provider.set_llm(midm_model)
                         print(f"✅ Mi:dm 모델 초기화 완료! (경로: {local_model_dir or '기본 경로'})")
                         _llm_initialized = True
+                        # 첫 요청이 로딩 비용을 치르지 않도록 백그라운드에서 미리 로드/워밍업
+                        # (/health는 워밍업이 끝날 때까지 503을 반환)
+                        _midm_warmup_task = asyncio.create_task(
+                            asyncio.to_thread(_warm_up_midm, midm_model)
+                        )
                     except Exception as e:
                         print(f"⚠️  Mi:dm 모델 초기화 실패: {e}")
                         print("   채팅 기능은 사용할 수 없지만 검색 기능은 정상 작동합니다.")
@@ -252,8 +431,32 @@ async def root():
 
 @app.get("/health")
 async def health():
-    """헬스 체크 엔드포인트."""
-    return {"status": "healthy"}
+    """헬스 체크 엔드포인트.
+
+    Mi:dm 모델을 사용하는 경우 모델 로딩과 워밍업이 끝날 때까지 503을 반환하여
+    로드 밸런서가 준비되지 않은 인스턴스로 요청을 보내지 않도록 합니다.
+    """
+    if _midm_warmup_task is None:
+        return {"status": "healthy"}
+
+    registry = get_midm_model_registry()
+    models = registry.metrics()
+    if registry.is_ready():
+        return {"status": "healthy", "models": models}
+
+    failed = any(model["status"] == "failed" for model in models)
+    return JSONResponse(
+        status_code=503,
+        content={"status": "unhealthy" if failed else "loading", "models": models},
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 텍스트 형식의 요청 성능 메트릭 (RAG_PERF_TRACING=1일 때 수집)."""
+    return PlainTextResponse(
+        get_perf_metrics().render(), media_type="text/plain; version=0.0.4"
+    )
 
 
 @app.post("/search", response_model=SearchResponse)
@@ -267,9 +470,11 @@ async def search(request: SearchRequest):
         검색 결과.
     """
     try:
-        vector_store = get_vector_store_instance()
-        results = vector_store.similarity_search_with_score(
-            request.query, k=request.k
+        results = _get_rag_service().search_documents(
+            request.query,
+            k=request.k,
+            ef_search=request.ef_search,
+            probes=request.probes,
         )
 
         document_responses = [
@@ -322,11 +527,15 @@ async def add_document(request: AddDocumentRequest):
 
 
 @app.post("/add-documents")
-async def add_documents(request: AddDocumentsRequest):
+async def add_documents(request: AddDocumentsRequest, background_tasks: BackgroundTasks):
     """여러 문서를 추가합니다.
 
+    IVFFlat 인덱스를 사용하고 VECTOR_REINDEX_MIN_DOCS개 이상을 한 번에 추가하면
+    리스트 중심을 다시 학습하도록 백그라운드에서 인덱스를 재구축합니다.
+
     Args:
         request: 문서 추가 요청.
+        background_tasks: 인덱스 재구축을 예약할 백그라운드 작업.
 
     Returns:
         추가 결과.
@@ -340,67 +549,118 @@ async def add_documents(request: AddDocumentsRequest):
             {"content": doc.content, "metadata": doc.metadata or {}}
             for doc in request.documents
         ]
-        return add_docs_service(documents)
+        result = add_docs_service(documents)
+        if _get_vector_index_method() == "ivfflat" and len(documents) >= int(
+            os.getenv("VECTOR_REINDEX_MIN_DOCS", "10000")
+        ):
+            background_tasks.add_task(_reindex_vector_index)
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/admin/vector-index")
+async def get_vector_index():
+    """컬렉션의 ANN 인덱스 상태를 반환합니다."""
+    try:
+        manager = _get_rag_service().get_vector_index_manager()
+        return {"indexes": await asyncio.to_thread(manager.status)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/reset-collection")
-async def reset_collection():
-    """벡터 컬렉션을 초기화합니다.
+@app.post("/admin/vector-index")
+async def create_vector_index(request: VectorIndexRequest):
+    """컬렉션의 ANN 인덱스를 생성합니다 (다른 종류의 인덱스가 있으면 교체).
 
-    주의: 이 작업은 모든 저장된 문서를 삭제합니다.
+    Args:
+        request: 인덱스 생성 요청.
 
     Returns:
-        초기화 결과.
+        인덱스 정보.
     """
     try:
-        # Neon DB 또는 기타 PostgreSQL 연결 문자열 사용
-        connection_string = os.getenv("POSTGRES_CONNECTION_STRING")
-
-        if not connection_string:
-            # 기본값으로 개별 환경 변수에서 조합 (하위 호환성)
-            db_host = os.getenv("POSTGRES_HOST", "postgres")
-            db_port = os.getenv("POSTGRES_PORT", "5432")
-            db_user = os.getenv("POSTGRES_USER", "langchain")
-            db_password = os.getenv("POSTGRES_PASSWORD", "langchain")
-            db_name = os.getenv("POSTGRES_DB", "langchain")
-            connection_string = (
-                f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-            )
+        manager = _get_rag_service().get_vector_index_manager()
+        return await asyncio.to_thread(
+            manager.ensure_index,
+            method=request.method,
+            m=request.m,
+            ef_construction=request.ef_construction,
+            lists=request.lists,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # PostgreSQL 연결
-        conn = psycopg2.connect(connection_string)
-        conn.autocommit = True
-        cursor = conn.cursor()
 
-        # langchain_pg_embedding 테이블의 모든 데이터 삭제
-        cursor.execute("DELETE FROM langchain_pg_embedding;")
-        deleted_count = cursor.rowcount
+@app.post("/admin/vector-index/reindex")
+async def reindex_vector_index():
+    """대량 인제스트 후 컬렉션의 ANN 인덱스를 재구축합니다."""
+    try:
+        manager = _get_rag_service().get_vector_index_manager()
+        return {"reindexed": await asyncio.to_thread(manager.reindex)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 
-        # langchain_pg_collection 테이블의 모든 데이터 삭제
-        cursor.execute("DELETE FROM langchain_pg_collection;")
-        collection_count = cursor.rowcount
 
-        cursor.close()
-        conn.close()
 
-        # 전역 변수 초기화
-        global _vector_store
-        _vector_store = None
+@app.post("/reset-collection")
+async def reset_collection(
+    background_tasks: BackgroundTasks, collection_name: str = "langchain"
+):
+    """벡터 컬렉션을 초기화합니다.
+
+    주의: 이 작업은 해당 컬렉션에 저장된 모든 문서를 삭제합니다.
+    다른 컬렉션의 문서는 유지되며, 컬렉션이 하나뿐이면 TRUNCATE로 즉시 비웁니다.
+    정리(VACUUM/REINDEX)와 ANN 인덱스 재생성은 응답 후 백그라운드에서 실행합니다.
+
+    Args:
+        background_tasks: 정리 작업을 예약할 백그라운드 작업.
+        collection_name: 초기화할 컬렉션 이름.
+
+    Returns:
+        초기화 결과.
+    """
+    try:
+        manager = _get_rag_service().get_vector_index_manager(collection_name)
+        result = await asyncio.to_thread(manager.reset_collection)
+        background_tasks.add_task(_vacuum_collection, collection_name)
 
         return {
             "message": "컬렉션이 성공적으로 초기화되었습니다.",
             "status": "success",
-            "deleted_embeddings": deleted_count,
-            "deleted_collections": collection_count,
+            "collection": collection_name,
+            **result,
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"컬렉션 초기화 실패: {str(e)}")
 
 
+@app.post("/delete-documents")
+async def delete_documents(request: DeleteDocumentsRequest, background_tasks: BackgroundTasks):
+    """메타데이터 필터와 일치하는 문서를 배치로 삭제합니다.
+
+    Args:
+        request: 문서 삭제 요청.
+        background_tasks: 정리 작업을 예약할 백그라운드 작업.
+
+    Returns:
+        삭제 결과.
+    """
+    try:
+        manager = _get_rag_service().get_vector_index_manager(request.collection_name)
+        deleted = await asyncio.to_thread(manager.delete_by_metadata, request.metadata_filter)
+        if deleted >= int(os.getenv("VECTOR_VACUUM_MIN_DOCS", "10000")):
+            background_tasks.add_task(_vacuum_collection, request.collection_name)
+        return {"status": "success", "deleted_embeddings": deleted}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -35,11 +35,11 @@ def wait_for_postgres(connection_string: str, max_retries: int = 30) -> None:
     raise Exception("PostgreSQL 연결 실패: 최대 재시도 횟수 초과")
 
 
-def get_vector_store():
-    """벡터 스토어를 생성하고 반환합니다.
+def get_connection_string() -> str:
+    """PostgreSQL 연결 문자열을 반환합니다.
 
     Returns:
-        PGVector 벡터 스토어 인스턴스.
+        POSTGRES_CONNECTION_STRING 환경 변수 값. 없으면 개별 환경 변수에서 조합한 값.
     """
     # Neon DB 또는 기타 PostgreSQL 연결 문자열 사용
     connection_string = os.getenv("POSTGRES_CONNECTION_STRING")
@@ -54,7 +54,18 @@ def get_vector_store():
         connection_string = (
             f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
         )
+    return connection_string
 
+
+def get_embeddings() -> OpenAIEmbeddings:
+    """문서/쿼리 임베딩 모델을 생성합니다.
+
+    Returns:
+        OpenAIEmbeddings 인스턴스.
+
+    Raises:
+        ValueError: OPENAI_API_KEY 환경 변수가 설정되지 않은 경우.
+    """
     # OpenAI Embeddings 사용
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
@@ -63,14 +74,28 @@ def get_vector_store():
             "환경 변수를 설정하거나 .env 파일에 추가하세요."
         )
 
-    embeddings = OpenAIEmbeddings(
+    return OpenAIEmbeddings(
         model="text-embedding-3-small",
         openai_api_key=api_key,
     )
 
+
+def get_embedding_dimensions() -> int:
+    """임베딩 차원을 반환합니다 (text-embedding-3-small 기본값 1536)."""
+    return int(os.getenv("EMBEDDING_DIMENSIONS", "1536"))
+
+
+def get_vector_store():
+    """벡터 스토어를 생성하고 반환합니다.
+
+    Returns:
+        PGVector 벡터 스토어 인스턴스.
+    """
     vector_store = PGVector(
-        embeddings,
-        connection=connection_string,
+        get_embeddings(),
+        connection=get_connection_string(),
+        # 고정 차원 vector(n) 컬럼이어야 HNSW/IVFFlat 인덱스를 만들 수 있음
+        embedding_length=get_embedding_dimensions(),
     )
     return vector_store
 
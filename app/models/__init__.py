@@ -1,7 +1,10 @@
 """LLM 모델 주입을 위한 모듈."""
 
 from .llm_provider import LLMProvider, get_llm, get_llm_provider, set_llm_provider
+from .midm_batch_scheduler import MidmBatchScheduler, MidmGeneration
 from .midm_chat_model import ChatMidm, load_midm_model
+from .midm_model_registry import MidmModelRegistry, get_midm_model_registry
+from .midm_prefix_cache import MidmPrefixCache
 
 __all__ = [
     "LLMProvider",
@@ -10,5 +13,10 @@ __all__ = [
     "set_llm_provider",
     "ChatMidm",
     "load_midm_model",
+    "MidmModelRegistry",
+    "get_midm_model_registry",
+    "MidmBatchScheduler",
+    "MidmGeneration",
+    "MidmPrefixCache",
 ]
 
@@ -0,0 +1,313 @@
+"""Mi:dm 모델을 위한 동적 배칭 스케줄러.
+
+여러 스레드/코루틴에서 동시에 들어온 생성 요청을 큐에 모았다가
+하나의 `model.generate` 호출로 묶어서 처리합니다.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from transformers import AutoModelForCausalLM, AutoTokenizer
+
+    from .midm_prefix_cache import MidmPrefixCache
+
+
+@dataclass(frozen=True)
+class MidmGeneration:
+    """배치 스케줄러가 반환하는 단일 요청의 생성 결과."""
+
+    text: str
+    """디코딩된 생성 텍스트."""
+    input_tokens: int
+    """패딩을 제외한 입력 토큰 수."""
+    output_tokens: int
+    """생성된 토큰 수 (EOS 포함)."""
+
+
+@dataclass
+class _BatchRequest:
+    """큐에 대기 중인 생성 요청."""
+
+    prompt: str
+    max_new_tokens: int
+    sampling: tuple[tuple[str, Any], ...]
+    future: Future = field(default_factory=Future)
+
+
+_STOP = object()
+
+
+class MidmBatchScheduler:
+    """동시 요청을 하나의 `generate` 호출로 묶는 동적 배칭 스케줄러.
+
+    전용 워커 스레드가 큐에서 첫 요청을 꺼낸 뒤 `max_wait_ms` 동안
+    최대 `max_batch_size`개까지 요청을 더 모아 한 번에 생성합니다.
+    샘플링 파라미터(temperature, top_p 등)가 같은 요청끼리만 묶이며,
+    `max_new_tokens`는 요청별로 다를 수 있습니다.
+
+    토크나이저와 모델은 워커 스레드에서만 사용되므로 여러 스레드가
+    같은 모델을 두고 경쟁하지 않습니다. 프리픽스 캐시가 주어지면
+    요청이 하나뿐인 배치는 캐시된 프리픽스 KV를 이어서 생성합니다.
+
+    Example:
+        ```python
+        scheduler = MidmBatchScheduler(model, tokenizer, max_batch_size=8)
+        future = scheduler.submit("안녕하세요", max_new_tokens=64)
+        print(future.result().text)
+        ```
+    """
+
+    def __init__(
+        self,
+        model: "AutoModelForCausalLM",
+        tokenizer: "AutoTokenizer",
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+        prefix_cache: Optional["MidmPrefixCache"] = None,
+    ) -> None:
+        """배치 스케줄러를 초기화합니다.
+
+        Args:
+            model: 로드된 Mi:dm 모델.
+            tokenizer: 모델의 토크나이저. 배치 입력을 위해 왼쪽 패딩으로 설정됩니다.
+            max_batch_size: 한 번의 `generate` 호출에 묶을 최대 요청 수.
+            max_wait_ms: 첫 요청 이후 추가 요청을 기다리는 최대 시간 (밀리초).
+            prefix_cache: 단일 요청 배치에 사용할 프리픽스 KV 캐시.
+
+        Raises:
+            ValueError: `max_batch_size`가 1 미만이거나 `max_wait_ms`가 음수인 경우.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size는 1 이상이어야 합니다: {max_batch_size}")
+        if max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms는 0 이상이어야 합니다: {max_wait_ms}")
+
+        self._model = model
+        self._tokenizer = tokenizer
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._prefix_cache = prefix_cache
+
+        eos_token_id = getattr(
+            getattr(model, "generation_config", None), "eos_token_id", None
+        )
+        if eos_token_id is None:
+            eos_token_id = tokenizer.eos_token_id
+        if isinstance(eos_token_id, int):
+            eos_token_id = [eos_token_id]
+        self._eos_token_ids = set(eos_token_id or [])
+        # 토크나이저는 레지스트리의 다른 사용자(채팅 라우터, 프리픽스 캐시)와
+        # 공유되므로 padding_side/pad_token을 바꾸지 않고 직접 왼쪽 패딩합니다
+        self._pad_token_id = tokenizer.pad_token_id
+        if self._pad_token_id is None:
+            self._pad_token_id = tokenizer.eos_token_id
+
+        self._queue: queue.Queue = queue.Queue()
+        self._pending: deque[_BatchRequest] = deque()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        self._batch_count = 0
+        self._request_count = 0
+
+    def submit(
+        self,
+        prompt: str,
+        max_new_tokens: int,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        top_k: int = 50,
+        do_sample: bool = True,
+    ) -> "Future[MidmGeneration]":
+        """생성 요청을 큐에 추가합니다.
+
+        Args:
+            prompt: chat template이 적용된 프롬프트 문자열.
+            max_new_tokens: 이 요청의 최대 생성 토큰 수.
+            temperature: 생성 온도.
+            top_p: Nucleus sampling의 top_p 값.
+            top_k: Top-k sampling의 k 값.
+            do_sample: 샘플링 사용 여부.
+
+        Returns:
+            생성이 끝나면 `MidmGeneration`으로 완료되는 Future.
+
+        Raises:
+            RuntimeError: 스케줄러가 이미 종료된 경우.
+        """
+        request = _BatchRequest(
+            prompt=prompt,
+            max_new_tokens=max_new_tokens,
+            sampling=(
+                ("temperature", temperature),
+                ("top_p", top_p),
+                ("top_k", top_k),
+                ("do_sample", do_sample),
+            ),
+        )
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("배치 스케줄러가 종료되었습니다.")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="midm-batch-scheduler", daemon=True
+                )
+                self._thread.start()
+            self._queue.put(request)
+        return request.future
+
+    def close(self) -> None:
+        """워커 스레드를 종료합니다. 이미 큐에 들어온 요청은 처리됩니다."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            self._queue.put(_STOP)
+        if thread is not None:
+            thread.join()
+
+    def stats(self) -> dict[str, float]:
+        """처리한 배치 수, 요청 수, 평균 배치 크기를 반환합니다."""
+        return {
+            "batches": self._batch_count,
+            "requests": self._request_count,
+            "average_batch_size": (
+                self._request_count / self._batch_count if self._batch_count else 0.0
+            ),
+        }
+
+    def _run(self) -> None:
+        """워커 스레드 루프: 배치를 모아 생성합니다."""
+        stopping = False
+        while not stopping or self._pending:
+            batch, stopping = self._collect_batch(stopping)
+            if batch:
+                self._process(batch)
+
+    def _collect_batch(self, stopping: bool) -> tuple[list[_BatchRequest], bool]:
+        """샘플링 파라미터가 같은 요청을 최대 `max_batch_size`개까지 모읍니다."""
+        if self._pending:
+            first = self._pending.popleft()
+        elif stopping:
+            return [], stopping
+        else:
+            item = self._queue.get()
+            if item is _STOP:
+                return [], True
+            first = item
+
+        batch = [first]
+
+        # 이전 라운드에서 파라미터가 달라 보류된 요청 중 호환되는 것 먼저 포함
+        remaining: deque[_BatchRequest] = deque()
+        while self._pending:
+            request = self._pending.popleft()
+            if len(batch) < self.max_batch_size and request.sampling == first.sampling:
+                batch.append(request)
+            else:
+                remaining.append(request)
+        self._pending = remaining
+
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while not stopping and len(batch) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                item = (
+                    self._queue.get(timeout=timeout)
+                    if timeout > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if item is _STOP:
+                stopping = True
+            elif item.sampling == first.sampling:
+                batch.append(item)
+            else:
+                self._pending.append(item)
+
+        return batch, stopping
+
+    def _encode_left_padded(self, prompts: list[str]) -> tuple[Any, Any]:
+        """프롬프트들을 토큰화하고 왼쪽 패딩한 (input_ids, attention_mask)를 만듭니다.
+
+        배치 생성은 왼쪽 패딩이어야 모든 요청의 생성 위치가 정렬됩니다.
+        """
+        import torch
+
+        token_ids = self._tokenizer(prompts)["input_ids"]
+        max_length = max(len(ids) for ids in token_ids)
+        input_ids = torch.full(
+            (len(token_ids), max_length), self._pad_token_id, dtype=torch.long
+        )
+        attention_mask = torch.zeros((len(token_ids), max_length), dtype=torch.long)
+        for i, ids in enumerate(token_ids):
+            if ids:
+                input_ids[i, max_length - len(ids) :] = torch.tensor(ids)
+                attention_mask[i, max_length - len(ids) :] = 1
+        return input_ids, attention_mask
+
+    def _process(self, batch: list[_BatchRequest]) -> None:
+        """요청 배치를 하나의 `generate` 호출로 처리합니다."""
+        try:
+            import torch
+
+            input_ids, attention_mask = self._encode_left_padded(
+                [request.prompt for request in batch]
+            )
+            input_ids = input_ids.to(self._model.device)
+            attention_mask = attention_mask.to(self._model.device)
+
+            generation_kwargs = {
+                "attention_mask": attention_mask,
+                "max_new_tokens": max(request.max_new_tokens for request in batch),
+                "pad_token_id": self._pad_token_id,
+                **dict(batch[0].sampling),
+            }
+            # 패딩된 배치는 프리픽스 위치가 어긋나므로 단일 요청에만 캐시 사용
+            if self._prefix_cache is not None and len(batch) == 1:
+                outputs = self._prefix_cache.generate(
+                    self._model, input_ids, **generation_kwargs
+                )
+            else:
+                with torch.inference_mode():
+                    outputs = self._model.generate(input_ids, **generation_kwargs)
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        self._batch_count += 1
+        self._request_count += len(batch)
+
+        prompt_length = input_ids.shape[1]
+        for i, request in enumerate(batch):
+            try:
+                generated = outputs[i][
+                    prompt_length : prompt_length + request.max_new_tokens
+                ].tolist()
+                # 요청별로 첫 EOS까지만 사용 (이후는 다른 요청 때문에 생성된 패딩)
+                for position, token_id in enumerate(generated):
+                    if token_id in self._eos_token_ids:
+                        generated = generated[: position + 1]
+                        break
+                text = self._tokenizer.decode(generated, skip_special_tokens=True)
+                request.future.set_result(
+                    MidmGeneration(
+                        text=text,
+                        input_tokens=int(attention_mask[i].sum()),
+                        output_tokens=len(generated),
+                    )
+                )
+            except Exception as e:
+                request.future.set_exception(e)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -12,8 +14,15 @@ from langchain_core.outputs import ChatGeneration, ChatResult
 from pydantic import Field, PrivateAttr
 from typing_extensions import override
 
+from .midm_batch_scheduler import MidmBatchScheduler, MidmGeneration
+from .midm_model_registry import get_midm_model_registry
+from .midm_prefix_cache import MidmPrefixCache
+
 if TYPE_CHECKING:
-    from langchain_core.callbacks import CallbackManagerForLLMRun
+    from langchain_core.callbacks import (
+        AsyncCallbackManagerForLLMRun,
+        CallbackManagerForLLMRun,
+    )
 
     from transformers import AutoModelForCausalLM, AutoTokenizer
 
@@ -23,14 +32,20 @@ def load_midm_model(
     torch_dtype: str = "auto",
     device_map: str = "auto",
     trust_remote_code: bool = True,
+    use_safetensors: Optional[bool] = None,
 ) -> tuple["AutoModelForCausalLM", "AutoTokenizer"]:
     """Mi:dm 모델과 토크나이저를 로드합니다.
 
+    같은 모델을 여러 곳에서 사용할 때는 이 함수를 직접 호출하지 말고
+    `get_midm_model_registry().load()`로 공유 인스턴스를 사용하세요.
+
     Args:
         model_path: 로컬 모델 경로. None인 경우 기본 경로 (app/models/midm/) 사용.
         torch_dtype: PyTorch 데이터 타입. "auto", "float16", "float32", "bfloat16" 등.
         device_map: 디바이스 매핑. "auto", "cpu", "cuda:0" 등.
         trust_remote_code: 원격 코드 실행 허용 여부. Mi:dm 모델은 필수입니다.
+        use_safetensors: safetensors 가중치 사용 여부. safetensors 파일은 메모리 맵(mmap)으로
+            읽어 CPU 메모리에 전체 복사본을 만들지 않습니다. None이면 파일이 있을 때 사용.
 
     Returns:
         (모델, 토크나이저) 튜플.
@@ -67,6 +82,8 @@ def load_midm_model(
             torch_dtype=dtype,
             device_map=device_map,
             trust_remote_code=trust_remote_code,
+            use_safetensors=use_safetensors,
+            low_cpu_mem_usage=True,
         )
 
         # 토크나이저 로드
@@ -130,10 +147,22 @@ class ChatMidm(BaseChatModel):
     """디바이스 매핑."""
     trust_remote_code: bool = Field(default=True, description="원격 코드 신뢰 여부")
     """원격 코드 신뢰 여부. Mi:dm 모델은 필수입니다."""
+    max_batch_size: int = Field(default=1, description="동적 배칭 최대 요청 수")
+    """동시 요청을 하나의 `generate` 호출로 묶을 최대 개수. 1이면 배칭하지 않습니다."""
+    max_batch_wait_ms: float = Field(default=10.0, description="배치 대기 시간 (ms)")
+    """첫 요청 이후 추가 요청을 기다리는 최대 시간 (밀리초)."""
+    prefix_cache_mb: float = Field(default=0.0, description="프리픽스 KV 캐시 메모리 (MB)")
+    """공통 프롬프트 프리픽스의 KV 캐시 최대 메모리 (MB). 0이면 사용하지 않습니다."""
+    use_safetensors: Optional[bool] = Field(default=None, description="safetensors 사용 여부")
+    """safetensors 가중치를 메모리 맵으로 로드할지 여부. None이면 파일이 있을 때 사용."""
 
     # 내부 모델과 토크나이저 (런타임에 로드됨) - PrivateAttr 사용
     _model: Optional["AutoModelForCausalLM"] = PrivateAttr(default=None)
     _tokenizer: Optional["AutoTokenizer"] = PrivateAttr(default=None)
+    _scheduler: Optional[MidmBatchScheduler] = PrivateAttr(default=None)
+    _prefix_cache: Optional[MidmPrefixCache] = PrivateAttr(default=None)
+    # 동시 요청이 배치 스케줄러를 중복 생성하지 않도록 직렬화
+    _load_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
     def __init__(self, **kwargs: Any) -> None:
         """ChatMidm 인스턴스를 초기화합니다.
@@ -142,49 +171,63 @@ class ChatMidm(BaseChatModel):
             **kwargs: ChatMidm 필드 값들.
         """
         super().__init__(**kwargs)
-        # 모델은 지연 로딩됩니다 (첫 호출 시 로드)
+        if self.prefix_cache_mb > 0:
+            self._prefix_cache = MidmPrefixCache(max_memory_mb=self.prefix_cache_mb)
+        # 모델은 첫 호출 또는 warmup() 시 공유 레지스트리에서 로드됩니다
+
+    def _get_loader_kwargs(self) -> dict[str, Any]:
+        """모델 레지스트리에 전달할 로딩 옵션을 반환합니다."""
+        return {
+            "model_path": self.model_path,
+            "torch_dtype": self.torch_dtype,
+            "device_map": self.device_map,
+            "trust_remote_code": self.trust_remote_code,
+            "use_safetensors": self.use_safetensors,
+        }
 
     def _load_model(self) -> None:
-        """모델과 토크나이저를 로드합니다."""
+        """공유 레지스트리에서 모델과 토크나이저를 가져옵니다.
+
+        같은 설정의 모델은 프로세스당 한 번만 로드되어 채팅 라우터 등과 공유됩니다.
+        """
         if self._model is None or self._tokenizer is None:
-            self._model, self._tokenizer = load_midm_model(
-                model_path=self.model_path,
-                torch_dtype=self.torch_dtype,
-                device_map=self.device_map,
-                trust_remote_code=self.trust_remote_code,
+            self._model, self._tokenizer = get_midm_model_registry().load(
+                **self._get_loader_kwargs()
             )
 
-    @override
-    def _generate(
-        self,
-        messages: list[BaseMessage],
-        stop: Optional[list[str]] = None,
-        run_manager: Optional["CallbackManagerForLLMRun"] = None,
-        **kwargs: Any,
-    ) -> ChatResult:
-        """메시지로부터 응답을 생성합니다.
+    def warmup(self) -> None:
+        """모델을 로드하고 짧은 생성을 실행해 첫 요청의 지연을 없앱니다.
 
-        Args:
-            messages: 입력 메시지 리스트.
-            stop: 생성 중단 문자열 리스트.
-            run_manager: 콜백 매니저.
-            **kwargs: 추가 키워드 인자.
+        서버 시작 시 호출하며, 완료되면 레지스트리의 모델 상태가 `ready`가 됩니다.
 
-        Returns:
-            ChatResult 객체.
+        Raises:
+            Exception: 모델 로딩 또는 워밍업 생성 중 오류가 발생한 경우.
         """
-        # 모델 로드 (지연 로딩)
+        get_midm_model_registry().warmup(**self._get_loader_kwargs())
         self._load_model()
-
-        # 메시지를 텍스트 프롬프트로 변환
-        prompt = self._format_messages_to_prompt(messages)
-
-        # 토크나이징
-        inputs = self._tokenizer.encode(prompt, return_tensors="pt")
-        input_ids = inputs.to(self._model.device)
-
-        # 생성 파라미터
-        generation_kwargs = {
+        # 배칭을 사용하면 워커 스레드도 미리 띄워 둡니다
+        self._get_scheduler()
+
+    def _get_scheduler(self) -> Optional[MidmBatchScheduler]:
+        """배칭이 활성화된 경우 배치 스케줄러를 반환합니다 (지연 생성)."""
+        if self.max_batch_size <= 1:
+            return None
+        if self._scheduler is None:
+            self._load_model()
+            with self._load_lock:
+                if self._scheduler is None:
+                    self._scheduler = MidmBatchScheduler(
+                        self._model,
+                        self._tokenizer,
+                        max_batch_size=self.max_batch_size,
+                        max_wait_ms=self.max_batch_wait_ms,
+                        prefix_cache=self._prefix_cache,
+                    )
+        return self._scheduler
+
+    def _get_generation_kwargs(self, **kwargs: Any) -> dict[str, Any]:
+        """호출 인자와 필드 기본값으로 생성 파라미터를 구성합니다."""
+        return {
             "temperature": kwargs.get("temperature", self.temperature),
             "max_new_tokens": kwargs.get("max_tokens", self.max_tokens),
             "top_p": kwargs.get("top_p", self.top_p),
@@ -192,11 +235,24 @@ class ChatMidm(BaseChatModel):
             "do_sample": kwargs.get("do_sample", self.do_sample),
         }
 
-        # 생성
-        outputs = self._model.generate(
-            input_ids,
-            **generation_kwargs,
-        )
+    def _generate_single(
+        self, prompt: str, generation_kwargs: dict[str, Any]
+    ) -> MidmGeneration:
+        """배칭 없이 단일 프롬프트로 응답을 생성합니다."""
+        # 토크나이징
+        inputs = self._tokenizer.encode(prompt, return_tensors="pt")
+        input_ids = inputs.to(self._model.device)
+
+        # 생성 (프리픽스 캐시가 있으면 캐시된 공통 프리픽스 이후부터 prefill)
+        if self._prefix_cache is not None:
+            outputs = self._prefix_cache.generate(
+                self._model, input_ids, **generation_kwargs
+            )
+        else:
+            outputs = self._model.generate(
+                input_ids,
+                **generation_kwargs,
+            )
 
         # 디코딩
         generated_text = self._tokenizer.decode(
@@ -204,16 +260,28 @@ class ChatMidm(BaseChatModel):
             skip_special_tokens=True
         )
 
+        # 토큰 수 계산 (근사치)
+        return MidmGeneration(
+            text=generated_text,
+            input_tokens=input_ids.shape[1],
+            output_tokens=outputs[0].shape[0] - input_ids.shape[1],
+        )
+
+    def _create_chat_result(
+        self,
+        generation: MidmGeneration,
+        generation_kwargs: dict[str, Any],
+        stop: Optional[list[str]] = None,
+    ) -> ChatResult:
+        """생성 결과를 ChatResult로 변환합니다."""
+        generated_text = generation.text
+
         # Stop 문자열로 자르기
         if stop:
             for stop_str in stop:
                 if stop_str in generated_text:
                     generated_text = generated_text.split(stop_str)[0]
 
-        # 토큰 수 계산 (근사치)
-        input_token_count = input_ids.shape[1]
-        output_token_count = outputs[0].shape[0] - input_ids.shape[1]
-
         # AIMessage 생성
         message = AIMessage(
             content=generated_text.strip(),
@@ -222,14 +290,85 @@ class ChatMidm(BaseChatModel):
                 "temperature": generation_kwargs["temperature"],
             },
             usage_metadata=UsageMetadata(
-                input_tokens=input_token_count,
-                output_tokens=output_token_count,
-                total_tokens=input_token_count + output_token_count,
+                input_tokens=generation.input_tokens,
+                output_tokens=generation.output_tokens,
+                total_tokens=generation.input_tokens + generation.output_tokens,
             ),
         )
 
-        generation = ChatGeneration(message=message)
-        return ChatResult(generations=[generation])
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @override
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional["CallbackManagerForLLMRun"] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """메시지로부터 응답을 생성합니다.
+
+        배칭이 활성화된 경우 동시에 들어온 다른 요청과 함께 처리됩니다.
+
+        Args:
+            messages: 입력 메시지 리스트.
+            stop: 생성 중단 문자열 리스트.
+            run_manager: 콜백 매니저.
+            **kwargs: 추가 키워드 인자.
+
+        Returns:
+            ChatResult 객체.
+        """
+        # 모델 로드 (지연 로딩)
+        self._load_model()
+
+        # 메시지를 텍스트 프롬프트로 변환
+        prompt = self._format_messages_to_prompt(messages)
+        generation_kwargs = self._get_generation_kwargs(**kwargs)
+
+        scheduler = self._get_scheduler()
+        if scheduler is not None:
+            generation = scheduler.submit(prompt, **generation_kwargs).result()
+        else:
+            generation = self._generate_single(prompt, generation_kwargs)
+
+        return self._create_chat_result(generation, generation_kwargs, stop)
+
+    @override
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional["AsyncCallbackManagerForLLMRun"] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """메시지로부터 비동기로 응답을 생성합니다.
+
+        배칭이 활성화된 경우 이벤트 루프를 막지 않고 배치 스케줄러의 결과를
+        기다리므로, 동시에 들어온 요청들이 하나의 `generate` 호출로 묶입니다.
+
+        Args:
+            messages: 입력 메시지 리스트.
+            stop: 생성 중단 문자열 리스트.
+            run_manager: 콜백 매니저.
+            **kwargs: 추가 키워드 인자.
+
+        Returns:
+            ChatResult 객체.
+        """
+        if self.max_batch_size <= 1:
+            return await super()._agenerate(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            )
+
+        # 모델 로드는 블로킹 작업이므로 스레드에서 실행
+        scheduler = await asyncio.to_thread(self._get_scheduler)
+        prompt = self._format_messages_to_prompt(messages)
+        generation_kwargs = self._get_generation_kwargs(**kwargs)
+        generation = await asyncio.wrap_future(
+            scheduler.submit(prompt, **generation_kwargs)
+        )
+        return self._create_chat_result(generation, generation_kwargs, stop)
 
     def _format_messages_to_prompt(self, messages: list[BaseMessage]) -> str:
         """LangChain 메시지를 Mi:dm 프롬프트 형식으로 변환합니다.
@@ -0,0 +1,217 @@
+"""Mi:dm 모델 공유 레지스트리.
+
+같은 설정의 Mi:dm 모델은 프로세스당 한 번만 로드하여 ChatMidm과
+채팅 라우터가 같은 가중치를 공유하도록 하고, 로딩/워밍업 시간과
+준비 상태를 기록합니다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from transformers import AutoModelForCausalLM, AutoTokenizer
+
+
+@dataclass
+class _ModelEntry:
+    """레지스트리에 등록된 모델 하나의 상태."""
+
+    model_path: str
+    status: str = "loading"
+    model: Optional["AutoModelForCausalLM"] = None
+    tokenizer: Optional["AutoTokenizer"] = None
+    load_seconds: Optional[float] = None
+    warmup_seconds: Optional[float] = None
+    error: Optional[str] = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class MidmModelRegistry:
+    """Mi:dm 모델을 설정별로 한 번만 로드해 공유하는 레지스트리.
+
+    모델 상태는 `loading`(로딩 중), `loaded`(로딩 완료, 워밍업 전),
+    `ready`(워밍업 완료), `failed`(로딩 또는 워밍업 실패) 중 하나입니다.
+
+    Example:
+        ```python
+        registry = get_midm_model_registry()
+        registry.warmup(model_path="/models/midm")
+        model, tokenizer = registry.load(model_path="/models/midm")
+        print(registry.metrics())
+        ```
+    """
+
+    def __init__(self) -> None:
+        """빈 레지스트리를 생성합니다."""
+        self._entries: dict[tuple[Any, ...], _ModelEntry] = {}
+        self._lock = threading.Lock()
+
+    def load(
+        self,
+        model_path: Optional[str] = None,
+        torch_dtype: str = "auto",
+        device_map: str = "auto",
+        trust_remote_code: bool = True,
+        use_safetensors: Optional[bool] = None,
+    ) -> tuple["AutoModelForCausalLM", "AutoTokenizer"]:
+        """모델과 토크나이저를 반환합니다. 처음 요청될 때만 로드합니다.
+
+        동시에 같은 모델을 요청하면 한 스레드만 로드하고 나머지는 기다립니다.
+
+        Args:
+            model_path: 로컬 모델 경로. None인 경우 기본 경로 (app/models/midm/) 사용.
+            torch_dtype: PyTorch 데이터 타입.
+            device_map: 디바이스 매핑.
+            trust_remote_code: 원격 코드 실행 허용 여부.
+            use_safetensors: safetensors 가중치 사용 여부. safetensors 파일은
+                메모리 맵(mmap)으로 로드됩니다. None이면 transformers 기본 동작.
+
+        Returns:
+            (모델, 토크나이저) 튜플.
+
+        Raises:
+            Exception: 모델 로딩 중 오류가 발생한 경우.
+        """
+        # midm_chat_model이 이 모듈을 import 하므로 순환 import를 피해 지연 import
+        from .midm_chat_model import load_midm_model
+
+        if model_path is None:
+            model_path = str(Path(__file__).parent / "midm")
+        entry = self._get_entry(
+            model_path, torch_dtype, device_map, trust_remote_code, use_safetensors
+        )
+
+        with entry.lock:
+            if entry.model is None or entry.tokenizer is None:
+                entry.status = "loading"
+                entry.error = None
+                start = time.perf_counter()
+                try:
+                    entry.model, entry.tokenizer = load_midm_model(
+                        model_path=model_path,
+                        torch_dtype=torch_dtype,
+                        device_map=device_map,
+                        trust_remote_code=trust_remote_code,
+                        use_safetensors=use_safetensors,
+                    )
+                except Exception as e:
+                    entry.status = "failed"
+                    entry.error = str(e)
+                    raise
+                entry.load_seconds = time.perf_counter() - start
+                entry.status = "loaded"
+            return entry.model, entry.tokenizer
+
+    def warmup(
+        self,
+        model_path: Optional[str] = None,
+        torch_dtype: str = "auto",
+        device_map: str = "auto",
+        trust_remote_code: bool = True,
+        use_safetensors: Optional[bool] = None,
+        prompt: str = "안녕하세요",
+        max_new_tokens: int = 1,
+    ) -> None:
+        """모델을 로드하고 짧은 생성을 한 번 실행해 준비 상태로 만듭니다.
+
+        첫 사용자 요청이 커널 초기화, 메모리 할당 등의 비용을 치르지 않도록
+        서버 시작 시 호출합니다.
+
+        Args:
+            model_path: 로컬 모델 경로. None인 경우 기본 경로 사용.
+            torch_dtype: PyTorch 데이터 타입.
+            device_map: 디바이스 매핑.
+            trust_remote_code: 원격 코드 실행 허용 여부.
+            use_safetensors: safetensors 가중치 사용 여부.
+            prompt: 워밍업에 사용할 프롬프트.
+            max_new_tokens: 워밍업 생성 토큰 수.
+
+        Raises:
+            Exception: 모델 로딩 또는 워밍업 생성 중 오류가 발생한 경우.
+        """
+        import torch
+
+        model, tokenizer = self.load(
+            model_path=model_path,
+            torch_dtype=torch_dtype,
+            device_map=device_map,
+            trust_remote_code=trust_remote_code,
+            use_safetensors=use_safetensors,
+        )
+        if model_path is None:
+            model_path = str(Path(__file__).parent / "midm")
+        entry = self._get_entry(
+            model_path, torch_dtype, device_map, trust_remote_code, use_safetensors
+        )
+
+        start = time.perf_counter()
+        try:
+            input_ids = tokenizer.encode(prompt, return_tensors="pt").to(model.device)
+            with torch.inference_mode():
+                model.generate(
+                    input_ids,
+                    attention_mask=torch.ones_like(input_ids),
+                    max_new_tokens=max_new_tokens,
+                    do_sample=False,
+                    pad_token_id=tokenizer.pad_token_id or tokenizer.eos_token_id,
+                )
+        except Exception as e:
+            entry.status = "failed"
+            entry.error = f"워밍업 실패: {e}"
+            raise
+        entry.warmup_seconds = time.perf_counter() - start
+        entry.status = "ready"
+
+    def _get_entry(self, model_path: str, *loader_options: Any) -> _ModelEntry:
+        """모델 경로와 로딩 옵션에 해당하는 항목을 가져오거나 생성합니다."""
+        key = (model_path, *loader_options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _ModelEntry(model_path=model_path)
+                self._entries[key] = entry
+            return entry
+
+    def is_ready(self) -> bool:
+        """등록된 모델이 하나 이상 있고 모두 워밍업을 마쳤는지 반환합니다."""
+        with self._lock:
+            entries = list(self._entries.values())
+        return bool(entries) and all(entry.status == "ready" for entry in entries)
+
+    def metrics(self) -> list[dict[str, Any]]:
+        """모델별 상태, 로딩 시간, 워밍업 시간을 반환합니다."""
+        with self._lock:
+            entries = list(self._entries.values())
+        return [
+            {
+                "model_path": entry.model_path,
+                "status": entry.status,
+                "load_seconds": entry.load_seconds,
+                "warmup_seconds": entry.warmup_seconds,
+                "error": entry.error,
+            }
+            for entry in entries
+        ]
+
+
+# 전역 모델 레지스트리 인스턴스
+_midm_model_registry: Optional[MidmModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_midm_model_registry() -> MidmModelRegistry:
+    """전역 Mi:dm 모델 레지스트리를 가져옵니다.
+
+    Returns:
+        모델 레지스트리 인스턴스.
+    """
+    global _midm_model_registry
+    with _registry_lock:
+        if _midm_model_registry is None:
+            _midm_model_registry = MidmModelRegistry()
+        return _midm_model_registry
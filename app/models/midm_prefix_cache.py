@@ -0,0 +1,192 @@
+"""Mi:dm 모델을 위한 프롬프트 프리픽스 KV 캐시.
+
+RAG 요청은 모두 같은 시스템 프롬프트로 시작하므로, 공통 프리픽스의
+`past_key_values`를 한 번만 계산해 두고 이후 요청은 캐시된 프리픽스
+다음 토큰부터 prefill 하도록 합니다.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    import torch
+
+    from transformers import AutoModelForCausalLM
+
+
+def _get_cache_nbytes(past_key_values: Any) -> int:
+    """`past_key_values`가 차지하는 메모리(바이트)를 계산합니다."""
+    if hasattr(past_key_values, "layers"):
+        tensors = [
+            tensor
+            for layer in past_key_values.layers
+            for tensor in (layer.keys, layer.values)
+            if tensor is not None
+        ]
+    elif hasattr(past_key_values, "key_cache"):
+        tensors = [*past_key_values.key_cache, *past_key_values.value_cache]
+    else:
+        # 레거시 형식: 레이어별 (key, value) 튜플
+        tensors = [tensor for layer in past_key_values for tensor in layer]
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+
+def _common_prefix_length(a: tuple[int, ...], b: tuple[int, ...]) -> int:
+    """두 토큰 시퀀스의 공통 프리픽스 길이를 반환합니다."""
+    length = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        length += 1
+    return length
+
+
+class MidmPrefixCache:
+    """공통 프롬프트 프리픽스의 KV 캐시를 메모리 한도 내에서 LRU로 보관합니다.
+
+    새 프롬프트가 최근 프롬프트와 `min_prefix_tokens` 이상 같은 토큰으로
+    시작하면 그 공통 프리픽스를 한 번 prefill 하여 저장합니다. 이후 같은
+    프리픽스로 시작하는 요청은 캐시를 복사해 이어서 생성하므로 프리픽스
+    구간의 prefill 비용이 사라집니다.
+
+    Example:
+        ```python
+        prefix_cache = MidmPrefixCache(max_memory_mb=256)
+        outputs = prefix_cache.generate(model, input_ids, max_new_tokens=64)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_memory_mb: float = 256.0,
+        min_prefix_tokens: int = 32,
+        max_recent_prompts: int = 16,
+    ) -> None:
+        """프리픽스 캐시를 초기화합니다.
+
+        Args:
+            max_memory_mb: 캐시된 KV 텐서의 최대 메모리 (MB).
+            min_prefix_tokens: 캐시할 공통 프리픽스의 최소 토큰 수.
+            max_recent_prompts: 공통 프리픽스 탐지를 위해 기억할 최근 프롬프트 수.
+        """
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self.min_prefix_tokens = min_prefix_tokens
+
+        self._entries: OrderedDict[tuple[int, ...], tuple[Any, int]] = OrderedDict()
+        self._recent_prompts: deque[tuple[int, ...]] = deque(maxlen=max_recent_prompts)
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._reused_tokens = 0
+
+    def generate(
+        self,
+        model: "AutoModelForCausalLM",
+        input_ids: "torch.Tensor",
+        **generation_kwargs: Any,
+    ) -> "torch.Tensor":
+        """캐시된 프리픽스가 있으면 이어서, 없으면 처음부터 생성합니다.
+
+        Args:
+            model: 생성에 사용할 모델.
+            input_ids: 배치 크기 1의 입력 토큰 텐서.
+            **generation_kwargs: `model.generate`에 전달할 생성 파라미터.
+
+        Returns:
+            `model.generate`의 출력 토큰 텐서 (프롬프트 포함).
+        """
+        import torch
+
+        token_ids = tuple(input_ids[0].tolist())
+        past_key_values = self._lookup(token_ids)
+
+        if past_key_values is None:
+            prefix_length = self._find_shared_prefix(token_ids)
+            if prefix_length >= self.min_prefix_tokens:
+                with torch.no_grad():
+                    prefill = model(input_ids[:, :prefix_length], use_cache=True)
+                self._store(token_ids[:prefix_length], prefill.past_key_values)
+                past_key_values = copy.deepcopy(prefill.past_key_values)
+
+        if past_key_values is not None:
+            generation_kwargs["past_key_values"] = past_key_values
+
+        with torch.no_grad():
+            return model.generate(input_ids, **generation_kwargs)
+
+    def stats(self) -> dict[str, int]:
+        """캐시 적중/미스 수, 재사용한 프리픽스 토큰 수, 메모리 사용량을 반환합니다."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "reused_tokens": self._reused_tokens,
+            }
+
+    def clear(self) -> None:
+        """캐시된 모든 프리픽스를 제거합니다."""
+        with self._lock:
+            self._entries.clear()
+            self._recent_prompts.clear()
+            self._memory_bytes = 0
+
+    def _lookup(self, token_ids: tuple[int, ...]) -> Optional[Any]:
+        """`token_ids`의 가장 긴 캐시된 프리픽스의 KV 복사본을 반환합니다."""
+        with self._lock:
+            best: Optional[tuple[int, ...]] = None
+            for prefix in self._entries:
+                # 마지막 토큰은 반드시 모델에 입력되어야 하므로 프롬프트보다 짧아야 함
+                if (
+                    len(prefix) < len(token_ids)
+                    and (best is None or len(prefix) > len(best))
+                    and token_ids[: len(prefix)] == prefix
+                ):
+                    best = prefix
+
+            if best is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(best)
+            self._hits += 1
+            self._reused_tokens += len(best)
+            past_key_values = self._entries[best][0]
+
+        # generate는 캐시를 제자리에서 확장하므로 복사본을 사용
+        return copy.deepcopy(past_key_values)
+
+    def _find_shared_prefix(self, token_ids: tuple[int, ...]) -> int:
+        """최근 프롬프트와의 가장 긴 공통 프리픽스 길이를 반환하고 프롬프트를 기억합니다."""
+        with self._lock:
+            prefix_length = max(
+                (
+                    _common_prefix_length(token_ids, recent)
+                    for recent in self._recent_prompts
+                ),
+                default=0,
+            )
+            self._recent_prompts.append(token_ids)
+        return min(prefix_length, len(token_ids) - 1)
+
+    def _store(self, prefix: tuple[int, ...], past_key_values: Any) -> None:
+        """프리픽스 KV를 저장하고 메모리 한도를 넘으면 오래된 항목을 제거합니다."""
+        nbytes = _get_cache_nbytes(past_key_values)
+        if nbytes > self.max_memory_bytes:
+            return
+
+        with self._lock:
+            if prefix in self._entries:
+                return
+            self._entries[prefix] = (past_key_values, nbytes)
+            self._memory_bytes += nbytes
+            while self._memory_bytes > self.max_memory_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._memory_bytes -= evicted_bytes
@@ -0,0 +1,740 @@
+"""
+vector_repository.py 벡터 DB 접근 계층
+
+PGVector가 만든 langchain_pg_embedding 테이블을 직접 조회하는 SQL을 모아둠
+
+덴스(pgvector) + 스파스(Postgres 전문 검색) 하이브리드 검색을
+한 번의 SQL 왕복으로 수행하고, 가중 RRF로 서버에서 결합
+
+컬렉션별 HNSW/IVFFlat 근사 최근접 이웃(ANN) 인덱스의 생성/재구축과
+요청별 ef_search/probes 조정(재현율-지연 시간 트레이드오프)도 담당
+
+컬렉션 단위 초기화(TRUNCATE 또는 배치 삭제)와 메타데이터 필터 일괄 삭제는
+다른 컬렉션을 잠그지 않도록 짧은 트랜잭션으로 나누어 수행
+"""
+
+import hashlib
+import json
+import math
+import re
+from typing import Any, List, Optional, Tuple
+
+import psycopg2
+from psycopg2 import sql
+from psycopg2.pool import ThreadedConnectionPool
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+from pydantic import ConfigDict, PrivateAttr
+
+# 전문 검색용 tsvector 컬럼과 GIN 인덱스 이름
+TSV_COLUMN = "document_tsv"
+TSV_INDEX = "ix_langchain_pg_embedding_document_tsv"
+
+# 쿼리 토큰 끝에서 떼어낼 한국어 조사 (긴 것부터 검사)
+_KOREAN_PARTICLES = (
+    "에서는", "으로는", "에게서", "에서", "에게", "으로", "까지", "부터", "처럼",
+    "보다", "이나", "이랑", "하고", "은", "는", "이", "가", "을", "를", "의",
+    "에", "로", "와", "과", "도", "만",
+)
+
+# ANN 인덱스 종류
+ANN_INDEX_METHODS = ("hnsw", "ivfflat")
+
+# 컬렉션별 조회/삭제용 collection_id 인덱스 이름
+COLLECTION_ID_INDEX = "ix_langchain_pg_embedding_collection_id"
+
+# 한 트랜잭션에서 삭제할 최대 행 수 (행 잠금과 WAL을 짧게 유지)
+DELETE_BATCH_SIZE = 10_000
+
+_DELETE_BATCH_SQL = """
+DELETE FROM langchain_pg_embedding
+WHERE id IN (
+    SELECT id FROM langchain_pg_embedding
+    WHERE collection_id = %(collection_id)s {condition}
+    LIMIT %(batch_size)s
+)
+"""
+
+# 컬렉션 조건은 리터럴로 바인딩해야 플래너가 컬렉션별 부분 인덱스를 사용할 수 있음
+_DENSE_SEARCH_SQL = """
+SELECT e.id, e.document, e.cmetadata, e.embedding <=> %(embedding)s::vector AS distance
+FROM langchain_pg_embedding e
+WHERE e.collection_id = %(collection_id)s
+ORDER BY distance
+LIMIT %(k)s
+"""
+
+_HYBRID_SEARCH_SQL = f"""
+WITH dense AS (
+    SELECT e.id,
+           ROW_NUMBER() OVER (ORDER BY e.embedding <=> %(embedding)s::vector) AS rank
+    FROM langchain_pg_embedding e
+    WHERE e.collection_id = %(collection_id)s
+    ORDER BY e.embedding <=> %(embedding)s::vector
+    LIMIT %(fetch_k)s
+),
+sparse AS (
+    SELECT e.id,
+           ROW_NUMBER() OVER (ORDER BY ts_rank_cd(e.{TSV_COLUMN}, q) DESC) AS rank
+    FROM langchain_pg_embedding e,
+         to_tsquery(%(ts_config)s::regconfig, %(tsquery)s) AS q
+    WHERE e.collection_id = %(collection_id)s
+      AND e.{TSV_COLUMN} @@ q
+    ORDER BY ts_rank_cd(e.{TSV_COLUMN}, q) DESC
+    LIMIT %(fetch_k)s
+),
+fused AS (
+    SELECT COALESCE(d.id, s.id) AS id,
+           COALESCE(%(dense_weight)s / (%(rrf_k)s + d.rank), 0)
+           + COALESCE(%(sparse_weight)s / (%(rrf_k)s + s.rank), 0) AS score
+    FROM dense d
+    FULL OUTER JOIN sparse s ON d.id = s.id
+)
+SELECT e.id, e.document, e.cmetadata, f.score
+FROM fused f
+JOIN langchain_pg_embedding e ON e.id = f.id
+ORDER BY f.score DESC
+LIMIT %(k)s
+"""
+
+
+def _format_vector(embedding: List[float]) -> str:
+    """임베딩을 pgvector 리터럴 문자열로 변환합니다."""
+    return "[" + ",".join(map(str, embedding)) + "]"
+
+
+def _fetch_collection_id(cursor, collection_name: str) -> Optional[str]:
+    """컬렉션 이름으로 langchain_pg_collection의 uuid를 조회합니다."""
+    cursor.execute(
+        "SELECT uuid FROM langchain_pg_collection WHERE name = %s", (collection_name,)
+    )
+    row = cursor.fetchone()
+    return str(row[0]) if row else None
+
+
+def _search_settings_sql(
+    ef_search: Optional[int] = None, probes: Optional[int] = None
+) -> str:
+    """검색 쿼리 앞에 붙일 트랜잭션 범위(SET LOCAL)의 ANN 검색 설정을 만듭니다.
+
+    ef_search(HNSW)와 probes(IVFFlat)가 클수록 재현율이 높아지고 지연 시간이 늘어납니다.
+    """
+    settings = ""
+    if ef_search is not None:
+        settings += f"SET LOCAL hnsw.ef_search = {int(ef_search)};\n"
+    if probes is not None:
+        settings += f"SET LOCAL ivfflat.probes = {int(probes)};\n"
+    return settings
+
+
+def _to_documents(rows) -> List[Tuple[Document, float]]:
+    """(id, document, cmetadata, score) 행을 (문서, 점수) 리스트로 변환합니다."""
+    return [
+        (
+            Document(id=row_id, page_content=document or "", metadata=metadata or {}),
+            float(score),
+        )
+        for row_id, document, metadata, score in rows
+    ]
+
+
+def ensure_fulltext_index(connection_string: str, ts_config: str = "simple") -> None:
+    """langchain_pg_embedding에 전문 검색용 tsvector 컬럼과 GIN 인덱스를 만듭니다.
+
+    tsvector는 생성 컬럼(GENERATED ... STORED)이므로 PGVector가 문서를 추가할 때
+    Postgres가 자동으로 채우며, 인제스트 코드를 바꿀 필요가 없습니다.
+    이미 있으면 아무것도 하지 않습니다. (컬럼 추가 시 테이블이 한 번 재작성됨)
+
+    Args:
+        connection_string: PostgreSQL 연결 문자열.
+        ts_config: 텍스트 검색 설정. 한국어 설정이 없으므로 기본값은 공백 단위의 simple.
+    """
+    conn = psycopg2.connect(connection_string)
+    conn.autocommit = True
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            sql.SQL(
+                "ALTER TABLE langchain_pg_embedding ADD COLUMN IF NOT EXISTS {column} "
+                "tsvector GENERATED ALWAYS AS "
+                "(to_tsvector({config}::regconfig, coalesce(document, ''))) STORED;"
+            ).format(column=sql.Identifier(TSV_COLUMN), config=sql.Literal(ts_config))
+        )
+        cursor.execute(
+            sql.SQL(
+                "CREATE INDEX IF NOT EXISTS {index} ON langchain_pg_embedding "
+                "USING GIN ({column});"
+            ).format(index=sql.Identifier(TSV_INDEX), column=sql.Identifier(TSV_COLUMN))
+        )
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def ensure_collection_id_index(connection_string: str) -> None:
+    """컬렉션별 검색/삭제가 순차 스캔하지 않도록 collection_id 인덱스를 만듭니다.
+
+    이미 있으면 아무것도 하지 않습니다.
+
+    Args:
+        connection_string: PostgreSQL 연결 문자열.
+    """
+    conn = psycopg2.connect(connection_string)
+    conn.autocommit = True
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            sql.SQL(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} "
+                "ON langchain_pg_embedding (collection_id);"
+            ).format(index=sql.Identifier(COLLECTION_ID_INDEX))
+        )
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def build_tsquery(query: str) -> Optional[str]:
+    """질문을 to_tsquery용 문자열로 변환합니다.
+
+    simple 설정은 형태소 분석을 하지 않으므로 토큰 끝의 조사를 떼고 접두어 검색(:*)을
+    사용합니다. 예: "프레임워크는" -> "프레임워크:*" (문서의 "프레임워크입니다"와 매칭)
+    토큰은 OR로 묶고 순위는 ts_rank_cd에 맡깁니다.
+
+    Args:
+        query: 사용자 질문.
+
+    Returns:
+        tsquery 문자열. 검색할 토큰이 없으면 None.
+    """
+    lexemes = []
+    for token in re.findall(r"[^\W_]+", query.lower()):
+        for particle in _KOREAN_PARTICLES:
+            if token.endswith(particle) and len(token) - len(particle) >= 2:
+                token = token[: -len(particle)]
+                break
+        lexemes.append(f"{token}:*")
+    if not lexemes:
+        return None
+    return " | ".join(dict.fromkeys(lexemes))
+
+
+class PGVectorIndexManager:
+    """컬렉션별 ANN 인덱스(HNSW/IVFFlat)를 관리하고 인덱스를 타는 덴스 검색을 수행합니다.
+
+    인덱스는 collection_id 조건의 부분 인덱스이므로 컬렉션마다 따로 만들고 재구축할 수
+    있습니다. 인덱스 생성은 CONCURRENTLY로 수행하여 인제스트를 막지 않습니다.
+    컬렉션 초기화와 메타데이터 필터 일괄 삭제도 컬렉션 단위로 수행합니다.
+
+    Args:
+        connection_string: PostgreSQL 연결 문자열.
+        collection_name: PGVector 컬렉션 이름.
+        dimensions: 임베딩 차원 (text-embedding-3-small은 1536).
+        max_connections: 검색용 커넥션 풀의 최대 연결 수.
+    """
+
+    def __init__(
+        self,
+        connection_string: str,
+        collection_name: str = "langchain",
+        dimensions: int = 1536,
+        max_connections: int = 10,
+    ):
+        self.connection_string = connection_string
+        self.collection_name = collection_name
+        self.dimensions = dimensions
+        self.max_connections = max_connections
+        self._pool: Optional[ThreadedConnectionPool] = None
+
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """검색 요청마다 연결하지 않도록 커넥션 풀을 지연 생성합니다."""
+        if self._pool is None:
+            self._pool = ThreadedConnectionPool(
+                1, self.max_connections, self.connection_string
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """커넥션 풀을 닫습니다."""
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
+
+    def _connect(self):
+        conn = psycopg2.connect(self.connection_string)
+        # CREATE/REINDEX ... CONCURRENTLY는 트랜잭션 밖에서 실행해야 함
+        conn.autocommit = True
+        return conn
+
+    def index_name(self, method: str) -> str:
+        """컬렉션과 인덱스 종류별 인덱스 이름을 반환합니다."""
+        digest = hashlib.md5(self.collection_name.encode("utf-8")).hexdigest()[:8]
+        return f"ix_langchain_pg_embedding_{method}_{digest}"
+
+    def status(self) -> List[dict]:
+        """이 컬렉션의 ANN 인덱스 목록과 크기를 반환합니다."""
+        conn = self._connect()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT c.relname, pg_relation_size(c.oid), i.indisvalid "
+                    "FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+                    "WHERE c.relname = ANY(%s)",
+                    ([self.index_name(method) for method in ANN_INDEX_METHODS],),
+                )
+                rows = cursor.fetchall()
+        finally:
+            conn.close()
+        return [
+            {
+                "name": name,
+                "method": name.split("_")[-2],
+                "size_bytes": size,
+                "valid": valid,
+            }
+            for name, size, valid in rows
+        ]
+
+    def ensure_index(
+        self,
+        method: str = "hnsw",
+        m: int = 16,
+        ef_construction: int = 64,
+        lists: Optional[int] = None,
+        maintenance_work_mem: Optional[str] = None,
+    ) -> dict:
+        """컬렉션의 ANN 인덱스를 만듭니다. 다른 종류의 인덱스가 있으면 교체합니다.
+
+        Args:
+            method: "hnsw" 또는 "ivfflat".
+            m: HNSW 노드당 연결 수. 클수록 재현율과 메모리 사용량이 늘어남.
+            ef_construction: HNSW 구축 시 후보 수. 클수록 구축이 느리고 재현율이 높음.
+            lists: IVFFlat 리스트 수. None이면 행 수 기준 권장값(행/1000, 100만 초과 시 √행).
+            maintenance_work_mem: 인덱스 구축에 쓸 메모리 (예: "1GB").
+
+        Returns:
+            인덱스 정보 딕셔너리.
+
+        Raises:
+            ValueError: 지원하지 않는 method이거나 컬렉션이 없는 경우, 또는 저장된
+                벡터의 차원이 섞여 있어 차원을 고정할 수 없는 경우.
+        """
+        if method not in ANN_INDEX_METHODS:
+            raise ValueError(f"지원하지 않는 인덱스 종류입니다: {method}")
+        name = self.index_name(method)
+        conn = self._connect()
+        try:
+            with conn.cursor() as cursor:
+                collection_id = _fetch_collection_id(cursor, self.collection_name)
+                if collection_id is None:
+                    raise ValueError(f"컬렉션이 없습니다: {self.collection_name}")
+                self._ensure_fixed_dimensions(cursor)
+
+                cursor.execute(
+                    "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)",
+                    (name,),
+                )
+                row = cursor.fetchone()
+                if row is not None and row[0]:
+                    return {"name": name, "method": method, "created": False}
+
+                # 실패한 CONCURRENTLY 구축이 남긴 무효 인덱스와 다른 종류의 인덱스 제거
+                for other in ANN_INDEX_METHODS:
+                    if other != method or row is not None:
+                        cursor.execute(
+                            sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}").format(
+                                sql.Identifier(self.index_name(other))
+                            )
+                        )
+
+                if maintenance_work_mem:
+                    cursor.execute(
+                        "SELECT set_config('maintenance_work_mem', %s, false)",
+                        (maintenance_work_mem,),
+                    )
+                if method == "hnsw":
+                    options = sql.SQL("m = {}, ef_construction = {}").format(
+                        sql.Literal(int(m)), sql.Literal(int(ef_construction))
+                    )
+                else:
+                    if lists is None:
+                        cursor.execute(
+                            "SELECT count(*) FROM langchain_pg_embedding "
+                            "WHERE collection_id = %s",
+                            (collection_id,),
+                        )
+                        rows = cursor.fetchone()[0]
+                        lists = (
+                            max(rows // 1000, 10)
+                            if rows <= 1_000_000
+                            else int(math.sqrt(rows))
+                        )
+                    options = sql.SQL("lists = {}").format(sql.Literal(int(lists)))
+                cursor.execute(
+                    sql.SQL(
+                        "CREATE INDEX CONCURRENTLY {name} ON langchain_pg_embedding "
+                        "USING {method} (embedding vector_cosine_ops) "
+                        "WITH ({options}) WHERE collection_id = {collection_id}"
+                    ).format(
+                        name=sql.Identifier(name),
+                        method=sql.SQL(method),
+                        options=options,
+                        collection_id=sql.Literal(collection_id),
+                    )
+                )
+        finally:
+            conn.close()
+        return {"name": name, "method": method, "created": True, "lists": lists}
+
+    def _ensure_fixed_dimensions(self, cursor) -> None:
+        """ANN 인덱스에 필요한 고정 차원(vector(n))으로 embedding 컬럼 타입을 맞춥니다."""
+        cursor.execute(
+            "SELECT atttypmod FROM pg_attribute "
+            "WHERE attrelid = 'langchain_pg_embedding'::regclass AND attname = 'embedding'"
+        )
+        if cursor.fetchone()[0] == self.dimensions:
+            return
+        try:
+            cursor.execute(
+                sql.SQL(
+                    "ALTER TABLE langchain_pg_embedding "
+                    "ALTER COLUMN embedding TYPE vector({})"
+                ).format(sql.Literal(int(self.dimensions)))
+            )
+        except psycopg2.DataError as e:
+            raise ValueError(
+                f"저장된 벡터의 차원이 {self.dimensions}이 아니어서 인덱스를 만들 수 없습니다. "
+                "/reset-collection으로 초기화하거나 EMBEDDING_DIMENSIONS를 확인하세요."
+            ) from e
+
+    def reindex(self) -> List[str]:
+        """대량 인제스트 후 컬렉션의 ANN 인덱스를 재구축하고 통계를 갱신합니다.
+
+        IVFFlat은 구축 시점의 데이터로 리스트 중심을 학습하므로 데이터가 크게 늘면
+        재구축해야 재현율이 유지됩니다. REINDEX CONCURRENTLY로 검색을 막지 않습니다.
+
+        Returns:
+            재구축한 인덱스 이름 리스트.
+        """
+        names = [index["name"] for index in self.status()]
+        conn = self._connect()
+        try:
+            with conn.cursor() as cursor:
+                for name in names:
+                    cursor.execute(
+                        sql.SQL("REINDEX INDEX CONCURRENTLY {}").format(
+                            sql.Identifier(name)
+                        )
+                    )
+                cursor.execute("ANALYZE langchain_pg_embedding")
+        finally:
+            conn.close()
+        return names
+
+    def drop_indexes(self) -> List[str]:
+        """이 컬렉션의 ANN 인덱스를 삭제합니다.
+
+        Returns:
+            삭제한 인덱스 이름 리스트.
+        """
+        names = [index["name"] for index in self.status()]
+        conn = self._connect()
+        try:
+            with conn.cursor() as cursor:
+                for name in names:
+                    cursor.execute(
+                        sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}").format(
+                            sql.Identifier(name)
+                        )
+                    )
+        finally:
+            conn.close()
+        return names
+
+    def _delete_in_batches(
+        self,
+        collection_id: str,
+        condition: str = "",
+        params: Optional[dict] = None,
+        batch_size: int = DELETE_BATCH_SIZE,
+    ) -> int:
+        """조건에 맞는 행을 batch_size개씩 별도 트랜잭션으로 삭제합니다."""
+        statement = _DELETE_BATCH_SQL.format(condition=condition)
+        params = {**(params or {}), "collection_id": collection_id, "batch_size": batch_size}
+        deleted = 0
+        conn = self._connect()
+        try:
+            with conn.cursor() as cursor:
+                while True:
+                    # autocommit이므로 배치마다 커밋되어 잠금이 오래 유지되지 않음
+                    cursor.execute(statement, params)
+                    deleted += cursor.rowcount
+                    if cursor.rowcount < batch_size:
+                        break
+        finally:
+            conn.close()
+        return deleted
+
+    def reset_collection(self, batch_size: int = DELETE_BATCH_SIZE) -> dict:
+        """컬렉션의 모든 임베딩을 삭제합니다. 컬렉션 자체는 유지됩니다.
+
+        테이블에 다른 컬렉션의 행이 없으면 TRUNCATE로 즉시 비우고(테이블 팽창 없음),
+        있으면 다른 컬렉션을 잠그지 않도록 배치 삭제합니다. 배치 삭제 전에 이 컬렉션의
+        ANN 인덱스를 삭제하여 행마다 인덱스를 갱신하는 비용을 없앱니다.
+        삭제 후 vacuum()과 ANN 인덱스 재생성을 백그라운드에서 실행하세요.
+
+        Args:
+            batch_size: 배치 삭제 시 트랜잭션당 삭제할 행 수.
+
+        Returns:
+            초기화 결과 (삭제 방식, 삭제한 행 수, 삭제한 인덱스).
+        """
+        conn = psycopg2.connect(self.connection_string)
+        try:
+            with conn.cursor() as cursor:
+                collection_id = _fetch_collection_id(cursor, self.collection_name)
+                if collection_id is None:
+                    conn.rollback()
+                    return {"method": "none", "deleted_embeddings": 0, "dropped_indexes": []}
+                # 확인과 TRUNCATE 사이에 다른 컬렉션의 쓰기가 끼어들지 않도록 잠금 (읽기는 허용)
+                cursor.execute(
+                    "LOCK TABLE langchain_pg_embedding IN SHARE ROW EXCLUSIVE MODE"
+                )
+                cursor.execute(
+                    "SELECT EXISTS (SELECT 1 FROM langchain_pg_embedding "
+                    "WHERE collection_id <> %s)",
+                    (collection_id,),
+                )
+                if not cursor.fetchone()[0]:
+                    cursor.execute("SELECT count(*) FROM langchain_pg_embedding")
+                    deleted = cursor.fetchone()[0]
+                    cursor.execute("TRUNCATE langchain_pg_embedding")
+                    conn.commit()
+                    return {
+                        "method": "truncate",
+                        "deleted_embeddings": deleted,
+                        "dropped_indexes": [],
+                    }
+            conn.rollback()
+        finally:
+            conn.close()
+
+        dropped = self.drop_indexes()
+        deleted = self._delete_in_batches(collection_id, batch_size=batch_size)
+        return {
+            "method": "batched_delete",
+            "deleted_embeddings": deleted,
+            "dropped_indexes": dropped,
+        }
+
+    def delete_by_metadata(
+        self, metadata_filter: dict, batch_size: int = DELETE_BATCH_SIZE
+    ) -> int:
+        """메타데이터가 필터를 포함하는(@>) 임베딩을 배치로 삭제합니다.
+
+        Args:
+            metadata_filter: 일치해야 할 메타데이터 (예: {"source": "intro"}).
+            batch_size: 트랜잭션당 삭제할 행 수.
+
+        Returns:
+            삭제한 행 수.
+
+        Raises:
+            ValueError: 필터가 비어 있는 경우 (컬렉션 전체 삭제는 reset_collection 사용).
+        """
+        if not metadata_filter:
+            raise ValueError("메타데이터 필터가 비어 있습니다.")
+        conn = psycopg2.connect(self.connection_string)
+        try:
+            with conn.cursor() as cursor:
+                collection_id = _fetch_collection_id(cursor, self.collection_name)
+            conn.rollback()
+        finally:
+            conn.close()
+        if collection_id is None:
+            return 0
+        return self._delete_in_batches(
+            collection_id,
+            condition="AND cmetadata @> %(metadata_filter)s::jsonb",
+            params={"metadata_filter": json.dumps(metadata_filter)},
+            batch_size=batch_size,
+        )
+
+    def vacuum(self) -> None:
+        """대량 삭제 후 죽은 행을 정리하고 남은 인덱스를 재구축합니다.
+
+        VACUUM과 REINDEX CONCURRENTLY는 다른 컬렉션의 읽기/쓰기를 막지 않습니다.
+        """
+        conn = self._connect()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("VACUUM (ANALYZE) langchain_pg_embedding")
+                cursor.execute(
+                    "SELECT c.relname FROM pg_index i "
+                    "JOIN pg_class c ON c.oid = i.indexrelid "
+                    "WHERE i.indrelid = 'langchain_pg_embedding'::regclass "
+                    "AND c.relname = ANY(%s)",
+                    ([TSV_INDEX, COLLECTION_ID_INDEX],),
+                )
+                for (name,) in cursor.fetchall():
+                    cursor.execute(
+                        sql.SQL("REINDEX INDEX CONCURRENTLY {}").format(
+                            sql.Identifier(name)
+                        )
+                    )
+        finally:
+            conn.close()
+
+    def search_with_scores(
+        self,
+        embedding: List[float],
+        k: int = 5,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+    ) -> List[Tuple[Document, float]]:
+        """ANN 인덱스를 사용하는 덴스 검색을 수행합니다.
+
+        Args:
+            embedding: 쿼리 임베딩.
+            k: 반환할 문서 수.
+            ef_search: 이 요청에만 적용할 HNSW 검색 후보 수.
+            probes: 이 요청에만 적용할 IVFFlat 탐색 리스트 수.
+
+        Returns:
+            (문서, 코사인 거리) 리스트. 거리가 낮을수록 유사합니다.
+        """
+        pool = self._get_pool()
+        conn = pool.getconn()
+        try:
+            with conn.cursor() as cursor:
+                collection_id = _fetch_collection_id(cursor, self.collection_name)
+                if collection_id is None:
+                    conn.rollback()
+                    return []
+                cursor.execute(
+                    _search_settings_sql(ef_search, probes) + _DENSE_SEARCH_SQL,
+                    {
+                        "embedding": _format_vector(embedding),
+                        "collection_id": collection_id,
+                        "k": k,
+                    },
+                )
+                rows = cursor.fetchall()
+            conn.rollback()
+        finally:
+            pool.putconn(conn)
+        return _to_documents(rows)
+
+
+class PGHybridRetriever(BaseRetriever):
+    """pgvector 덴스 검색과 Postgres 전문 검색을 가중 RRF로 결합하는 검색기.
+
+    두 검색과 RRF 결합을 하나의 SQL로 실행하므로 DB 왕복은 한 번이며,
+    인메모리 BM25 인덱스 없이 키워드 위주의 질문 정확도를 높입니다.
+    사용 전에 ensure_fulltext_index()로 tsvector 컬럼을 만들어야 합니다.
+    """
+
+    connection_string: str
+    embeddings: Embeddings
+    collection_name: str = "langchain"
+    k: int = 5
+    # 각 검색에서 RRF 결합 전에 가져올 후보 수
+    fetch_k: int = 20
+    dense_weight: float = 1.0
+    sparse_weight: float = 1.0
+    # RRF 상수: score = weight / (rrf_k + rank)
+    rrf_k: int = 60
+    ts_config: str = "simple"
+    # 덴스 검색의 ANN 인덱스 설정 (None이면 서버 기본값)
+    ef_search: Optional[int] = None
+    probes: Optional[int] = None
+    max_connections: int = 10
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _pool: Optional[ThreadedConnectionPool] = PrivateAttr(default=None)
+    # 컬렉션 uuid 캐시 (컬렉션이 초기화되면 다시 조회)
+    _collection_id: Optional[str] = PrivateAttr(default=None)
+
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """요청마다 연결하지 않도록 커넥션 풀을 지연 생성합니다."""
+        if self._pool is None:
+            self._pool = ThreadedConnectionPool(
+                1, self.max_connections, self.connection_string
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """커넥션 풀을 닫습니다."""
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
+
+    def search_with_scores(
+        self,
+        query: str,
+        k: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+    ) -> List[Tuple[Document, float]]:
+        """하이브리드 검색을 수행합니다.
+
+        Args:
+            query: 사용자 질문.
+            k: 반환할 문서 수. None이면 self.k.
+            ef_search: 이 요청에만 적용할 HNSW 검색 후보 수. None이면 self.ef_search.
+            probes: 이 요청에만 적용할 IVFFlat 탐색 리스트 수. None이면 self.probes.
+
+        Returns:
+            (문서, RRF 점수) 리스트. 점수가 높을수록 관련성이 높습니다.
+        """
+        k = k or self.k
+        params: dict[str, Any] = {
+            "embedding": _format_vector(self.embeddings.embed_query(query)),
+            "ts_config": self.ts_config,
+            "tsquery": build_tsquery(query),
+            "fetch_k": max(self.fetch_k, k),
+            "dense_weight": float(self.dense_weight),
+            "sparse_weight": float(self.sparse_weight),
+            "rrf_k": self.rrf_k,
+            "k": k,
+        }
+        statement = (
+            _search_settings_sql(
+                ef_search if ef_search is not None else self.ef_search,
+                probes if probes is not None else self.probes,
+            )
+            + _HYBRID_SEARCH_SQL
+        )
+        pool = self._get_pool()
+        conn = pool.getconn()
+        try:
+            with conn.cursor() as cursor:
+                cached = self._collection_id is not None
+                for _ in range(2):
+                    if self._collection_id is None:
+                        self._collection_id = _fetch_collection_id(
+                            cursor, self.collection_name
+                        )
+                        if self._collection_id is None:
+                            rows = []
+                            break
+                    params["collection_id"] = self._collection_id
+                    cursor.execute(statement, params)
+                    rows = cursor.fetchall()
+                    if rows or not cached:
+                        break
+                    # 컬렉션이 초기화되어 uuid가 바뀌었을 수 있으므로 한 번 다시 조회
+                    self._collection_id = None
+                    cached = False
+            conn.rollback()
+        finally:
+            pool.putconn(conn)
+        return _to_documents(rows)
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return [doc for doc, _ in self.search_with_scores(query)]
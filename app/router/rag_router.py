@@ -54,6 +54,8 @@ class SearchAndChatResponse(BaseModel):
     answer: str
     sources: List[DocumentResponse]
     query: str
+    context_tokens: Optional[int] = None
+    """프롬프트 컨텍스트에 패킹된 토큰 수 (LLM을 사용할 수 없으면 None)."""
 
 
 @router.post("/chat", response_model=ChatResponse)
@@ -111,7 +113,9 @@ async def rag(request: ChatRequest):
     try:
         # 1. 벡터 검색 수행
         try:
-            answer, search_results = search_with_rag(request.query, k=5)
+            answer, search_results, packed_context = search_with_rag(
+                request.query, k=5
+            )
         except (DataError, psycopg2.errors.DataException) as e:
             error_msg = str(e)
             if "different vector dimensions" in error_msg:
@@ -137,6 +141,7 @@ async def rag(request: ChatRequest):
             answer=answer,
             sources=sources,
             query=request.query,
+            context_tokens=packed_context.token_count if packed_context else None,
         )
     except HTTPException:
         raise
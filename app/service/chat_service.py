@@ -6,32 +6,39 @@ chat_service.py 서빙 관련 서비스
 세션별 히스토리 관리, 요약, 토큰 절약 전략 등
 """
 
+import os
+
 import torch
 from transformers import AutoTokenizer, AutoModelForCausalLM, BitsAndBytesConfig
 from peft import LoraConfig, get_peft_model, prepare_model_for_kbit_training
 
 # 환경에 따라 상대/절대 import 선택
 try:
-    from ..models.midm_chat_model import load_midm_model
+    from ..models.midm_model_registry import get_midm_model_registry
 except ImportError:
     # 우분투 환경: 절대 import 사용 (선택적)
     try:
-        from models.midm_chat_model import load_midm_model
+        from models.midm_model_registry import get_midm_model_registry
     except ImportError:
         # 우분투에서는 LLM을 사용하지 않으므로 None으로 설정
-        load_midm_model = None
+        get_midm_model_registry = None
 
 
 def get_chat_model(model_path: str = None):
-    """채팅용 모델을 로드합니다.
+    """채팅용 모델을 가져옵니다.
+
+    공유 모델 레지스트리를 사용하므로 서버 시작 시 RAG용 ChatMidm이 로드한
+    모델을 그대로 재사용하며, 프로세스에 모델 사본을 하나만 둡니다.
 
     Args:
-        model_path: 모델 경로. None이면 기본 경로 사용.
+        model_path: 모델 경로. None이면 LOCAL_MODEL_DIR 환경 변수 또는 기본 경로 사용.
 
     Returns:
         (model, tokenizer) 튜플.
     """
-    return load_midm_model(model_path=model_path)
+    return get_midm_model_registry().load(
+        model_path=model_path or os.getenv("LOCAL_MODEL_DIR")
+    )
 
 
 def chat_with_model(model, tokenizer, query: str, **kwargs):
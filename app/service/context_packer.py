@@ -0,0 +1,281 @@
+"""RAG 프롬프트 컨텍스트 패킹.
+
+검색된 문서를 그대로 프롬프트에 넣으면 청크 오버랩과 중복 문서 때문에
+프롬프트가 불필요하게 길어지고 LLM 프리필 시간과 비용이 늘어납니다.
+이 모듈은 문서를 점수순 정렬 → 중복 제거 → 토큰 예산 내 절단 순서로
+패킹하여 `{context}`에 들어갈 문자열과 토큰 수를 만듭니다.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Sequence
+
+from langchain_core.documents import Document
+from langchain_core.prompts import PromptTemplate, format_document
+
+try:
+    from .perf_tracing import record_cache_lookup, record_cache_miss
+except ImportError:
+    from service.perf_tracing import record_cache_lookup, record_cache_miss
+
+DEFAULT_MAX_CONTEXT_TOKENS = 3000
+"""RAG_MAX_CONTEXT_TOKENS가 없을 때 사용하는 컨텍스트 토큰 예산."""
+
+DOCUMENT_SEPARATOR = "\n\n"
+
+# 출처가 있으면 답변에서 인용할 수 있도록 문서 앞에 표시합니다.
+_DOCUMENT_PROMPT = PromptTemplate.from_template("[출처: {source}]\n{page_content}")
+_CONTENT_ONLY_PROMPT = PromptTemplate.from_template("{page_content}")
+
+# 이보다 짧은 앞뒤 겹침은 우연의 일치로 보고 잘라내지 않습니다.
+_MIN_OVERLAP_CHARS = 32
+# 남은 예산이 이보다 작으면 문서를 잘라 넣지 않고 패킹을 끝냅니다.
+_MIN_TRUNCATED_TOKENS = 64
+
+
+@dataclass(frozen=True)
+class PackedContext:
+    """토큰 예산에 맞춰 패킹된 컨텍스트."""
+
+    context: str
+    """프롬프트의 `{context}`에 들어갈 문자열."""
+    token_count: int
+    """`context`의 토큰 수 (문서별 토큰 수와 구분자 토큰 수의 합)."""
+    documents: List[Document] = field(default_factory=list)
+    """컨텍스트에 포함된 문서 (중복 제거·절단 후 내용)."""
+    num_input_documents: int = 0
+    """패킹 전 입력 문서 수."""
+    num_duplicates: int = 0
+    """내용이 중복되어 제외된 문서 수."""
+    num_dropped: int = 0
+    """토큰 예산을 넘어 제외된 문서 수."""
+    truncated: bool = False
+    """마지막 문서가 예산에 맞게 잘렸는지 여부."""
+
+
+def get_max_context_tokens() -> int:
+    """환경 변수 RAG_MAX_CONTEXT_TOKENS의 컨텍스트 토큰 예산을 반환합니다."""
+    return int(os.getenv("RAG_MAX_CONTEXT_TOKENS", str(DEFAULT_MAX_CONTEXT_TOKENS)))
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> Optional[Any]:
+    """tiktoken 인코딩을 한 번만 로드합니다 (없으면 None)."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(
+            os.getenv("RAG_CONTEXT_TOKENIZER", "cl100k_base")
+        )
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """텍스트의 토큰 수를 셉니다.
+
+    같은 청크가 여러 요청에서 반복해서 검색되므로 결과를 캐시합니다.
+    tiktoken이 없으면 UTF-8 바이트 수로 어림합니다 (한글은 글자당 약
+    1토큰, 영문은 3글자당 약 1토큰으로 실제보다 약간 크게 잡습니다).
+
+    Args:
+        text: 토큰 수를 셀 텍스트.
+
+    Returns:
+        토큰 수.
+    """
+    record_cache_lookup("token_count")
+    return _count_tokens_cached(text)
+
+
+@lru_cache(maxsize=8192)
+def _count_tokens_cached(text: str) -> int:
+    record_cache_miss("token_count")
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return math.ceil(len(text.encode("utf-8")) / 3)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """텍스트를 최대 `max_tokens` 토큰까지 앞에서부터 자릅니다.
+
+    Args:
+        text: 자를 텍스트.
+        max_tokens: 최대 토큰 수.
+
+    Returns:
+        잘린 텍스트.
+    """
+    if max_tokens <= 0:
+        return ""
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return encoding.decode(tokens[:max_tokens])
+
+    # 바이트 기반 어림: 토큰 수가 글자 수에 대해 단조 증가하므로 이분 탐색
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if count_tokens(text[:mid]) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low]
+
+
+def _overlap_length(left: str, right: str) -> int:
+    """`left`의 끝과 `right`의 앞이 겹치는 가장 긴 길이를 구합니다."""
+    if min(len(left), len(right)) < _MIN_OVERLAP_CHARS:
+        return 0
+    head = right[:_MIN_OVERLAP_CHARS]
+    start = max(0, len(left) - len(right))
+    position = left.find(head, start)
+    while position != -1:
+        length = len(left) - position
+        if right.startswith(left[position:]):
+            return length
+        position = left.find(head, position + 1)
+    return 0
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def deduplicate_documents(
+    documents: Sequence[Document],
+) -> tuple[List[Document], int]:
+    """중복되거나 오버랩으로 겹치는 청크를 정리합니다.
+
+    앞선(더 관련 있는) 문서를 기준으로, 공백을 제외한 내용이 같거나 앞선
+    문서에 포함된 문서는 제외하고, 같은 출처의 앞선 문서와 앞뒤로 겹치는
+    부분(청크 오버랩)은 잘라냅니다.
+
+    Args:
+        documents: 관련도 순으로 정렬된 문서 리스트.
+
+    Returns:
+        (정리된 문서 리스트, 제외된 문서 수) 튜플.
+    """
+    kept: List[Document] = []
+    kept_normalized: List[str] = []
+    seen: set[str] = set()
+    num_duplicates = 0
+    for doc in documents:
+        content = doc.page_content
+        normalized = _normalize(content)
+        if not normalized or normalized in seen or any(
+            normalized in other for other in kept_normalized
+        ):
+            num_duplicates += 1
+            continue
+
+        source = doc.metadata.get("source")
+        for other in kept:
+            if other.metadata.get("source") != source:
+                continue
+            content = content[_overlap_length(other.page_content, content) :]
+            overlap = _overlap_length(content, other.page_content)
+            if overlap:
+                content = content[:-overlap]
+        if not content.strip():
+            num_duplicates += 1
+            continue
+
+        if content != doc.page_content:
+            doc = Document(id=doc.id, page_content=content, metadata=doc.metadata)
+        seen.add(normalized)
+        kept.append(doc)
+        kept_normalized.append(_normalize(content))
+    return kept, num_duplicates
+
+
+def format_context_document(doc: Document) -> str:
+    """문서를 컨텍스트 항목 문자열로 변환합니다."""
+    if "source" in doc.metadata:
+        return format_document(doc, _DOCUMENT_PROMPT)
+    return format_document(doc, _CONTENT_ONLY_PROMPT)
+
+
+def pack_documents(
+    documents: Sequence[Document],
+    max_tokens: Optional[int] = None,
+    scores: Optional[Sequence[float]] = None,
+    token_counter: Callable[[str], int] = count_tokens,
+) -> PackedContext:
+    """문서를 토큰 예산에 맞춰 하나의 컨텍스트 문자열로 패킹합니다.
+
+    1. `scores`가 주어지면 점수가 높은 순으로 정렬합니다. 없으면 검색기가
+       반환한 순서(관련도 순)를 그대로 사용합니다.
+    2. 중복·오버랩 청크를 정리합니다 (`deduplicate_documents`).
+    3. 앞에서부터 예산이 허락하는 만큼 문서를 담고, 예산을 넘는 첫 문서는
+       남은 예산이 충분하면 잘라서 넣습니다.
+
+    Args:
+        documents: 검색된 문서 리스트.
+        max_tokens: 컨텍스트 토큰 예산. None이면 RAG_MAX_CONTEXT_TOKENS를 사용합니다.
+        scores: 문서별 관련도 점수 (높을수록 관련).
+        token_counter: 토큰 수를 세는 함수.
+
+    Returns:
+        패킹된 컨텍스트와 토큰 통계.
+    """
+    if max_tokens is None:
+        max_tokens = get_max_context_tokens()
+    if scores is not None:
+        order = sorted(range(len(documents)), key=lambda i: scores[i], reverse=True)
+        documents = [documents[i] for i in order]
+
+    unique_docs, num_duplicates = deduplicate_documents(documents)
+    separator_tokens = token_counter(DOCUMENT_SEPARATOR)
+
+    parts: List[str] = []
+    packed_docs: List[Document] = []
+    token_count = 0
+    truncated = False
+    for doc in unique_docs:
+        cost = separator_tokens if parts else 0
+        text = format_context_document(doc)
+        tokens = token_counter(text)
+        if token_count + cost + tokens <= max_tokens:
+            parts.append(text)
+            packed_docs.append(doc)
+            token_count += cost + tokens
+            continue
+
+        remaining = max_tokens - token_count - cost
+        if remaining >= _MIN_TRUNCATED_TOKENS:
+            budget = remaining - (tokens - token_counter(doc.page_content))
+            while budget > 0:
+                content = truncate_to_tokens(doc.page_content, budget)
+                doc = Document(id=doc.id, page_content=content, metadata=doc.metadata)
+                text = format_context_document(doc)
+                tokens = token_counter(text)
+                # 경계에서 토큰이 합쳐지며 예산을 살짝 넘을 수 있으므로 다시 확인
+                if tokens <= remaining:
+                    break
+                budget -= tokens - remaining
+            if budget > 0 and doc.page_content.strip():
+                parts.append(text)
+                packed_docs.append(doc)
+                token_count += cost + tokens
+                truncated = True
+        break
+
+    return PackedContext(
+        context=DOCUMENT_SEPARATOR.join(parts),
+        token_count=token_count,
+        documents=packed_docs,
+        num_input_documents=len(documents),
+        num_duplicates=num_duplicates,
+        num_dropped=len(unique_docs) - len(packed_docs),
+        truncated=truncated,
+    )
@@ -0,0 +1,376 @@
+"""요청 단위 성능 추적.
+
+RAG 요청의 지연 시간을 질의 임베딩, 벡터 검색, 컨텍스트 패킹, 프롬프트 구성,
+LLM 생성 단계로 나누어 기록하고, 토큰 수와 캐시 적중을 함께 집계합니다.
+결과는 `Server-Timing` 응답 헤더와 Prometheus 텍스트 형식 메트릭으로 내보냅니다.
+
+RAG_PERF_TRACING=1일 때만 미들웨어가 요청별 추적을 시작합니다. 추적 중이
+아니면 `trace_stage`/`record_count`/`record_cache_lookup`은 ContextVar 조회
+한 번으로 끝나므로 비활성화 시 오버헤드는 거의 없습니다.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+# 체인 실행 이름 → 추적 단계 이름
+_CHAIN_STAGES = {
+    "pack_context": "pack_context",
+    "ChatPromptTemplate": "prompt",
+}
+
+_DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+
+def is_perf_tracing_enabled() -> bool:
+    """RAG_PERF_TRACING=1(또는 true)이면 요청별 성능 추적을 사용합니다."""
+    return os.getenv("RAG_PERF_TRACING", "").lower() in ("1", "true", "yes")
+
+
+@dataclass
+class RequestTrace:
+    """한 요청 동안 수집된 단계별 시간, 토큰 수, 캐시 조회 통계."""
+
+    stages: Dict[str, float] = field(default_factory=dict)
+    """단계 이름 → 누적 시간(초). 같은 단계가 여러 번 실행되면 합산됩니다."""
+    counts: Dict[str, int] = field(default_factory=dict)
+    """카운터 이름 → 값 (prompt_tokens, completion_tokens, context_tokens 등)."""
+    cache_lookups: Dict[str, List[int]] = field(default_factory=dict)
+    """캐시 이름 → [조회 수, 미스 수]."""
+    started_at: float = field(default_factory=time.perf_counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add_stage(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def add_count(self, name: str, value: int) -> None:
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + value
+
+    def add_cache_lookup(self, cache: str, miss: bool = False) -> None:
+        with self._lock:
+            stats = self.cache_lookups.setdefault(cache, [0, 0])
+            stats[0] += 1
+            stats[1] += miss
+
+    def add_cache_miss(self, cache: str) -> None:
+        """이미 기록한 조회 하나를 미스로 표시합니다."""
+        with self._lock:
+            self.cache_lookups.setdefault(cache, [0, 0])[1] += 1
+
+    def snapshot(
+        self,
+    ) -> Tuple[Dict[str, float], Dict[str, int], Dict[str, Tuple[int, int]]]:
+        """(단계별 시간, 카운터, 캐시별 (조회 수, 미스 수)) 복사본을 반환합니다."""
+        with self._lock:
+            return (
+                dict(self.stages),
+                dict(self.counts),
+                {
+                    cache: (stats[0], stats[1])
+                    for cache, stats in self.cache_lookups.items()
+                },
+            )
+
+    def elapsed(self) -> float:
+        """요청 시작 후 경과 시간(초)을 반환합니다."""
+        return time.perf_counter() - self.started_at
+
+    def server_timing(self, total_seconds: Optional[float] = None) -> str:
+        """`Server-Timing` 헤더 값을 만듭니다 (단위: ms).
+
+        Args:
+            total_seconds: 전체 요청 시간. None이면 현재까지의 경과 시간.
+
+        Returns:
+            예: `embedding;dur=12.1, llm;dur=812.4, total;dur=840.2`
+        """
+        if total_seconds is None:
+            total_seconds = self.elapsed()
+        with self._lock:
+            entries = [
+                f"{name};dur={seconds * 1000:.1f}"
+                for name, seconds in self.stages.items()
+            ]
+        entries.append(f"total;dur={total_seconds * 1000:.1f}")
+        return ", ".join(entries)
+
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar(
+    "rag_request_trace", default=None
+)
+
+
+def start_request_trace() -> Tuple[RequestTrace, Any]:
+    """현재 컨텍스트(요청)에서 새 추적을 시작합니다.
+
+    Returns:
+        (추적 객체, `end_request_trace`에 넘길 토큰) 튜플.
+    """
+    trace = RequestTrace()
+    return trace, _current_trace.set(trace)
+
+
+def end_request_trace(token: Any) -> None:
+    """`start_request_trace`로 시작한 추적을 끝냅니다."""
+    _current_trace.reset(token)
+
+
+def get_current_trace() -> Optional[RequestTrace]:
+    """현재 요청의 추적 객체를 반환합니다 (추적 중이 아니면 None)."""
+    return _current_trace.get()
+
+
+@contextmanager
+def trace_stage(name: str) -> Iterator[None]:
+    """with 블록의 실행 시간을 현재 요청의 `name` 단계에 기록합니다."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add_stage(name, time.perf_counter() - started)
+
+
+def record_count(name: str, value: int) -> None:
+    """현재 요청의 카운터에 값을 더합니다."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add_count(name, value)
+
+
+def record_cache_lookup(cache: str, miss: bool = False) -> None:
+    """현재 요청의 캐시 조회(미스 여부)를 기록합니다."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add_cache_lookup(cache, miss)
+
+
+def record_cache_miss(cache: str) -> None:
+    """`record_cache_lookup`으로 기록한 조회가 미스였음을 표시합니다.
+
+    `functools.lru_cache`처럼 조회와 미스를 서로 다른 곳에서 알게 되는
+    캐시에 사용합니다 (조회는 래퍼에서, 미스는 캐시된 함수 안에서 기록).
+    """
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add_cache_miss(cache)
+
+
+def get_tracing_callbacks() -> List[BaseCallbackHandler]:
+    """현재 요청을 추적 중이면 체인 `config["callbacks"]`에 넣을 핸들러를 반환합니다."""
+    trace = _current_trace.get()
+    if trace is None:
+        return []
+    return [PerfTracingCallbackHandler(trace)]
+
+
+class PerfTracingCallbackHandler(BaseCallbackHandler):
+    """LangChain 실행 이벤트로 검색기/프롬프트/LLM 단계 시간과 토큰 수를 기록합니다.
+
+    요청마다 새로 만들어 `config={"callbacks": [...]}`로 전달합니다.
+    """
+
+    run_inline = True
+
+    def __init__(self, trace: RequestTrace) -> None:
+        self.trace = trace
+        self._starts: Dict[UUID, Tuple[str, float]] = {}
+
+    def _start(self, run_id: UUID, stage: str) -> None:
+        self._starts[run_id] = (stage, time.perf_counter())
+
+    def _end(self, run_id: UUID) -> None:
+        started = self._starts.pop(run_id, None)
+        if started is not None:
+            stage, started_at = started
+            self.trace.add_stage(stage, time.perf_counter() - started_at)
+
+    def on_retriever_start(self, serialized, query, *, run_id, **kwargs) -> None:
+        self._start(run_id, "retrieval")
+
+    def on_retriever_end(self, documents, *, run_id, **kwargs) -> None:
+        self._end(run_id)
+
+    def on_retriever_error(self, error, *, run_id, **kwargs) -> None:
+        self._end(run_id)
+
+    def on_chain_start(self, serialized, inputs, *, run_id, **kwargs) -> None:
+        stage = _CHAIN_STAGES.get(kwargs.get("name") or "")
+        if stage is not None:
+            self._start(run_id, stage)
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs) -> None:
+        self._end(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs) -> None:
+        self._end(run_id)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs) -> None:
+        self._start(run_id, "llm")
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs) -> None:
+        self._start(run_id, "llm")
+
+    def on_llm_end(self, response: LLMResult, *, run_id, **kwargs) -> None:
+        self._end(run_id)
+        prompt_tokens, completion_tokens = _get_token_usage(response)
+        if prompt_tokens:
+            self.trace.add_count("prompt_tokens", prompt_tokens)
+        if completion_tokens:
+            self.trace.add_count("completion_tokens", completion_tokens)
+
+    def on_llm_error(self, error, *, run_id, **kwargs) -> None:
+        self._end(run_id)
+
+
+def _get_token_usage(response: LLMResult) -> Tuple[int, int]:
+    """LLM 결과에서 (입력 토큰 수, 출력 토큰 수)를 꺼냅니다."""
+    prompt_tokens = completion_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            if isinstance(generation, ChatGeneration):
+                usage = getattr(generation.message, "usage_metadata", None)
+                if usage:
+                    prompt_tokens += usage.get("input_tokens", 0)
+                    completion_tokens += usage.get("output_tokens", 0)
+    if not (prompt_tokens or completion_tokens) and response.llm_output:
+        usage = response.llm_output.get("token_usage") or {}
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        completion_tokens = usage.get("completion_tokens", 0)
+    return prompt_tokens, completion_tokens
+
+
+class _Histogram:
+    """누적 버킷 히스토그램 (Prometheus histogram 형식)."""
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> List[str]:
+        lines = []
+        cumulative = 0
+        prefix = f"{labels}," if labels else ""
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {self.count}')
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {self.total}")
+        lines.append(f"{name}_count{suffix} {self.count}")
+        return lines
+
+
+class PerfMetrics:
+    """요청 추적 결과를 누적해 Prometheus 텍스트 형식으로 내보내는 레지스트리."""
+
+    def __init__(self, buckets: Tuple[float, ...] = _DEFAULT_BUCKETS) -> None:
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, str, str], _Histogram] = {}
+        self._stages: Dict[Tuple[str, str], _Histogram] = {}
+        self._counts: Dict[Tuple[str, str], int] = {}
+        self._cache: Dict[Tuple[str, str], int] = {}
+
+    def observe(
+        self, trace: RequestTrace, route: str, method: str, status: int, seconds: float
+    ) -> None:
+        """한 요청의 추적 결과를 메트릭에 반영합니다.
+
+        Args:
+            trace: 요청 추적 객체.
+            route: 라우트 경로 템플릿 (레이블 수가 늘지 않도록 실제 URL 대신 사용).
+            method: HTTP 메서드.
+            status: 응답 상태 코드.
+            seconds: 전체 요청 시간(초).
+        """
+        stages, counts, lookups = trace.snapshot()
+        with self._lock:
+            key = (route, method, str(status))
+            self._histogram(self._requests, key).observe(seconds)
+            for stage, stage_seconds in stages.items():
+                self._histogram(self._stages, (route, stage)).observe(stage_seconds)
+            for name, value in counts.items():
+                self._counts[(route, name)] = self._counts.get((route, name), 0) + value
+            for cache, (total, misses) in lookups.items():
+                for result, value in (("hit", total - misses), ("miss", misses)):
+                    self._cache[(cache, result)] = (
+                        self._cache.get((cache, result), 0) + value
+                    )
+
+    def _histogram(self, store: Dict[Any, _Histogram], key: Any) -> _Histogram:
+        histogram = store.get(key)
+        if histogram is None:
+            histogram = store[key] = _Histogram(self._buckets)
+        return histogram
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식(0.0.4)으로 메트릭을 반환합니다."""
+        lines: List[str] = []
+        with self._lock:
+            lines.append(
+                "# HELP rag_request_duration_seconds 요청 처리 시간 (초)."
+            )
+            lines.append("# TYPE rag_request_duration_seconds histogram")
+            for (route, method, status), histogram in sorted(self._requests.items()):
+                labels = f'route="{route}",method="{method}",status="{status}"'
+                lines.extend(
+                    histogram.render("rag_request_duration_seconds", labels)
+                )
+            lines.append(
+                "# HELP rag_stage_duration_seconds 요청 안의 단계별 처리 시간 (초)."
+            )
+            lines.append("# TYPE rag_stage_duration_seconds histogram")
+            for (route, stage), histogram in sorted(self._stages.items()):
+                labels = f'route="{route}",stage="{stage}"'
+                lines.extend(histogram.render("rag_stage_duration_seconds", labels))
+            lines.append("# HELP rag_tokens_total 요청에서 사용한 토큰 수.")
+            lines.append("# TYPE rag_tokens_total counter")
+            for (route, name), value in sorted(self._counts.items()):
+                kind = name.removesuffix("_tokens")
+                lines.append(
+                    f'rag_tokens_total{{route="{route}",kind="{kind}"}} {value}'
+                )
+            lines.append("# HELP rag_cache_lookups_total 캐시 조회 수.")
+            lines.append("# TYPE rag_cache_lookups_total counter")
+            for (cache, result), value in sorted(self._cache.items()):
+                lines.append(
+                    f'rag_cache_lookups_total{{cache="{cache}",result="{result}"}} '
+                    f"{value}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+_metrics = PerfMetrics()
+
+
+def get_perf_metrics() -> PerfMetrics:
+    """프로세스 전역 메트릭 레지스트리를 반환합니다."""
+    return _metrics
@@ -6,7 +6,9 @@ rag_service.py 서빙 관련 서비스
 rag_chain.py를 실제로 호출하는 "애플리케이션 서비스"
 """
 
-from typing import List
+import os
+from operator import itemgetter
+from typing import List, Optional, Tuple
 from langchain_core.documents import Document
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnablePassthrough
@@ -14,16 +16,40 @@ from langchain_core.output_parsers import StrOutputParser
 
 # 환경에 따라 상대/절대 import 선택
 try:
-    from ..app import get_vector_store
+    from ..app import (
+        get_connection_string,
+        get_embedding_dimensions,
+        get_embeddings,
+        get_vector_store,
+    )
     from ..models import get_llm
+    from ..repository.vector_repository import PGHybridRetriever, PGVectorIndexManager
+    from .context_packer import PackedContext, pack_documents
+    from .perf_tracing import get_tracing_callbacks, record_count, trace_stage
 except ImportError:
     # 우분투 환경: 절대 import 사용
-    from app import get_vector_store
+    from app import (
+        get_connection_string,
+        get_embedding_dimensions,
+        get_embeddings,
+        get_vector_store,
+    )
     from models import get_llm
+    from repository.vector_repository import PGHybridRetriever, PGVectorIndexManager
+    from service.context_packer import PackedContext, pack_documents
+    from service.perf_tracing import get_tracing_callbacks, record_count, trace_stage
 
 # 전역 변수
 _vector_store = None
+_hybrid_retriever = None
+_index_managers: dict = {}
 _rag_chain = None
+_answer_chain = None
+
+
+def is_hybrid_search_enabled() -> bool:
+    """RETRIEVAL_MODE=hybrid이면 덴스 + 전문 검색 하이브리드 검색을 사용합니다."""
+    return os.getenv("RETRIEVAL_MODE", "dense").lower() == "hybrid"
 
 
 def get_vector_store_instance():
@@ -34,15 +60,73 @@ def get_vector_store_instance():
     return _vector_store
 
 
-def create_rag_chain(llm, retriever):
-    """RAG 체인을 생성합니다.
+def get_search_settings(
+    ef_search: Optional[int] = None, probes: Optional[int] = None
+) -> Tuple[Optional[int], Optional[int]]:
+    """요청 값이 없으면 환경 변수의 ANN 검색 설정(HNSW_EF_SEARCH, IVFFLAT_PROBES)을 사용합니다.
+
+    Args:
+        ef_search: 요청별 HNSW 검색 후보 수.
+        probes: 요청별 IVFFlat 탐색 리스트 수.
+
+    Returns:
+        (ef_search, probes) 튜플. None이면 Postgres 서버 기본값을 사용합니다.
+    """
+    if ef_search is None and os.getenv("HNSW_EF_SEARCH"):
+        ef_search = int(os.getenv("HNSW_EF_SEARCH"))
+    if probes is None and os.getenv("IVFFLAT_PROBES"):
+        probes = int(os.getenv("IVFFLAT_PROBES"))
+    return ef_search, probes
+
+
+def get_vector_index_manager(collection_name: str = "langchain") -> PGVectorIndexManager:
+    """컬렉션의 인덱스 관리자 인스턴스를 가져옵니다.
+
+    Args:
+        collection_name: PGVector 컬렉션 이름.
+
+    Returns:
+        컬렉션별로 캐시된 PGVectorIndexManager.
+    """
+    if collection_name not in _index_managers:
+        _index_managers[collection_name] = PGVectorIndexManager(
+            get_connection_string(),
+            collection_name=collection_name,
+            dimensions=get_embedding_dimensions(),
+        )
+    return _index_managers[collection_name]
+
+
+def get_hybrid_retriever_instance() -> PGHybridRetriever:
+    """하이브리드 검색기 인스턴스를 가져옵니다."""
+    global _hybrid_retriever
+    if _hybrid_retriever is None:
+        ef_search, probes = get_search_settings()
+        _hybrid_retriever = PGHybridRetriever(
+            connection_string=get_connection_string(),
+            embeddings=get_embeddings(),
+            k=5,
+            dense_weight=float(os.getenv("HYBRID_DENSE_WEIGHT", "1.0")),
+            sparse_weight=float(os.getenv("HYBRID_SPARSE_WEIGHT", "1.0")),
+            ef_search=ef_search,
+            probes=probes,
+        )
+    return _hybrid_retriever
+
+
+def create_answer_chain(llm, max_context_tokens: Optional[int] = None):
+    """검색된 문서로 답변을 생성하는 "stuff" 체인을 생성합니다.
+
+    문서를 토큰 예산에 맞춰 패킹(`pack_documents`)한 뒤 하나의 프롬프트에
+    넣어 LLM을 호출합니다.
 
     Args:
         llm: LangChain LLM 인스턴스
-        retriever: 검색기 (Retriever)
+        max_context_tokens: 컨텍스트 토큰 예산. None이면 RAG_MAX_CONTEXT_TOKENS를 사용합니다.
 
     Returns:
-        RAG 체인
+        {"documents": List[Document], "question": str}를 입력받아
+        {"answer": str, "packed_context": PackedContext, ...}를 반환하는 체인
     """
     # 프롬프트 템플릿
     prompt = ChatPromptTemplate.from_messages([
@@ -56,26 +140,62 @@ def create_rag_chain(llm, retriever):
         ("human", "{question}")
     ])
 
+    def pack_context(inputs: dict) -> PackedContext:
+        packed = pack_documents(inputs["documents"], max_tokens=max_context_tokens)
+        record_count("context_tokens", packed.token_count)
+        return packed
+
     # 체인 구성
+    chain = (
+        RunnablePassthrough.assign(packed_context=pack_context)
+        .assign(context=lambda inputs: inputs["packed_context"].context)
+        .with_config(run_name="pack_context")
+        | RunnablePassthrough.assign(answer=prompt | llm | StrOutputParser())
+    )
+
+    return chain
+
+
+def create_rag_chain(llm, retriever, max_context_tokens: Optional[int] = None):
+    """RAG 체인을 생성합니다.
+
+    Args:
+        llm: LangChain LLM 인스턴스
+        retriever: 검색기 (Retriever)
+        max_context_tokens: 컨텍스트 토큰 예산. None이면 RAG_MAX_CONTEXT_TOKENS를 사용합니다.
+
+    Returns:
+        질문을 입력받아 답변 문자열을 반환하는 RAG 체인
+    """
     chain = (
         {
-            "context": retriever,
+            "documents": retriever,
             "question": RunnablePassthrough()
         }
-        | prompt
-        | llm
-        | StrOutputParser()
+        | create_answer_chain(llm, max_context_tokens)
+        | itemgetter("answer")
     )
 
     return chain
 
 
+def get_answer_chain():
+    """검색 결과로 답변을 생성하는 체인을 가져옵니다."""
+    global _answer_chain
+    if _answer_chain is None:
+        _answer_chain = create_answer_chain(get_llm())
+    return _answer_chain
+
+
 def get_rag_chain():
     """RAG 체인을 가져옵니다."""
     global _rag_chain
     if _rag_chain is None:
-        vector_store = get_vector_store_instance()
-        retriever = vector_store.as_retriever(search_kwargs={"k": 5})
+        if is_hybrid_search_enabled():
+            retriever = get_hybrid_retriever_instance()
+        else:
+            vector_store = get_vector_store_instance()
+            retriever = vector_store.as_retriever(search_kwargs={"k": 5})
         llm = get_llm()
         _rag_chain = create_rag_chain(llm, retriever)
     return _rag_chain
@@ -91,25 +211,72 @@ def invoke_rag(query: str) -> str:
         생성된 답변.
     """
     rag_chain = get_rag_chain()
-    return rag_chain.invoke(query)
+    return rag_chain.invoke(query, config={"callbacks": get_tracing_callbacks()})
 
 
-def search_with_rag(query: str, k: int = 5) -> tuple[str, List[tuple[Document, float]]]:
-    """벡터 검색과 RAG 답변을 함께 반환합니다.
+def search_documents(
+    query: str,
+    k: int = 5,
+    ef_search: Optional[int] = None,
+    probes: Optional[int] = None,
+) -> List[tuple[Document, float]]:
+    """설정된 검색 방식으로 문서를 검색합니다.
 
     Args:
         query: 사용자 질문.
         k: 검색할 문서 수.
+        ef_search: 요청별 HNSW 검색 후보 수 (클수록 재현율↑, 지연 시간↑).
+        probes: 요청별 IVFFlat 탐색 리스트 수 (클수록 재현율↑, 지연 시간↑).
 
     Returns:
-        (답변, 검색 결과 리스트) 튜플.
+        (문서, 점수) 리스트. 덴스 검색의 점수는 거리(낮을수록 유사),
+        하이브리드 검색의 점수는 RRF 점수(높을수록 관련)입니다.
     """
+    ef_search, probes = get_search_settings(ef_search, probes)
+    if is_hybrid_search_enabled():
+        # 하이브리드 검색은 임베딩과 두 검색이 한 호출 안에서 이루어지므로 한 단계로 기록
+        with trace_stage("hybrid_search"):
+            return get_hybrid_retriever_instance().search_with_scores(
+                query, k=k, ef_search=ef_search, probes=probes
+            )
+
     vector_store = get_vector_store_instance()
-    search_results = vector_store.similarity_search_with_score(query, k=k)
+    with trace_stage("embedding"):
+        embedding = vector_store.embeddings.embed_query(query)
+    with trace_stage("vector_search"):
+        if ef_search is None and probes is None:
+            return vector_store.similarity_search_with_score_by_vector(embedding, k=k)
+        # 요청별 ANN 설정은 같은 트랜잭션의 SET LOCAL로 적용해야 하므로 직접 조회
+        return get_vector_index_manager().search_with_scores(
+            embedding, k=k, ef_search=ef_search, probes=probes
+        )
+
+
+def search_with_rag(
+    query: str, k: int = 5
+) -> tuple[str, List[tuple[Document, float]], Optional[PackedContext]]:
+    """벡터 검색과 RAG 답변을 함께 반환합니다.
+
+    검색 결과를 그대로 답변 체인의 컨텍스트로 사용하므로 검색은 한 번만 수행됩니다.
+
+    Args:
+        query: 사용자 질문.
+        k: 검색할 문서 수.
+
+    Returns:
+        (답변, 검색 결과 리스트, 패킹된 컨텍스트) 튜플. 점수는 search_documents()를
+        참고하세요. LLM을 사용할 수 없으면 패킹된 컨텍스트는 None입니다.
+    """
+    search_results = search_documents(query, k=k)
 
     try:
-        answer = invoke_rag(query)
+        result = get_answer_chain().invoke(
+            {"documents": [doc for doc, _ in search_results], "question": query},
+            config={"callbacks": get_tracing_callbacks()},
+        )
+        answer, packed_context = result["answer"], result["packed_context"]
     except ValueError:
         answer = "LLM 서비스를 사용할 수 없어 검색 결과만 제공합니다."
+        packed_context = None
 
-    return answer, search_results
+    return answer, search_results, packed_context
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import abc
+import bisect
+import itertools
 import time
 from abc import ABC, abstractmethod
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, TypedDict
 
 from typing_extensions import override
@@ -14,7 +17,7 @@ from langchain_core.retrievers import BaseRetriever
 from langchain_core.runnables import run_in_executor
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
 
     from langchain_core.documents import Document
 
@@ -237,8 +240,15 @@ class _Record(TypedDict):
     updated_at: float
 
 
+_get_updated_at = itemgetter(0)
+
+
 class InMemoryRecordManager(RecordManager):
-    """An in-memory record manager for testing purposes."""
+    """An in-memory record manager for testing purposes.
+
+    Records are indexed by update time and by group ID, so `list_keys` only visits
+    the records matching its filters instead of scanning all of them.
+    """
 
     def __init__(self, namespace: str) -> None:
         """Initialize the in-memory record manager.
@@ -251,6 +261,86 @@ class InMemoryRecordManager(RecordManager):
         # of {'group_id': group_id, 'updated_at': timestamp}
         self.records: dict[str, _Record] = {}
         self.namespace = namespace
+        # (updated_at, write_id, key) entries sorted by time. Updates and deletes
+        # leave the old entry behind, it is stale once `_write_ids` no longer
+        # points to its write_id and is dropped on compaction.
+        self._time_index: list[tuple[float, int, str]] = []
+        self._write_ids: dict[str, int] = {}
+        self._write_counter = itertools.count()
+        # group_id -> keys, the inner dicts are insertion-ordered sets
+        self._group_index: dict[str | None, dict[str, None]] = {}
+
+    def _is_current(self, entry: tuple[float, int, str]) -> bool:
+        return self._write_ids.get(entry[2]) == entry[1]
+
+    def _compact_time_index(self) -> None:
+        # Drop stale entries from the front, where cleanup deletes old records,
+        # and rebuild the index once it is mostly stale.
+        time_index = self._time_index
+        start = 0
+        while start < len(time_index) and not self._is_current(time_index[start]):
+            start += 1
+        if start:
+            del time_index[:start]
+        if len(time_index) > 2 * max(len(self.records), 512):
+            self._time_index = [e for e in time_index if self._is_current(e)]
+
+    def _discard_from_group(self, key: str, group_id: str | None) -> None:
+        group = self._group_index[group_id]
+        del group[key]
+        if not group:
+            del self._group_index[group_id]
+
+    def _upsert(self, key: str, group_id: str | None, updated_at: float) -> None:
+        previous = self.records.get(key)
+        if previous is not None and previous["group_id"] != group_id:
+            self._discard_from_group(key, previous["group_id"])
+        self.records[key] = {"group_id": group_id, "updated_at": updated_at}
+        self._group_index.setdefault(group_id, {})[key] = None
+
+        write_id = next(self._write_counter)
+        self._write_ids[key] = write_id
+        entry = (updated_at, write_id, key)
+        if self._time_index and self._time_index[-1][0] > updated_at:
+            bisect.insort(self._time_index, entry)
+        else:
+            # The clock is monotonic in the common case, so this is an append
+            self._time_index.append(entry)
+
+    def _iter_keys(
+        self,
+        *,
+        before: float | None = None,
+        after: float | None = None,
+        group_ids: Sequence[str] | None = None,
+    ) -> Iterator[str]:
+        if group_ids:
+            for group_id in dict.fromkeys(group_ids):
+                for key in self._group_index.get(group_id, {}):
+                    updated_at = self.records[key]["updated_at"]
+                    if before and updated_at >= before:
+                        continue
+                    if after and updated_at <= after:
+                        continue
+                    yield key
+            return
+        if not before and not after:
+            yield from self.records
+            return
+
+        self._compact_time_index()
+        time_index = self._time_index
+        start = (
+            bisect.bisect_right(time_index, after, key=_get_updated_at) if after else 0
+        )
+        end = (
+            bisect.bisect_left(time_index, before, key=_get_updated_at)
+            if before
+            else len(time_index)
+        )
+        for i in range(start, end):
+            if self._is_current(time_index[i]):
+                yield time_index[i][2]
 
     def create_schema(self) -> None:
         """In-memory schema creation is simply ensuring the structure is initialized."""
@@ -301,7 +391,8 @@ class InMemoryRecordManager(RecordManager):
             if time_at_least and time_at_least > self.get_time():
                 msg = "time_at_least must be in the past"
                 raise ValueError(msg)
-            self.records[key] = {"group_id": group_id, "updated_at": self.get_time()}
+            self._upsert(key, group_id, self.get_time())
+        self._compact_time_index()
 
     async def aupdate(
         self,
@@ -372,18 +463,9 @@ class InMemoryRecordManager(RecordManager):
         Returns:
             A list of keys for the matching records.
         """
-        result = []
-        for key, data in self.records.items():
-            if before and data["updated_at"] >= before:
-                continue
-            if after and data["updated_at"] <= after:
-                continue
-            if group_ids and data["group_id"] not in group_ids:
-                continue
-            result.append(key)
-        if limit:
-            return result[:limit]
-        return result
+        keys = self._iter_keys(before=before, after=after, group_ids=group_ids)
+        # Consume lazily so that a limit stops the scan early
+        return list(itertools.islice(keys, limit or None))
 
     async def alist_keys(
         self,
@@ -419,8 +501,12 @@ class InMemoryRecordManager(RecordManager):
             keys: A list of keys to delete.
         """
         for key in keys:
-            if key in self.records:
-                del self.records[key]
+            record = self.records.pop(key, None)
+            if record is None:
+                continue
+            del self._write_ids[key]
+            self._discard_from_group(key, record["group_id"])
+        self._compact_time_index()
 
     async def adelete_keys(self, keys: Sequence[str]) -> None:
         """Async delete specified records from the database.
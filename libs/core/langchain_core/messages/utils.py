@@ -10,7 +10,9 @@ Some examples of what you can do with these functions include:
 from __future__ import annotations
 
 import base64
+import bisect
 import inspect
+import itertools
 import json
 import logging
 import math
@@ -992,6 +994,7 @@ def trim_messages(
         raise ValueError(msg)
 
     messages = convert_to_messages(messages)
+    message_token_counter: Callable[[BaseMessage], int] | None = None
     if hasattr(token_counter, "get_num_tokens_from_messages"):
         list_token_counter = token_counter.get_num_tokens_from_messages
     elif callable(token_counter):
@@ -1003,8 +1006,10 @@ def trim_messages(
             def list_token_counter(messages: Sequence[BaseMessage]) -> int:
                 return sum(token_counter(msg) for msg in messages)  # type: ignore[arg-type, misc]
 
+            message_token_counter = cast("Callable[[BaseMessage], int]", token_counter)
         else:
             list_token_counter = token_counter
+            message_token_counter = _get_additive_token_counter(token_counter)
     else:
         msg = (
             f"'token_counter' expected to be a model that implements "
@@ -1028,6 +1033,7 @@ def trim_messages(
             text_splitter=text_splitter_fn,
             partial_strategy="first" if allow_partial else None,
             end_on=end_on,
+            message_token_counter=message_token_counter,
         )
     if strategy == "last":
         return _last_max_tokens(
@@ -1039,6 +1045,7 @@ def trim_messages(
             start_on=start_on,
             end_on=end_on,
             text_splitter=text_splitter_fn,
+            message_token_counter=message_token_counter,
         )
     msg = f"Unrecognized {strategy=}. Supported strategies are 'last' and 'first'."
     raise ValueError(msg)
@@ -1430,13 +1437,26 @@ def _first_max_tokens(
     text_splitter: Callable[[str], list[str]],
     partial_strategy: Literal["first", "last"] | None = None,
     end_on: str | type[BaseMessage] | Sequence[str | type[BaseMessage]] | None = None,
+    message_token_counter: Callable[[BaseMessage], int] | None = None,
 ) -> list[BaseMessage]:
     messages = list(messages)
     if not messages:
         return messages
 
+    # With an additive counter each message is counted exactly once and prefix
+    # counts are looked up instead of re-counting every candidate prefix.
+    prefix_counts: list[int] | None = None
+    if message_token_counter is not None:
+        prefix_counts = [
+            0,
+            *itertools.accumulate(message_token_counter(msg) for msg in messages),
+        ]
+        total_tokens = prefix_counts[-1]
+    else:
+        total_tokens = token_counter(messages)
+
     # Check if all messages already fit within token limit
-    if token_counter(messages) <= max_tokens:
+    if total_tokens <= max_tokens:
         # When all messages fit, only apply end_on filtering if needed
         if end_on:
             for _ in range(len(messages)):
@@ -1446,18 +1466,22 @@ def _first_max_tokens(
                     break
         return messages
 
-    # Use binary search to find the maximum number of messages within token limit
-    left, right = 0, len(messages)
-    max_iterations = len(messages).bit_length()
-    for _ in range(max_iterations):
-        if left >= right:
-            break
-        mid = (left + right + 1) // 2
-        if token_counter(messages[:mid]) <= max_tokens:
-            left = mid
-            idx = mid
-        else:
-            right = mid - 1
+    if prefix_counts is not None:
+        # Prefix counts are non-decreasing, so bisect finds the longest prefix
+        left = bisect.bisect_right(prefix_counts, max_tokens) - 1
+    else:
+        # Use binary search to find the maximum number of messages within token limit
+        left, right = 0, len(messages)
+        max_iterations = len(messages).bit_length()
+        for _ in range(max_iterations):
+            if left >= right:
+                break
+            mid = (left + right + 1) // 2
+            if token_counter(messages[:mid]) <= max_tokens:
+                left = mid
+                idx = mid
+            else:
+                right = mid - 1
 
     # idx now contains the maximum number of complete messages we can include
     idx = left
@@ -1473,7 +1497,11 @@ def _first_max_tokens(
                 excluded.content = list(reversed(excluded.content))
             for _ in range(1, num_block):
                 excluded.content = excluded.content[:-1]
-                if token_counter([*messages[:idx], excluded]) <= max_tokens:
+                if message_token_counter is not None and prefix_counts is not None:
+                    partial_count = prefix_counts[idx] + message_token_counter(excluded)
+                else:
+                    partial_count = token_counter([*messages[:idx], excluded])
+                if partial_count <= max_tokens:
                     messages = [*messages[:idx], excluded]
                     idx += 1
                     included_partial = True
@@ -1503,7 +1531,11 @@ def _first_max_tokens(
                     excluded = excluded.model_copy(deep=True)
 
                 split_texts = text_splitter(text)
-                base_message_count = token_counter(messages[:idx])
+                base_message_count = (
+                    prefix_counts[idx]
+                    if prefix_counts is not None
+                    else token_counter(messages[:idx])
+                )
                 if partial_strategy == "last":
                     split_texts = list(reversed(split_texts))
 
@@ -1515,7 +1547,12 @@ def _first_max_tokens(
                         break
                     mid = (left + right + 1) // 2
                     excluded.content = "".join(split_texts[:mid])
-                    if base_message_count + token_counter([excluded]) <= max_tokens:
+                    excluded_count = (
+                        message_token_counter(excluded)
+                        if message_token_counter is not None
+                        else token_counter([excluded])
+                    )
+                    if base_message_count + excluded_count <= max_tokens:
                         left = mid
                     else:
                         right = mid - 1
@@ -1548,6 +1585,7 @@ def _last_max_tokens(
     include_system: bool = False,
     start_on: str | type[BaseMessage] | Sequence[str | type[BaseMessage]] | None = None,
     end_on: str | type[BaseMessage] | Sequence[str | type[BaseMessage]] | None = None,
+    message_token_counter: Callable[[BaseMessage], int] | None = None,
 ) -> list[BaseMessage]:
     messages = list(messages)
     if len(messages) == 0:
@@ -1583,6 +1621,7 @@ def _last_max_tokens(
         text_splitter=text_splitter,
         partial_strategy="last" if allow_partial else None,
         end_on=start_on,
+        message_token_counter=message_token_counter,
     )
 
     # Re-reverse the messages and add back the system message if needed
@@ -1593,6 +1632,33 @@ def _last_max_tokens(
     return result
 
 
+def _get_additive_token_counter(
+    token_counter: Callable[..., int],
+) -> Callable[[BaseMessage], int] | None:
+    """Return a per-message counter if `token_counter` is known to be additive.
+
+    `count_tokens_approximately` rounds up per message, so the count of a list is the
+    sum of the counts of its messages as long as the per-message overhead is integral.
+    Arbitrary list counters may add per-conversation overhead and are not assumed to
+    be additive.
+    """
+    func: Callable[..., int] = token_counter
+    kwargs: dict[str, Any] = {}
+    if isinstance(token_counter, partial):
+        if token_counter.args:
+            return None
+        func, kwargs = token_counter.func, token_counter.keywords
+    if func is not count_tokens_approximately:
+        return None
+    if not float(kwargs.get("extra_tokens_per_message", 3.0)).is_integer():
+        return None
+
+    def message_token_counter(message: BaseMessage) -> int:
+        return count_tokens_approximately([message], **kwargs)
+
+    return message_token_counter
+
+
 _MSG_CHUNK_MAP: dict[type[BaseMessage], type[BaseMessageChunk]] = {
     HumanMessage: HumanMessageChunk,
     AIMessage: AIMessageChunk,
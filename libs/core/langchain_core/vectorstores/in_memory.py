@@ -111,6 +111,18 @@ class InMemoryVectorStore(VectorStore):
         * thud [{'bar': 'baz'}]
         ```
 
+    Search with stored embeddings:
+        ```python
+        # Attach the stored document embeddings and the query (with its
+        # embedding) to the results, e.g. for reuse by an `EmbeddingsFilter`
+        retriever = vector_store.as_retriever(
+            search_kwargs={
+                "embedding_key": "embedding",
+                "query_embedding_key": "query_embedding",
+            }
+        )
+        ```
+
     Search with score:
         ```python
         results = vector_store.similarity_search_with_score(query="qux", k=1)
@@ -335,6 +347,9 @@ class InMemoryVectorStore(VectorStore):
         embedding: list[float],
         k: int = 4,
         filter: Callable[[Document], bool] | None = None,  # noqa: A002
+        *,
+        embedding_key: str | None = None,
+        query_embedding_key: str | None = None,
         **_kwargs: Any,
     ) -> list[tuple[Document, float]]:
         """Search for the most similar documents to the given embedding.
@@ -343,16 +358,61 @@ class InMemoryVectorStore(VectorStore):
             embedding: The embedding to search for.
             k: The number of documents to return.
             filter: A function to filter the documents.
+            embedding_key: If set, the stored embedding of each document is added
+                to its metadata under this key, so that downstream components
+                (e.g. `EmbeddingsFilter`) do not need to embed it again.
+            query_embedding_key: If set, a `{"query": ..., "embedding": ...}` dict
+                with the query embedding is added to the metadata of each document
+                under this key. The query text is `None` when searching by vector.
 
         Returns:
             A list of tuples of Document objects and their similarity scores.
         """
-        return [
-            (doc, similarity)
-            for doc, similarity, _ in self._similarity_search_with_score_by_vector(
-                embedding=embedding, k=k, filter=filter
+        return self._search_with_embedding_keys(
+            embedding,
+            None,
+            k=k,
+            filter=filter,
+            embedding_key=embedding_key,
+            query_embedding_key=query_embedding_key,
+        )
+
+    def _search_with_embedding_keys(
+        self,
+        embedding: list[float],
+        query: str | None,
+        *,
+        k: int = 4,
+        filter: Callable[[Document], bool] | None = None,  # noqa: A002
+        embedding_key: str | None = None,
+        query_embedding_key: str | None = None,
+        **_kwargs: Any,
+    ) -> list[tuple[Document, float]]:
+        results = self._similarity_search_with_score_by_vector(
+            embedding=embedding, k=k, filter=filter
+        )
+        if embedding_key is None and query_embedding_key is None:
+            return [(doc, similarity) for doc, similarity, _ in results]
+
+        docs_and_scores = []
+        for doc, similarity, vector in results:
+            # Copy the metadata so the stored document is not modified
+            metadata = dict(doc.metadata)
+            if embedding_key is not None:
+                metadata[embedding_key] = vector
+            if query_embedding_key is not None:
+                # Keep the query text with its vector so consumers only reuse the
+                # vector for the same query
+                metadata[query_embedding_key] = {"query": query, "embedding": embedding}
+            docs_and_scores.append(
+                (
+                    Document(
+                        id=doc.id, page_content=doc.page_content, metadata=metadata
+                    ),
+                    similarity,
+                )
             )
-        ]
+        return docs_and_scores
 
     @override
     def similarity_search_with_score(
@@ -362,22 +422,14 @@ class InMemoryVectorStore(VectorStore):
         **kwargs: Any,
     ) -> list[tuple[Document, float]]:
         embedding = self.embedding.embed_query(query)
-        return self.similarity_search_with_score_by_vector(
-            embedding,
-            k,
-            **kwargs,
-        )
+        return self._search_with_embedding_keys(embedding, query, k=k, **kwargs)
 
     @override
     async def asimilarity_search_with_score(
         self, query: str, k: int = 4, **kwargs: Any
     ) -> list[tuple[Document, float]]:
         embedding = await self.embedding.aembed_query(query)
-        return self.similarity_search_with_score_by_vector(
-            embedding,
-            k,
-            **kwargs,
-        )
+        return self._search_with_embedding_keys(embedding, query, k=k, **kwargs)
 
     @override
     def similarity_search_by_vector(
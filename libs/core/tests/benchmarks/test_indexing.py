@@ -0,0 +1,88 @@
+import time
+from typing import Literal
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from typing_extensions import override
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.indexing import InMemoryRecordManager, index
+from langchain_core.vectorstores import InMemoryVectorStore
+
+
+class LatencyEmbedding(DeterministicFakeEmbedding):
+    """Fake embedding that sleeps like a remote embedding API call."""
+
+    latency: float = 0.005
+
+    @override
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        time.sleep(self.latency)
+        return super().embed_documents(texts)
+
+
+DOCUMENTS = [
+    Document(page_content=f"document {i}", metadata={"source": str(i % 50)})
+    for i in range(2_000)
+]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("max_concurrency", [None, 4])
+def test_index(benchmark: BenchmarkFixture, max_concurrency: int | None) -> None:
+    @benchmark  # type: ignore[misc]
+    def index_documents() -> None:
+        record_manager = InMemoryRecordManager(namespace="benchmark")
+        vector_store = InMemoryVectorStore(LatencyEmbedding(size=16))
+        index(
+            DOCUMENTS,
+            record_manager,
+            vector_store,
+            batch_size=100,
+            cleanup="scoped_full",
+            source_id_key="source",
+            key_encoder="sha256",
+            max_concurrency=max_concurrency,
+        )
+
+
+@pytest.fixture(scope="module")
+def reindex_documents() -> list[Document]:
+    return [
+        Document(
+            page_content=f"document {i} " * 20,
+            metadata={"source": str(i % 1_000), "page": i},
+        )
+        for i in range(100_000)
+    ]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("key_encoder", ["sha256", "blake2b", "blake2b_stream"])
+def test_reindex(
+    benchmark: BenchmarkFixture,
+    reindex_documents: list[Document],
+    key_encoder: Literal["sha256", "blake2b", "blake2b_stream"],
+) -> None:
+    """Reindex unchanged documents, which is bound by hashing and the record manager."""
+    record_manager = InMemoryRecordManager(namespace="benchmark")
+    vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=16))
+    index(
+        reindex_documents,
+        record_manager,
+        vector_store,
+        batch_size=1_000,
+        key_encoder=key_encoder,
+    )
+
+    @benchmark  # type: ignore[misc]
+    def reindex() -> None:
+        result = index(
+            reindex_documents,
+            record_manager,
+            vector_store,
+            batch_size=1_000,
+            key_encoder=key_encoder,
+        )
+        assert result["num_skipped"] == len(reindex_documents)
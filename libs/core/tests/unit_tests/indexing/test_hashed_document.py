@@ -1,7 +1,16 @@
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 
+import pytest
+
 from langchain_core.documents import Document
-from langchain_core.indexing.api import _get_document_with_hash
+from langchain_core.indexing.api import (
+    _ahash_documents,
+    _get_document_with_hash,
+    _hash_documents,
+)
 
 
 def test_hashed_document_hashing() -> None:
@@ -63,3 +72,83 @@ def test_hashing_custom_key_encoder() -> None:
     hashed_document = _get_document_with_hash(document, key_encoder=custom_key_encoder)
     assert hashed_document.id == "quack-like a duck"
     assert isinstance(hashed_document.id, str)
+
+
+@pytest.mark.parametrize("key_encoder", ["sha256", "sha512", "blake2b"])
+def test_hashing_is_stable(key_encoder: Literal["sha256", "sha512", "blake2b"]) -> None:
+    """Test that the built-in encoders keep the IDs of existing indexes."""
+    document = Document(
+        page_content="Lorem ipsum dolor sit amet", metadata={"b": [1, 2], "a": "é"}
+    )
+
+    def _hash(text: str) -> str:
+        return hashlib.new(key_encoder, text.encode("utf-8")).hexdigest()
+
+    expected = _hash(
+        _hash(document.page_content)
+        + _hash(json.dumps(document.metadata, sort_keys=True))
+    )
+    assert _get_document_with_hash(document, key_encoder=key_encoder).id == expected
+
+
+def test_hashing_blake2b_stream() -> None:
+    """Test the single pass key encoder."""
+    document = Document(page_content="ab", metadata={"key": "value", "other": 1})
+    hashed_document = _get_document_with_hash(document, key_encoder="blake2b_stream")
+    assert (
+        hashed_document.id
+        == _get_document_with_hash(
+            Document(page_content="ab", metadata={"other": 1, "key": "value"}),
+            key_encoder="blake2b_stream",
+        ).id
+    )
+    assert (
+        hashed_document.id
+        != _get_document_with_hash(document, key_encoder="blake2b").id
+    )
+    # The content is length-prefixed, so moving bytes between the content and
+    # the metadata changes the hash
+    assert (
+        _get_document_with_hash(
+            Document(page_content="a{}"), key_encoder="blake2b_stream"
+        ).id
+        != _get_document_with_hash(
+            Document(page_content="a", metadata={}), key_encoder="blake2b_stream"
+        ).id
+    )
+
+
+def _make_duplicated_docs() -> list[Document]:
+    return [
+        Document(page_content=f"document {i % 300}", metadata={"i": i % 300})
+        for i in range(600)
+    ]
+
+
+@pytest.mark.parametrize("key_encoder", ["sha1", "blake2b_stream"])
+def test_hash_documents_with_executor(
+    key_encoder: Literal["sha1", "blake2b_stream"],
+) -> None:
+    """Test that hashing in an executor matches hashing inline."""
+    docs = _make_duplicated_docs()
+    expected = _hash_documents(docs, key_encoder)
+    assert len(expected) == 300
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert _hash_documents(docs, key_encoder, executor) == expected
+
+
+@pytest.mark.parametrize("key_encoder", ["sha1", "blake2b_stream"])
+async def test_ahash_documents_with_executor(
+    key_encoder: Literal["sha1", "blake2b_stream"],
+) -> None:
+    """Test that async hashing in an executor matches hashing inline."""
+    docs = _make_duplicated_docs()
+    expected = _hash_documents(docs, key_encoder)
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        assert await _ahash_documents(docs, key_encoder, executor) == expected
+    finally:
+        # Joining the worker threads would block the event loop.
+        executor.shutdown(wait=False)
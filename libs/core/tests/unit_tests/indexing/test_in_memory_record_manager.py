@@ -277,3 +277,56 @@ async def test_adelete_keys(amanager: InMemoryRecordManager) -> None:
     # Check if the deleted keys are no longer in the database
     remaining_keys = await amanager.alist_keys()
     assert remaining_keys == ["key3"]
+
+
+def test_list_keys_matches_full_scan(manager: InMemoryRecordManager) -> None:
+    """Test the time and group indexes against a scan of all records."""
+    times = iter([5.0, 1.0, 3.0, 3.0, 2.0, 7.0, 4.0, 6.0, 0.5, 8.0] * 60)
+    with patch.object(manager, "get_time", side_effect=lambda: next(times)):
+        for i in range(300):
+            group = f"group{i % 4}" if i % 5 else None
+            manager.update([f"key{i % 50}"], group_ids=[group])
+            if i % 7 == 0:
+                manager.delete_keys([f"key{(i * 3) % 50}"])
+
+    def scan(
+        before: float | None, after: float | None, group_ids: list[str] | None
+    ) -> list[str]:
+        return [
+            key
+            for key, record in manager.records.items()
+            if not (before and record["updated_at"] >= before)
+            and not (after and record["updated_at"] <= after)
+            and not (group_ids and record["group_id"] not in group_ids)
+        ]
+
+    for before, after, group_ids in [
+        (None, None, None),
+        (4.0, None, None),
+        (None, 3.0, None),
+        (6.0, 1.0, None),
+        (None, None, ["group1", "group3"]),
+        (5.0, 2.0, ["group0", "group2", "group0"]),
+        (None, None, ["missing"]),
+    ]:
+        expected = scan(before, after, group_ids)
+        keys = manager.list_keys(before=before, after=after, group_ids=group_ids)
+        assert sorted(keys) == sorted(expected)
+        assert len(manager.list_keys(before=before, after=after, limit=3)) == min(
+            3, len(scan(before, after, None))
+        )
+
+
+def test_list_keys_before_during_cleanup(manager: InMemoryRecordManager) -> None:
+    """Test deleting the oldest records in batches, as full cleanup does."""
+    times = iter(range(1, 1001))
+    with patch.object(manager, "get_time", side_effect=lambda: float(next(times))):
+        manager.update([f"key{i}" for i in range(1000)])
+
+    deleted = 0
+    while keys := manager.list_keys(before=901.0, limit=64):
+        deleted += len(keys)
+        manager.delete_keys(keys)
+    assert deleted == 900
+    assert sorted(manager.list_keys()) == sorted(f"key{i}" for i in range(900, 1000))
+    assert len(manager._time_index) == 100
@@ -1,13 +1,17 @@
+import threading
+import time
 from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from datetime import datetime, timezone
 from typing import (
     Any,
+    Literal,
 )
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import pytest_asyncio
 from pytest_mock import MockerFixture
+from typing_extensions import override
 
 from langchain_core.document_loaders.base import BaseLoader
 from langchain_core.documents import Document
@@ -2940,3 +2944,131 @@ async def test_aindex_with_upsert_kwargs(
         # Check other arguments
         assert kwargs["batch_size"] == 100
         assert kwargs["vector_field"] == "embedding"
+
+
+def _pipeline_docs(version: str) -> list[Document]:
+    # Duplicates across batches exercise the in-flight bookkeeping
+    return [
+        Document(
+            page_content=f"{version} {i % 13}",
+            metadata={"source": str(i % 5)},
+        )
+        for i in range(40)
+    ]
+
+
+@pytest.mark.parametrize("cleanup", [None, "incremental", "full", "scoped_full"])
+def test_index_max_concurrency_matches_sequential(
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+) -> None:
+    results = []
+    stores = []
+    for max_concurrency in (None, 3):
+        record_manager = InMemoryRecordManager(namespace="hello")
+        vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+        runs = []
+        for version in ("v1", "v1", "v2"):
+            result = index(
+                _pipeline_docs(version),
+                record_manager,
+                vector_store,
+                batch_size=4,
+                cleanup=cleanup,
+                source_id_key="source",
+                key_encoder="sha256",
+                max_concurrency=max_concurrency,
+            )
+            runs.append(
+                (
+                    result["num_added"],
+                    result["num_updated"],
+                    result["num_skipped"],
+                    result["num_deleted"],
+                )
+            )
+        results.append(runs)
+        stores.append(sorted(vector_store.store))
+        if max_concurrency is not None:
+            assert result["num_batches"] == 10
+            assert result["docs_per_second"] > 0
+
+    assert results[0] == results[1]
+    assert stores[0] == stores[1]
+
+
+@pytest.mark.parametrize("cleanup", [None, "incremental", "full", "scoped_full"])
+async def test_aindex_max_concurrency_matches_sequential(
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+) -> None:
+    results = []
+    stores = []
+    for max_concurrency in (None, 3):
+        record_manager = InMemoryRecordManager(namespace="hello")
+        vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+        runs = []
+        for version in ("v1", "v1", "v2"):
+            result = await aindex(
+                _pipeline_docs(version),
+                record_manager,
+                vector_store,
+                batch_size=4,
+                cleanup=cleanup,
+                source_id_key="source",
+                key_encoder="sha256",
+                max_concurrency=max_concurrency,
+            )
+            runs.append(
+                (
+                    result["num_added"],
+                    result["num_updated"],
+                    result["num_skipped"],
+                    result["num_deleted"],
+                )
+            )
+        results.append(runs)
+        stores.append(sorted(vector_store.store))
+
+    assert results[0] == results[1]
+    assert stores[0] == stores[1]
+
+
+class _SlowVectorStore(InMemoryVectorStore):
+    """Vector store that records how many writes overlap."""
+
+    def __init__(self) -> None:
+        super().__init__(DeterministicFakeEmbedding(size=5))
+        self._lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    @override
+    def add_documents(
+        self, documents: list[Document], ids: list[str] | None = None, **kwargs: Any
+    ) -> list[str]:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+        return super().add_documents(documents, ids=ids, **kwargs)
+
+
+def test_index_max_concurrency_overlaps_writes(
+    record_manager: InMemoryRecordManager,
+) -> None:
+    vector_store = _SlowVectorStore()
+    docs = [Document(page_content=str(i)) for i in range(40)]
+
+    result = index(
+        docs,
+        record_manager,
+        vector_store,
+        batch_size=4,
+        key_encoder="sha256",
+        max_concurrency=4,
+    )
+
+    assert result["num_added"] == 40
+    assert vector_store.max_active > 1
+    assert len(vector_store.store) == 40
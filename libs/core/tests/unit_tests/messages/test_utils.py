@@ -2,7 +2,8 @@ import base64
 import json
 import re
 from collections.abc import Callable, Sequence
-from typing import Any, TypedDict
+from functools import partial
+from typing import Any, Literal, TypedDict
 
 import pytest
 from typing_extensions import NotRequired, override
@@ -673,6 +674,60 @@ def test_trim_messages_start_on_with_allow_partial() -> None:
     assert messages == messages_copy
 
 
+def test_trim_messages_per_message_counter_counts_each_message_once() -> None:
+    messages = [HumanMessage(content=f"message {i}", id=str(i)) for i in range(32)]
+    counted: list[str | None] = []
+
+    def count_message(message: BaseMessage) -> int:
+        counted.append(message.id)
+        return 10
+
+    result = trim_messages(
+        messages,
+        max_tokens=55,
+        token_counter=count_message,
+        strategy="last",
+    )
+
+    assert result == messages[-5:]
+    assert sorted(counted, key=int) == [m.id for m in messages]
+
+
+@pytest.mark.parametrize("strategy", ["first", "last"])
+@pytest.mark.parametrize("allow_partial", [True, False])
+def test_trim_messages_approximate_counter_matches_list_counter(
+    strategy: Literal["first", "last"], *, allow_partial: bool
+) -> None:
+    messages: list[BaseMessage] = [
+        SystemMessage("You are a helpful assistant."),
+        HumanMessage("What is the capital of France? " * 3),
+        AIMessage("Paris is the capital of France. " * 5),
+        HumanMessage([{"type": "text", "text": "And Germany? " * 4}]),
+        AIMessage("Berlin."),
+    ]
+    counter = partial(count_tokens_approximately, chars_per_token=3.3)
+
+    def list_counter(msgs: list[BaseMessage]) -> int:
+        return counter(msgs)
+
+    for max_tokens in range(0, 120, 7):
+        expected = trim_messages(
+            messages,
+            max_tokens=max_tokens,
+            token_counter=list_counter,
+            strategy=strategy,
+            allow_partial=allow_partial,
+        )
+        actual = trim_messages(
+            messages,
+            max_tokens=max_tokens,
+            token_counter=counter,
+            strategy=strategy,
+            allow_partial=allow_partial,
+        )
+        assert actual == expected
+
+
 class FakeTokenCountingModel(FakeChatModel):
     @override
     def get_num_tokens_from_messages(
@@ -117,6 +117,40 @@ async def test_inmemory_filter() -> None:
     assert output == []
 
 
+async def test_inmemory_search_with_embedding_keys() -> None:
+    """Test attaching stored and query embeddings to the search results."""
+    embeddings = DeterministicFakeEmbedding(size=6)
+    store = await InMemoryVectorStore.afrom_texts(
+        ["foo", "bar"], embeddings, [{"id": 1}, {"id": 2}]
+    )
+    retriever = store.as_retriever(
+        search_kwargs={
+            "k": 1,
+            "embedding_key": "embedding",
+            "query_embedding_key": "query_embedding",
+        }
+    )
+
+    for output in (retriever.invoke("foo"), await retriever.ainvoke("foo")):
+        assert len(output) == 1
+        assert output[0].page_content == "foo"
+        assert output[0].metadata["id"] == 1
+        assert output[0].metadata["embedding"] == embeddings.embed_query("foo")
+        assert output[0].metadata["query_embedding"] == {
+            "query": "foo",
+            "embedding": embeddings.embed_query("foo"),
+        }
+
+    # Searching by vector does not know the query text
+    output = store.similarity_search_by_vector(
+        embeddings.embed_query("foo"), k=1, query_embedding_key="query_embedding"
+    )
+    assert output[0].metadata["query_embedding"]["query"] is None
+
+    # The stored documents are not modified
+    assert store.similarity_search("foo", k=1)[0].metadata == {"id": 1}
+
+
 async def test_inmemory_filter_by_document_id() -> None:
     """Test filtering by document ID field."""
     embedding = DeterministicFakeEmbedding(size=6)
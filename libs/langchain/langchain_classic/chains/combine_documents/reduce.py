@@ -8,6 +8,7 @@ from typing import Any, Protocol
 from langchain_core._api import deprecated
 from langchain_core.callbacks import Callbacks
 from langchain_core.documents import Document
+from langchain_core.runnables import RunnableConfig
 from pydantic import ConfigDict
 
 from langchain_classic.chains.combine_documents.base import BaseCombineDocumentsChain
@@ -64,6 +65,60 @@ def split_list_of_docs(
     return new_result_doc_list
 
 
+def _pack_docs(
+    docs: list[Document],
+    length_func: Callable,
+    token_max: int,
+    **kwargs: Any,
+) -> list[list[Document]]:
+    """Greedily pack documents into groups that fit `token_max`.
+
+    Same grouping as `split_list_of_docs`, but each document's length is computed
+    once, on its own, rather than re-computing the length of a growing group for
+    every document. Group lengths are estimated from the per-document lengths and
+    the length of the prompt without documents, then checked with one call to
+    `length_func` per group. If the estimate was too low, documents are moved to
+    the next group until the group fits.
+    """
+    base = length_func([], **kwargs)
+    costs = [length_func([doc], **kwargs) - base for doc in docs]
+    # Tokens added by joining two documents, e.g. the document separator
+    separator = 0
+    if len(docs) > 1:
+        separator = max(length_func(docs[:2], **kwargs) - base - costs[0] - costs[1], 0)
+
+    groups: list[list[Document]] = []
+    start = 0
+    while start < len(docs):
+        if base + costs[start] > token_max:
+            msg = (
+                "A single document was longer than the context length,"
+                " we cannot handle this."
+            )
+            raise ValueError(msg)
+        end = start + 1
+        estimate = base + costs[start]
+        while end < len(docs) and estimate + separator + costs[end] <= token_max:
+            estimate += separator + costs[end]
+            end += 1
+        while end - start > 1 and length_func(docs[start:end], **kwargs) > token_max:
+            end -= 1
+        groups.append(docs[start:end])
+        start = end
+    return groups
+
+
+def _combine_metadata(docs: list[Document]) -> dict[str, Any]:
+    combined_metadata = {k: str(v) for k, v in docs[0].metadata.items()}
+    for doc in docs[1:]:
+        for k, v in doc.metadata.items():
+            if k in combined_metadata:
+                combined_metadata[k] += f", {v}"
+            else:
+                combined_metadata[k] = str(v)
+    return combined_metadata
+
+
 def collapse_docs(
     docs: list[Document],
     combine_document_func: CombineDocsProtocol,
@@ -86,14 +141,7 @@ def collapse_docs(
             the values are joined by `', '`.
     """
     result = combine_document_func(docs, **kwargs)
-    combined_metadata = {k: str(v) for k, v in docs[0].metadata.items()}
-    for doc in docs[1:]:
-        for k, v in doc.metadata.items():
-            if k in combined_metadata:
-                combined_metadata[k] += f", {v}"
-            else:
-                combined_metadata[k] = str(v)
-    return Document(page_content=result, metadata=combined_metadata)
+    return Document(page_content=result, metadata=_combine_metadata(docs))
 
 
 async def acollapse_docs(
@@ -118,14 +166,7 @@ async def acollapse_docs(
             the values are joined by `', '`.
     """
     result = await combine_document_func(docs, **kwargs)
-    combined_metadata = {k: str(v) for k, v in docs[0].metadata.items()}
-    for doc in docs[1:]:
-        for k, v in doc.metadata.items():
-            if k in combined_metadata:
-                combined_metadata[k] += f", {v}"
-            else:
-                combined_metadata[k] = str(v)
-    return Document(page_content=result, metadata=combined_metadata)
+    return Document(page_content=result, metadata=_combine_metadata(docs))
 
 
 @deprecated(
@@ -226,6 +267,12 @@ class ReduceDocumentsChain(BaseCombineDocumentsChain):
 
     Otherwise, after it reaches the max number, it will throw an error.
     """
+    collapse_max_concurrency: int | None = None
+    """The maximum number of document groups collapsed concurrently.
+
+    The groups of a collapse round are independent, so they are collapsed with
+    `batch`/`abatch`. If `None`, the concurrency is not limited.
+    """
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -238,6 +285,12 @@ class ReduceDocumentsChain(BaseCombineDocumentsChain):
             return self.collapse_documents_chain
         return self.combine_documents_chain
 
+    def _get_collapse_config(self, callbacks: Callbacks) -> RunnableConfig:
+        return {
+            "callbacks": callbacks,
+            "max_concurrency": self.collapse_max_concurrency,
+        }
+
     def combine_docs(
         self,
         docs: list[Document],
@@ -316,26 +369,28 @@ class ReduceDocumentsChain(BaseCombineDocumentsChain):
         result_docs = docs
         length_func = self.combine_documents_chain.prompt_length
         num_tokens = length_func(result_docs, **kwargs)
-
-        def _collapse_docs_func(docs: list[Document], **kwargs: Any) -> str:
-            return self._collapse_chain.run(
-                input_documents=docs,
-                callbacks=callbacks,
-                **kwargs,
-            )
+        config = self._get_collapse_config(callbacks)
+        output_key = self._collapse_chain._run_output_key  # noqa: SLF001
 
         _token_max = token_max or self.token_max
         retries: int = 0
         while num_tokens is not None and num_tokens > _token_max:
-            new_result_doc_list = split_list_of_docs(
+            new_result_doc_list = _pack_docs(
                 result_docs,
                 length_func,
                 _token_max,
                 **kwargs,
             )
+            outputs = self._collapse_chain.batch(
+                [{"input_documents": docs_, **kwargs} for docs_ in new_result_doc_list],
+                config=config,
+            )
             result_docs = [
-                collapse_docs(docs_, _collapse_docs_func, **kwargs)
-                for docs_ in new_result_doc_list
+                Document(
+                    page_content=output[output_key],
+                    metadata=_combine_metadata(docs_),
+                )
+                for docs_, output in zip(new_result_doc_list, outputs, strict=True)
             ]
             num_tokens = length_func(result_docs, **kwargs)
             retries += 1
@@ -355,26 +410,28 @@ class ReduceDocumentsChain(BaseCombineDocumentsChain):
         result_docs = docs
         length_func = self.combine_documents_chain.prompt_length
         num_tokens = length_func(result_docs, **kwargs)
-
-        async def _collapse_docs_func(docs: list[Document], **kwargs: Any) -> str:
-            return await self._collapse_chain.arun(
-                input_documents=docs,
-                callbacks=callbacks,
-                **kwargs,
-            )
+        config = self._get_collapse_config(callbacks)
+        output_key = self._collapse_chain._run_output_key  # noqa: SLF001
 
         _token_max = token_max or self.token_max
         retries: int = 0
         while num_tokens is not None and num_tokens > _token_max:
-            new_result_doc_list = split_list_of_docs(
+            new_result_doc_list = _pack_docs(
                 result_docs,
                 length_func,
                 _token_max,
                 **kwargs,
             )
+            outputs = await self._collapse_chain.abatch(
+                [{"input_documents": docs_, **kwargs} for docs_ in new_result_doc_list],
+                config=config,
+            )
             result_docs = [
-                await acollapse_docs(docs_, _collapse_docs_func, **kwargs)
-                for docs_ in new_result_doc_list
+                Document(
+                    page_content=output[output_key],
+                    metadata=_combine_metadata(docs_),
+                )
+                for docs_, output in zip(new_result_doc_list, outputs, strict=True)
             ]
             num_tokens = length_func(result_docs, **kwargs)
             retries += 1
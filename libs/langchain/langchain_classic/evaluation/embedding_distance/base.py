@@ -2,6 +2,7 @@
 
 import functools
 import logging
+from collections.abc import Sequence
 from enum import Enum
 from importlib import util
 from typing import Any
@@ -342,6 +343,71 @@ class _EmbeddingDistanceChainMixin(Chain):
             score = metric(vectors[0], vectors[1])
         return float(score)
 
+    def _compute_scores(self, a: Any, b: Any) -> Any:
+        """Compute the distance metric between corresponding rows of two matrices.
+
+        Args:
+            a (np.ndarray): The first matrix, one vector per row.
+            b (np.ndarray): The second matrix, one vector per row.
+
+        Returns:
+            np.ndarray: The distance for each pair of rows.
+        """
+        np = _import_numpy()
+        if self.distance_metric == EmbeddingDistance.COSINE:
+            norms = np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                similarity = np.einsum("ij,ij->i", a, b) / norms
+            undefined = np.flatnonzero(~np.isfinite(similarity))
+            if len(undefined):
+                # A single pair with a zero vector makes `_cosine_similarity` (and so
+                # `_compute_score`) raise, so the batch does the same
+                msg = (
+                    "NaN values found, please remove the NaN values and try again "
+                    f"(cosine distance undefined for example {int(undefined[0])})"
+                )
+                raise ValueError(msg)
+            return 1.0 - similarity
+        if self.distance_metric == EmbeddingDistance.EUCLIDEAN:
+            return np.linalg.norm(a - b, axis=1)
+        if self.distance_metric == EmbeddingDistance.MANHATTAN:
+            return np.abs(a - b).sum(axis=1)
+        if self.distance_metric == EmbeddingDistance.CHEBYSHEV:
+            return np.abs(a - b).max(axis=1)
+        if self.distance_metric == EmbeddingDistance.HAMMING:
+            return (a != b).mean(axis=1)
+        msg = f"Invalid metric: {self.distance_metric}"  # type: ignore[unreachable]
+        raise ValueError(msg)
+
+    def _prepare_batch_output(self, scores: Any) -> dict[str, Any]:
+        if not len(scores):
+            return {"scores": [], "mean": None, "std": None, "min": None, "max": None}
+        return {
+            "scores": scores.tolist(),
+            "mean": float(scores.mean()),
+            "std": float(scores.std()),
+            "min": float(scores.min()),
+            "max": float(scores.max()),
+        }
+
+
+def _unique_texts(
+    a: Sequence[str], b: Sequence[str]
+) -> tuple[list[str], list[int], list[int]]:
+    """Deduplicate the texts of two aligned sequences.
+
+    Returns:
+        The unique texts in first-seen order, and the position of each text of `a`
+        and `b` in that list.
+    """
+    if len(a) != len(b):
+        msg = f"Got {len(a)} predictions but {len(b)} references."
+        raise ValueError(msg)
+    positions: dict[str, int] = {}
+    a_idx = [positions.setdefault(text, len(positions)) for text in a]
+    b_idx = [positions.setdefault(text, len(positions)) for text in b]
+    return list(positions), a_idx, b_idx
+
 
 class EmbeddingDistanceEvalChain(_EmbeddingDistanceChainMixin, StringEvaluator):
     """Embedding distance evaluation chain.
@@ -502,6 +568,88 @@ class EmbeddingDistanceEvalChain(_EmbeddingDistanceChainMixin, StringEvaluator):
         )
         return self._prepare_output(result)
 
+    def evaluate_strings_batch(
+        self,
+        predictions: Sequence[str],
+        references: Sequence[str],
+        *,
+        batch_size: int = 1000,
+    ) -> dict[str, Any]:
+        """Evaluate the embedding distance for a whole dataset at once.
+
+        Every unique string is embedded once, in `embed_documents` calls of up to
+        `batch_size` texts, and all distances are computed in one vectorized NumPy
+        operation. Wrap `embeddings` in a `CacheBackedEmbeddings` to also reuse
+        embeddings across evaluation runs.
+
+        Unlike `evaluate_strings`, this does not create a chain run per example,
+        so no callbacks are invoked. Scores are the same as those of
+        `evaluate_strings`; as there, a zero embedding vector with the cosine
+        metric raises a `ValueError`.
+
+        Args:
+            predictions: The output strings to evaluate.
+            references: The reference string for each prediction.
+            batch_size: Maximum number of texts per embedding request.
+
+        Returns:
+            `dict` containing:
+                - scores: The embedding distance of each prediction, in order.
+                - mean, std, min, max: Aggregates of the scores, or `None` if the
+                  dataset is empty.
+
+        Raises:
+            ValueError: If `predictions` and `references` differ in length, or if
+                a cosine distance is undefined because of a zero vector.
+        """
+        np = _import_numpy()
+        texts, pred_idx, ref_idx = _unique_texts(predictions, references)
+        if not texts:
+            return self._prepare_batch_output(np.empty(0))
+        vectors = [
+            vector
+            for i in range(0, len(texts), batch_size)
+            for vector in self.embeddings.embed_documents(texts[i : i + batch_size])
+        ]
+        matrix = np.array(vectors, dtype=float)
+        scores = self._compute_scores(matrix[pred_idx], matrix[ref_idx])
+        return self._prepare_batch_output(scores)
+
+    async def aevaluate_strings_batch(
+        self,
+        predictions: Sequence[str],
+        references: Sequence[str],
+        *,
+        batch_size: int = 1000,
+    ) -> dict[str, Any]:
+        """Asynchronously evaluate the embedding distance for a whole dataset.
+
+        See `evaluate_strings_batch`.
+
+        Args:
+            predictions: The output strings to evaluate.
+            references: The reference string for each prediction.
+            batch_size: Maximum number of texts per embedding request.
+
+        Returns:
+            `dict` containing:
+                - scores: The embedding distance of each prediction, in order.
+                - mean, std, min, max: Aggregates of the scores, or `None` if the
+                  dataset is empty.
+        """
+        np = _import_numpy()
+        texts, pred_idx, ref_idx = _unique_texts(predictions, references)
+        if not texts:
+            return self._prepare_batch_output(np.empty(0))
+        vectors = []
+        for i in range(0, len(texts), batch_size):
+            vectors.extend(
+                await self.embeddings.aembed_documents(texts[i : i + batch_size])
+            )
+        matrix = np.array(vectors, dtype=float)
+        scores = self._compute_scores(matrix[pred_idx], matrix[ref_idx])
+        return self._prepare_batch_output(scores)
+
 
 class PairwiseEmbeddingDistanceEvalChain(
     _EmbeddingDistanceChainMixin,
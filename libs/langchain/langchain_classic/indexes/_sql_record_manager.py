@@ -79,9 +79,22 @@ class UpsertionRecord(Base):  # type: ignore[valid-type,misc]
     __table_args__ = (
         UniqueConstraint("key", "namespace", name="uix_key_namespace"),
         Index("ix_key_namespace", "key", "namespace"),
+        # Serve the `list_keys` filters used by cleanup with index range scans
+        Index("ix_namespace_updated_at", "namespace", "updated_at"),
+        Index(
+            "ix_namespace_group_id_updated_at", "namespace", "group_id", "updated_at"
+        ),
     )
 
 
+def _create_all(connection: Any) -> None:
+    Base.metadata.create_all(connection)
+    # `create_all` skips tables that already exist, so add indexes introduced
+    # after the table was created
+    for index in UpsertionRecord.__table__.indexes:
+        index.create(connection, checkfirst=True)
+
+
 class SQLRecordManager(RecordManager):
     """A SQL Alchemy based implementation of the record manager."""
 
@@ -151,7 +164,8 @@ class SQLRecordManager(RecordManager):
             msg = "This method is not supported for async engines."
             raise AssertionError(msg)  # noqa: TRY004
 
-        Base.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            _create_all(connection)
 
     async def acreate_schema(self) -> None:
         """Create the database schema."""
@@ -160,7 +174,7 @@ class SQLRecordManager(RecordManager):
             raise AssertionError(msg)  # noqa: TRY004
 
         async with self.engine.begin() as session:
-            await session.run_sync(Base.metadata.create_all)
+            await session.run_sync(_create_all)
 
     @contextlib.contextmanager
     def _make_session(self) -> Generator[Session, None, None]:
@@ -459,7 +473,7 @@ class SQLRecordManager(RecordManager):
         """List records in the SQLite database based on the provided date range."""
         session: Session
         with self._make_session() as session:
-            query: Query = session.query(UpsertionRecord).filter(
+            query: Query = session.query(UpsertionRecord.key).filter(
                 UpsertionRecord.namespace == self.namespace,
             )
 
@@ -0,0 +1,107 @@
+"""Helpers for running an LLM chain over many documents with batching and caching."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from langchain_core.runnables import Runnable, RunnableConfig
+
+
+def _get_chain_input_key(chain_input: dict[str, Any]) -> str:
+    """Hash a chain input (e.g. the query and a document's content) into a cache key."""
+    serialized = json.dumps(chain_input, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class _ChainOutputCache:
+    """Thread-safe LRU cache of parsed chain outputs keyed by the chain input."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._outputs: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            if key not in self._outputs:
+                return False, None
+            self._outputs.move_to_end(key)
+            return True, self._outputs[key]
+
+    def set(self, key: str, output: Any) -> None:
+        with self._lock:
+            self._outputs[key] = output
+            self._outputs.move_to_end(key)
+            while len(self._outputs) > self.maxsize:
+                self._outputs.popitem(last=False)
+
+
+def _lookup(
+    inputs: Sequence[dict[str, Any]],
+    cache: _ChainOutputCache | None,
+) -> tuple[list[Any], list[int], list[str]]:
+    """Get cached outputs, the indices of the inputs to run and all cache keys."""
+    outputs: list[Any] = [None] * len(inputs)
+    if cache is None:
+        return outputs, list(range(len(inputs))), []
+    keys = [_get_chain_input_key(chain_input) for chain_input in inputs]
+    missing = []
+    for i, key in enumerate(keys):
+        hit, output = cache.get(key)
+        if hit:
+            outputs[i] = output
+        else:
+            missing.append(i)
+    return outputs, missing, keys
+
+
+def batch_with_cache(
+    chain: Runnable,
+    inputs: Sequence[dict[str, Any]],
+    config: RunnableConfig,
+    parse: Callable[[Any], Any],
+    cache: _ChainOutputCache | None = None,
+) -> list[Any]:
+    """Run the chain on the inputs not in the cache as one batch.
+
+    Args:
+        chain: The chain to run.
+        inputs: The chain inputs.
+        config: The config for the batch, e.g. with `max_concurrency`.
+        parse: Function turning a raw chain output into the value to return and cache.
+        cache: Optional cache of parsed outputs.
+
+    Returns:
+        The parsed outputs, in the order of the inputs.
+    """
+    outputs, missing, keys = _lookup(inputs, cache)
+    if missing:
+        raw_outputs = chain.batch([inputs[i] for i in missing], config=config)
+        for i, raw_output in zip(missing, raw_outputs, strict=True):
+            outputs[i] = parse(raw_output)
+            if cache is not None:
+                cache.set(keys[i], outputs[i])
+    return outputs
+
+
+async def abatch_with_cache(
+    chain: Runnable,
+    inputs: Sequence[dict[str, Any]],
+    config: RunnableConfig,
+    parse: Callable[[Any], Any],
+    cache: _ChainOutputCache | None = None,
+) -> list[Any]:
+    """Async version of `batch_with_cache`."""
+    outputs, missing, keys = _lookup(inputs, cache)
+    if missing:
+        raw_outputs = await chain.abatch([inputs[i] for i in missing], config=config)
+        for i, raw_output in zip(missing, raw_outputs, strict=True):
+            outputs[i] = parse(raw_output)
+            if cache is not None:
+                cache.set(keys[i], outputs[i])
+    return outputs
@@ -10,11 +10,16 @@ from langchain_core.documents import BaseDocumentCompressor, Document
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.output_parsers import BaseOutputParser, StrOutputParser
 from langchain_core.prompts import PromptTemplate
-from langchain_core.runnables import Runnable
-from pydantic import ConfigDict
+from langchain_core.runnables import Runnable, RunnableConfig
+from pydantic import ConfigDict, PrivateAttr
 from typing_extensions import override
 
 from langchain_classic.chains.llm import LLMChain
+from langchain_classic.retrievers.document_compressors._chain_batch import (
+    _ChainOutputCache,
+    abatch_with_cache,
+    batch_with_cache,
+)
 from langchain_classic.retrievers.document_compressors.chain_extract_prompt import (
     prompt_template,
 )
@@ -52,7 +57,8 @@ class LLMChainExtractor(BaseDocumentCompressor):
     """LLM Chain Extractor.
 
     Document compressor that uses an LLM chain to extract
-    the relevant parts of documents.
+    the relevant parts of documents. All documents are processed with one
+    batched call to the chain.
     """
 
     llm_chain: Runnable
@@ -61,10 +67,42 @@ class LLMChainExtractor(BaseDocumentCompressor):
     get_input: Callable[[str, Document], dict] = default_get_input
     """Callable for constructing the chain input from the query and a Document."""
 
+    max_concurrency: int | None = None
+    """Maximum number of concurrent calls to the chain. Defaults to no limit."""
+
+    cache_size: int = 0
+    """Number of extractions to cache, keyed by the hash of the chain input (the
+    query and the document). Set to 0 to disable caching."""
+
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
 
+    _cache: _ChainOutputCache | None = PrivateAttr(default=None)
+
+    def _get_cache(self) -> _ChainOutputCache | None:
+        if self._cache is None and self.cache_size > 0:
+            self._cache = _ChainOutputCache(self.cache_size)
+        return self._cache
+
+    def _parse_output(self, output_: Any) -> str:
+        if isinstance(self.llm_chain, LLMChain):
+            output = output_[self.llm_chain.output_key]
+            if self.llm_chain.prompt.output_parser is not None:
+                output = self.llm_chain.prompt.output_parser.parse(output)
+        else:
+            output = output_
+        return cast("str", output)
+
+    def _build_compressed_docs(
+        self, documents: Sequence[Document], outputs: list[str]
+    ) -> list[Document]:
+        return [
+            Document(page_content=output, metadata=doc.metadata)
+            for doc, output in zip(documents, outputs, strict=True)
+            if len(output) > 0
+        ]
+
     def compress_documents(
         self,
         documents: Sequence[Document],
@@ -72,22 +110,14 @@ class LLMChainExtractor(BaseDocumentCompressor):
         callbacks: Callbacks | None = None,
     ) -> Sequence[Document]:
         """Compress page content of raw documents."""
-        compressed_docs = []
-        for doc in documents:
-            _input = self.get_input(query, doc)
-            output_ = self.llm_chain.invoke(_input, config={"callbacks": callbacks})
-            if isinstance(self.llm_chain, LLMChain):
-                output = output_[self.llm_chain.output_key]
-                if self.llm_chain.prompt.output_parser is not None:
-                    output = self.llm_chain.prompt.output_parser.parse(output)
-            else:
-                output = output_
-            if len(output) == 0:
-                continue
-            compressed_docs.append(
-                Document(page_content=cast("str", output), metadata=doc.metadata),
-            )
-        return compressed_docs
+        outputs = batch_with_cache(
+            self.llm_chain,
+            [self.get_input(query, doc) for doc in documents],
+            RunnableConfig(callbacks=callbacks, max_concurrency=self.max_concurrency),
+            self._parse_output,
+            self._get_cache(),
+        )
+        return self._build_compressed_docs(documents, outputs)
 
     async def acompress_documents(
         self,
@@ -96,16 +126,14 @@ class LLMChainExtractor(BaseDocumentCompressor):
         callbacks: Callbacks | None = None,
     ) -> Sequence[Document]:
         """Compress page content of raw documents asynchronously."""
-        inputs = [self.get_input(query, doc) for doc in documents]
-        outputs = await self.llm_chain.abatch(inputs, {"callbacks": callbacks})
-        compressed_docs = []
-        for i, doc in enumerate(documents):
-            if len(outputs[i]) == 0:
-                continue
-            compressed_docs.append(
-                Document(page_content=outputs[i], metadata=doc.metadata),
-            )
-        return compressed_docs
+        outputs = await abatch_with_cache(
+            self.llm_chain,
+            [self.get_input(query, doc) for doc in documents],
+            RunnableConfig(callbacks=callbacks, max_concurrency=self.max_concurrency),
+            self._parse_output,
+            self._get_cache(),
+        )
+        return self._build_compressed_docs(documents, outputs)
 
     @classmethod
     def from_llm(
@@ -10,10 +10,15 @@ from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import BasePromptTemplate, PromptTemplate
 from langchain_core.runnables import Runnable
 from langchain_core.runnables.config import RunnableConfig
-from pydantic import ConfigDict
+from pydantic import ConfigDict, PrivateAttr
 
 from langchain_classic.chains import LLMChain
 from langchain_classic.output_parsers.boolean import BooleanOutputParser
+from langchain_classic.retrievers.document_compressors._chain_batch import (
+    _ChainOutputCache,
+    abatch_with_cache,
+    batch_with_cache,
+)
 from langchain_classic.retrievers.document_compressors.chain_filter_prompt import (
     prompt_template,
 )
@@ -33,7 +38,12 @@ def default_get_input(query: str, doc: Document) -> dict[str, Any]:
 
 
 class LLMChainFilter(BaseDocumentCompressor):
-    """Filter that drops documents that aren't relevant to the query."""
+    """Filter that drops documents that aren't relevant to the query.
+
+    The documents are judged with one batched call to the chain. If `k` is set,
+    they are judged in waves of `max_concurrency` (or `k`) documents, stopping as
+    soon as `k` relevant documents have been found.
+    """
 
     llm_chain: Runnable
     """LLM wrapper to use for filtering documents.
@@ -42,10 +52,44 @@ class LLMChainFilter(BaseDocumentCompressor):
     get_input: Callable[[str, Document], dict] = default_get_input
     """Callable for constructing the chain input from the query and a Document."""
 
+    max_concurrency: int | None = None
+    """Maximum number of concurrent calls to the chain. Defaults to no limit."""
+
+    k: int | None = None
+    """Maximum number of relevant documents to return. Documents after the `k`-th
+    relevant one are not judged. Defaults to returning all relevant documents."""
+
+    cache_size: int = 0
+    """Number of judgements to cache, keyed by the hash of the chain input (the
+    query and the document). Set to 0 to disable caching."""
+
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
 
+    _cache: _ChainOutputCache | None = PrivateAttr(default=None)
+
+    def _get_cache(self) -> _ChainOutputCache | None:
+        if self._cache is None and self.cache_size > 0:
+            self._cache = _ChainOutputCache(self.cache_size)
+        return self._cache
+
+    def _parse_output(self, output_: Any) -> bool:
+        include_doc = None
+        if isinstance(self.llm_chain, LLMChain):
+            output = output_[self.llm_chain.output_key]
+            if self.llm_chain.prompt.output_parser is not None:
+                include_doc = self.llm_chain.prompt.output_parser.parse(output)
+        elif isinstance(output_, bool):
+            include_doc = output_
+        return bool(include_doc)
+
+    def _get_waves(self, documents: Sequence[Document]) -> list[Sequence[Document]]:
+        if self.k is None:
+            return [documents]
+        size = self.max_concurrency or self.k
+        return [documents[i : i + size] for i in range(0, len(documents), size)]
+
     def compress_documents(
         self,
         documents: Sequence[Document],
@@ -53,28 +97,26 @@ class LLMChainFilter(BaseDocumentCompressor):
         callbacks: Callbacks | None = None,
     ) -> Sequence[Document]:
         """Filter down documents based on their relevance to the query."""
-        filtered_docs = []
-
-        config = RunnableConfig(callbacks=callbacks)
-        outputs = zip(
-            self.llm_chain.batch(
-                [self.get_input(query, doc) for doc in documents],
-                config=config,
-            ),
-            documents,
-            strict=False,
-        )
+        filtered_docs: list[Document] = []
 
-        for output_, doc in outputs:
-            include_doc = None
-            if isinstance(self.llm_chain, LLMChain):
-                output = output_[self.llm_chain.output_key]
-                if self.llm_chain.prompt.output_parser is not None:
-                    include_doc = self.llm_chain.prompt.output_parser.parse(output)
-            elif isinstance(output_, bool):
-                include_doc = output_
-            if include_doc:
-                filtered_docs.append(doc)
+        config = RunnableConfig(
+            callbacks=callbacks, max_concurrency=self.max_concurrency
+        )
+        for wave in self._get_waves(documents):
+            include = batch_with_cache(
+                self.llm_chain,
+                [self.get_input(query, doc) for doc in wave],
+                config,
+                self._parse_output,
+                self._get_cache(),
+            )
+            filtered_docs.extend(
+                doc
+                for doc, include_doc in zip(wave, include, strict=True)
+                if include_doc
+            )
+            if self.k is not None and len(filtered_docs) >= self.k:
+                return filtered_docs[: self.k]
 
         return filtered_docs
 
@@ -85,27 +127,26 @@ class LLMChainFilter(BaseDocumentCompressor):
         callbacks: Callbacks | None = None,
     ) -> Sequence[Document]:
         """Filter down documents based on their relevance to the query."""
-        filtered_docs = []
-
-        config = RunnableConfig(callbacks=callbacks)
-        outputs = zip(
-            await self.llm_chain.abatch(
-                [self.get_input(query, doc) for doc in documents],
-                config=config,
-            ),
-            documents,
-            strict=False,
+        filtered_docs: list[Document] = []
+
+        config = RunnableConfig(
+            callbacks=callbacks, max_concurrency=self.max_concurrency
         )
-        for output_, doc in outputs:
-            include_doc = None
-            if isinstance(self.llm_chain, LLMChain):
-                output = output_[self.llm_chain.output_key]
-                if self.llm_chain.prompt.output_parser is not None:
-                    include_doc = self.llm_chain.prompt.output_parser.parse(output)
-            elif isinstance(output_, bool):
-                include_doc = output_
-            if include_doc:
-                filtered_docs.append(doc)
+        for wave in self._get_waves(documents):
+            include = await abatch_with_cache(
+                self.llm_chain,
+                [self.get_input(query, doc) for doc in wave],
+                config,
+                self._parse_output,
+                self._get_cache(),
+            )
+            filtered_docs.extend(
+                doc
+                for doc, include_doc in zip(wave, include, strict=True)
+                if include_doc
+            )
+            if self.k is not None and len(filtered_docs) >= self.k:
+                return filtered_docs[: self.k]
 
         return filtered_docs
 
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
 import operator
 from collections.abc import Sequence
+from concurrent.futures import Executor
+from itertools import chain
 
 from langchain_core.callbacks import Callbacks
 from langchain_core.documents import BaseDocumentCompressor, Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.runnables.config import run_in_executor
 from pydantic import ConfigDict
 from typing_extensions import override
 
@@ -13,20 +19,108 @@ from langchain_classic.retrievers.document_compressors.cross_encoder import (
 )
 
 
+def _top_m_by_similarity(
+    query_embedding: list[float],
+    doc_embeddings: list[list[float]],
+    top_m: int,
+) -> list[int]:
+    """Return the indices of the `top_m` most cosine-similar docs, in input order."""
+    try:
+        import numpy as np
+    except ImportError as e:
+        msg = "Could not import numpy, please install with `pip install numpy`."
+        raise ImportError(msg) from e
+
+    query = np.asarray(query_embedding, dtype=np.float32)
+    docs = np.asarray(doc_embeddings, dtype=np.float32)
+    norms = np.linalg.norm(docs, axis=1) * np.linalg.norm(query)
+    similarity = docs @ query / np.where(norms == 0, 1, norms)
+    top_m_idx = np.argpartition(-similarity, top_m - 1)[:top_m]
+    return sorted(top_m_idx.tolist())
+
+
 class CrossEncoderReranker(BaseDocumentCompressor):
-    """Document compressor that uses CrossEncoder for reranking."""
+    """Document compressor that uses CrossEncoder for reranking.
+
+    Pairs are scored in micro-batches of `batch_size` and the `top_n` documents are
+    selected with a heap rather than a full sort. With `prefilter_embeddings` set,
+    documents are first narrowed down to the `prefilter_top_m` most similar to the
+    query by embedding similarity, so only those are cross-encoded.
+
+    The async path runs each micro-batch in `executor` (the default thread pool if
+    not set); pass a `ProcessPoolExecutor` to score batches in parallel processes.
+    """
 
     model: BaseCrossEncoder
     """CrossEncoder model to use for scoring similarity
       between the query and documents."""
     top_n: int = 3
     """Number of documents to return."""
+    batch_size: int | None = None
+    """Maximum number of pairs per `model.score` call. Defaults to scoring all pairs
+    in a single call."""
+    prefilter_embeddings: Embeddings | None = None
+    """Embeddings used to cheaply prefilter documents before cross-encoding.
+    Defaults to cross-encoding all documents."""
+    prefilter_top_m: int = 50
+    """Number of documents kept by the embedding prefilter."""
+    executor: Executor | None = None
+    """Executor used to score micro-batches in `acompress_documents`. The model must
+    be picklable to use a process pool."""
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         extra="forbid",
     )
 
+    def _get_batches(
+        self, query: str, documents: Sequence[Document]
+    ) -> list[list[tuple[str, str]]]:
+        pairs = [(query, doc.page_content) for doc in documents]
+        size = self.batch_size or len(pairs) or 1
+        return [pairs[i : i + size] for i in range(0, len(pairs), size)]
+
+    def _select_top_n(
+        self, documents: Sequence[Document], scores: Sequence[float]
+    ) -> list[Document]:
+        # Same order as a stable descending sort, ties keep the input order
+        top = heapq.nlargest(
+            self.top_n,
+            zip(documents, scores, strict=False),
+            key=operator.itemgetter(1),
+        )
+        return [doc for doc, _ in top]
+
+    def _prefilter(
+        self, documents: Sequence[Document], query: str
+    ) -> Sequence[Document]:
+        if self.prefilter_embeddings is None or len(documents) <= self.prefilter_top_m:
+            return documents
+        keep = _top_m_by_similarity(
+            self.prefilter_embeddings.embed_query(query),
+            self.prefilter_embeddings.embed_documents(
+                [doc.page_content for doc in documents]
+            ),
+            self.prefilter_top_m,
+        )
+        return [documents[i] for i in keep]
+
+    async def _aprefilter(
+        self, documents: Sequence[Document], query: str
+    ) -> Sequence[Document]:
+        if self.prefilter_embeddings is None or len(documents) <= self.prefilter_top_m:
+            return documents
+        query_embedding, doc_embeddings = await asyncio.gather(
+            self.prefilter_embeddings.aembed_query(query),
+            self.prefilter_embeddings.aembed_documents(
+                [doc.page_content for doc in documents]
+            ),
+        )
+        keep = _top_m_by_similarity(
+            query_embedding, doc_embeddings, self.prefilter_top_m
+        )
+        return [documents[i] for i in keep]
+
     @override
     def compress_documents(
         self,
@@ -44,7 +138,44 @@ class CrossEncoderReranker(BaseDocumentCompressor):
         Returns:
             A sequence of compressed documents.
         """
-        scores = self.model.score([(query, doc.page_content) for doc in documents])
-        docs_with_scores = list(zip(documents, scores, strict=False))
-        result = sorted(docs_with_scores, key=operator.itemgetter(1), reverse=True)
-        return [doc for doc, _ in result[: self.top_n]]
+        documents = self._prefilter(documents, query)
+        scores = list(
+            chain.from_iterable(
+                self.model.score(batch) for batch in self._get_batches(query, documents)
+            )
+        )
+        return self._select_top_n(documents, scores)
+
+    @override
+    async def acompress_documents(
+        self,
+        documents: Sequence[Document],
+        query: str,
+        callbacks: Callbacks | None = None,
+    ) -> Sequence[Document]:
+        """Rerank documents using CrossEncoder without blocking the event loop.
+
+        Args:
+            documents: A sequence of documents to compress.
+            query: The query to use for compressing the documents.
+            callbacks: Callbacks to run during the compression process.
+
+        Returns:
+            A sequence of compressed documents.
+        """
+        documents = await self._aprefilter(documents, query)
+        batches = self._get_batches(query, documents)
+        if self.executor is None:
+            batch_scores = await asyncio.gather(
+                *(run_in_executor(None, self.model.score, batch) for batch in batches)
+            )
+        else:
+            # Submit the bound method directly so it can be pickled for process pools
+            loop = asyncio.get_running_loop()
+            batch_scores = await asyncio.gather(
+                *(
+                    loop.run_in_executor(self.executor, self.model.score, batch)
+                    for batch in batches
+                )
+            )
+        return self._select_top_n(documents, list(chain.from_iterable(batch_scores)))
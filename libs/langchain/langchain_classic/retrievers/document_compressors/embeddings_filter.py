@@ -39,6 +39,16 @@ class EmbeddingsFilter(BaseDocumentCompressor):
     """Threshold for determining when two documents are similar enough
     to be considered redundant. Defaults to `None`, must be specified if `k` is set
     to None."""
+    document_embedding_key: str | None = None
+    """Metadata key holding precomputed document embeddings, e.g. the stored vectors
+    attached by the retriever. If every document has it, the documents are not
+    embedded again. The key is removed from the metadata of the returned documents."""
+    query_embedding_key: str | None = None
+    """Metadata key holding the precomputed query embedding as a
+    `{"query": ..., "embedding": ...}` dict, e.g. as attached by the retriever. If
+    every document has it for the same query text as the one being compressed for,
+    the query is not embedded again. The key is removed from the metadata of the
+    returned documents."""
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -52,6 +62,74 @@ class EmbeddingsFilter(BaseDocumentCompressor):
             raise ValueError(msg)
         return values
 
+    def _pop_precomputed_embeddings(
+        self, documents: Sequence[Document]
+    ) -> Sequence[Document]:
+        """Move precomputed embeddings from the metadata to the document state.
+
+        Documents are converted to stateful documents whose `embedded_doc` state is
+        reused instead of calling the embeddings, including by later stages of a
+        `DocumentCompressorPipeline` such as `EmbeddingsRedundantFilter`.
+        """
+        keys = [
+            key
+            for key in (self.document_embedding_key, self.query_embedding_key)
+            if key is not None
+        ]
+        if not keys or not any(
+            key in doc.metadata for doc in documents for key in keys
+        ):
+            return documents
+
+        try:
+            from langchain_community.document_transformers.embeddings_redundant_filter import (  # noqa: E501
+                _DocumentWithState,
+            )
+        except ImportError as e:
+            msg = (
+                "To use please install langchain-community "
+                "with `pip install langchain-community`."
+            )
+            raise ImportError(msg) from e
+
+        reuse_embeddings = self.document_embedding_key is not None and all(
+            self.document_embedding_key in doc.metadata for doc in documents
+        )
+        stateful_documents = []
+        for doc in documents:
+            metadata = {k: v for k, v in doc.metadata.items() if k not in keys}
+            state = dict(getattr(doc, "state", {}))
+            if reuse_embeddings:
+                state["embedded_doc"] = doc.metadata[self.document_embedding_key]
+            stateful_documents.append(
+                _DocumentWithState(
+                    id=doc.id,
+                    page_content=doc.page_content,
+                    metadata=metadata,
+                    state=state,
+                )
+            )
+        return stateful_documents
+
+    def _get_precomputed_query_embedding(
+        self, documents: Sequence[Document], query: str
+    ) -> list[float] | None:
+        """Return the embedding of `query` attached to the documents, if any.
+
+        The vector is only reused if every document carries it for the same query
+        text, since the retriever may have searched with a different (e.g.
+        rewritten or generated) query.
+        """
+        if self.query_embedding_key is None or not documents:
+            return None
+        embedding = None
+        for doc in documents:
+            attached = doc.metadata.get(self.query_embedding_key)
+            if not isinstance(attached, dict) or attached.get("query") != query:
+                return None
+            embedding = attached.get("embedding")
+        return embedding
+
     @override
     def compress_documents(
         self,
@@ -77,12 +155,16 @@ class EmbeddingsFilter(BaseDocumentCompressor):
         except ImportError as e:
             msg = "Could not import numpy, please install with `pip install numpy`."
             raise ImportError(msg) from e
-        stateful_documents = get_stateful_documents(documents)
+        stateful_documents = get_stateful_documents(
+            self._pop_precomputed_embeddings(documents)
+        )
         embedded_documents = _get_embeddings_from_stateful_docs(
             self.embeddings,
             stateful_documents,
         )
-        embedded_query = self.embeddings.embed_query(query)
+        embedded_query = self._get_precomputed_query_embedding(documents, query)
+        if embedded_query is None:
+            embedded_query = self.embeddings.embed_query(query)
         similarity = self.similarity_fn([embedded_query], embedded_documents)[0]
         included_idxs: np.ndarray = np.arange(len(embedded_documents))
         if self.k is not None:
@@ -121,12 +203,16 @@ class EmbeddingsFilter(BaseDocumentCompressor):
         except ImportError as e:
             msg = "Could not import numpy, please install with `pip install numpy`."
             raise ImportError(msg) from e
-        stateful_documents = get_stateful_documents(documents)
+        stateful_documents = get_stateful_documents(
+            self._pop_precomputed_embeddings(documents)
+        )
         embedded_documents = await _aget_embeddings_from_stateful_docs(
             self.embeddings,
             stateful_documents,
         )
-        embedded_query = await self.embeddings.aembed_query(query)
+        embedded_query = self._get_precomputed_query_embedding(documents, query)
+        if embedded_query is None:
+            embedded_query = await self.embeddings.aembed_query(query)
         similarity = self.similarity_fn([embedded_query], embedded_documents)[0]
         included_idxs: np.ndarray = np.arange(len(embedded_documents))
         if self.k is not None:
@@ -5,9 +5,13 @@ multiple retrievers by using weighted  Reciprocal Rank Fusion.
 """
 
 import asyncio
-from collections import defaultdict
+import logging
+import threading
+import time
+from collections import deque
 from collections.abc import Callable, Hashable, Iterable, Iterator
-from itertools import chain
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from contextvars import copy_context
 from typing import (
     Any,
     TypeVar,
@@ -21,17 +25,26 @@ from langchain_core.callbacks import (
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever, RetrieverLike
 from langchain_core.runnables import RunnableConfig
-from langchain_core.runnables.config import ensure_config, patch_config
+from langchain_core.runnables.config import (
+    ContextThreadPoolExecutor,
+    ensure_config,
+    patch_config,
+)
 from langchain_core.runnables.utils import (
     ConfigurableFieldSpec,
     get_unique_config_specs,
 )
-from pydantic import model_validator
+from pydantic import PrivateAttr, model_validator
 from typing_extensions import override
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 H = TypeVar("H", bound=Hashable)
 
+# Guards the lazy creation of the shared executor of each ensemble retriever
+_EXECUTOR_LOCK = threading.Lock()
+
 
 def unique_by_key(iterable: Iterable[T], key: Callable[[T], H]) -> Iterator[T]:
     """Yield unique elements of an iterable based on a key function.
@@ -63,12 +76,26 @@ class EnsembleRetriever(BaseRetriever):
             of high-ranked items and the consideration given to lower-ranked items.
         id_key: The key in the document's metadata used to determine unique documents.
             If not specified, page_content is used.
+        retriever_timeout: Maximum number of seconds to wait for the retrievers.
+            Retrievers that have not finished in time are skipped and the results
+            of the others are fused. If not specified, waits for all retrievers.
+        executor: Executor to run the retrievers in for sync calls. If not
+            specified, a thread pool is created on first use and shared by all
+            calls of this retriever.
+
+    The retrievers are queried concurrently, in threads for sync calls and as
+    coroutines for async calls. Use `max_concurrency` in the config to limit the
+    number of retrievers running at once for a call.
     """
 
     retrievers: list[RetrieverLike]
     weights: list[float]
     c: int = 60
     id_key: str | None = None
+    retriever_timeout: float | None = None
+    executor: Executor | None = None
+
+    _executor: Executor | None = PrivateAttr(default=None)
 
     @property
     def config_specs(self) -> list[ConfigurableFieldSpec]:
@@ -219,18 +246,46 @@ class EnsembleRetriever(BaseRetriever):
         Returns:
             A list of reranked documents.
         """
-        # Get the results of all retrievers.
-        retriever_docs = [
-            retriever.invoke(
-                query,
-                patch_config(
-                    config,
-                    callbacks=run_manager.get_child(tag=f"retriever_{i + 1}"),
-                ),
+        configs = [
+            patch_config(
+                config,
+                callbacks=run_manager.get_child(tag=f"retriever_{i + 1}"),
             )
-            for i, retriever in enumerate(self.retrievers)
+            for i in range(len(self.retrievers))
         ]
 
+        # Get the results of all retrievers.
+        retriever_docs: list[list[Document]]
+        if len(self.retrievers) == 1 and self.retriever_timeout is None:
+            retriever_docs = [self.retrievers[0].invoke(query, configs[0])]
+        else:
+            futures = self._submit_retrievers(
+                query, configs, (config or {}).get("max_concurrency")
+            )
+            done = {
+                i
+                for i, future in enumerate(futures)
+                if future is not None and future.done() and not future.cancelled()
+            }
+            if not done:
+                msg = (
+                    f"None of the retrievers finished within "
+                    f"{self.retriever_timeout} seconds."
+                )
+                raise TimeoutError(msg)
+            retriever_docs = []
+            for i, future in enumerate(futures):
+                if i in done and future is not None:
+                    retriever_docs.append(future.result())
+                else:
+                    logger.warning(
+                        "Retriever %d timed out after %s seconds, "
+                        "fusing the results of the other retrievers.",
+                        i + 1,
+                        self.retriever_timeout,
+                    )
+                    retriever_docs.append([])
+
         # Enforce that retrieved docs are Documents for each list in retriever_docs
         for i in range(len(retriever_docs)):
             retriever_docs[i] = [
@@ -241,6 +296,60 @@ class EnsembleRetriever(BaseRetriever):
         # apply rank fusion
         return self.weighted_reciprocal_rank(retriever_docs)
 
+    def _get_executor(self) -> Executor:
+        """Return the executor for sync calls, creating the shared one if needed."""
+        if self.executor is not None:
+            return self.executor
+        if self._executor is None:
+            with _EXECUTOR_LOCK:
+                if self._executor is None:
+                    self._executor = ContextThreadPoolExecutor(
+                        thread_name_prefix="EnsembleRetriever"
+                    )
+        return self._executor
+
+    def _submit_retrievers(
+        self,
+        query: str,
+        configs: list[RunnableConfig],
+        max_concurrency: int | None,
+    ) -> list[Future[list[Document]] | None]:
+        """Run the retrievers in the executor until done or `retriever_timeout`.
+
+        At most `max_concurrency` retrievers are submitted at once. Retrievers that
+        are still pending at the timeout are cancelled if they have not started.
+
+        Returns:
+            A future per retriever, in order, or None for retrievers not started
+            before the timeout.
+        """
+        executor = self._get_executor()
+        deadline = (
+            None
+            if self.retriever_timeout is None
+            else time.monotonic() + self.retriever_timeout
+        )
+        waiting = deque(enumerate(zip(self.retrievers, configs, strict=True)))
+        limit = max_concurrency or len(self.retrievers)
+        futures: list[Future[list[Document]] | None] = [None] * len(self.retrievers)
+        running: set[Future[list[Document]]] = set()
+        while waiting or running:
+            while waiting and len(running) < limit:
+                i, (retriever, retriever_config) = waiting.popleft()
+                future = executor.submit(
+                    copy_context().run, retriever.invoke, query, retriever_config
+                )
+                futures[i] = future
+                running.add(future)
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            done, running = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                # Don't block on retrievers that timed out
+                for future in running:
+                    future.cancel()
+                break
+        return futures
+
     async def arank_fusion(
         self,
         query: str,
@@ -262,18 +371,42 @@ class EnsembleRetriever(BaseRetriever):
             A list of reranked documents.
         """
         # Get the results of all retrievers.
-        retriever_docs = await asyncio.gather(
-            *[
-                retriever.ainvoke(
-                    query,
-                    patch_config(
-                        config,
-                        callbacks=run_manager.get_child(tag=f"retriever_{i + 1}"),
-                    ),
+        coros = [
+            retriever.ainvoke(
+                query,
+                patch_config(
+                    config,
+                    callbacks=run_manager.get_child(tag=f"retriever_{i + 1}"),
+                ),
+            )
+            for i, retriever in enumerate(self.retrievers)
+        ]
+        retriever_docs: list[list[Document]]
+        if self.retriever_timeout is None:
+            retriever_docs = await asyncio.gather(*coros)
+        else:
+            tasks = [asyncio.ensure_future(coro) for coro in coros]
+            done, pending = await asyncio.wait(tasks, timeout=self.retriever_timeout)
+            for task in pending:
+                task.cancel()
+            if not done:
+                msg = (
+                    f"None of the retrievers finished within "
+                    f"{self.retriever_timeout} seconds."
                 )
-                for i, retriever in enumerate(self.retrievers)
-            ],
-        )
+                raise TimeoutError(msg)
+            retriever_docs = []
+            for i, task in enumerate(tasks):
+                if task in done:
+                    retriever_docs.append(task.result())
+                else:
+                    logger.warning(
+                        "Retriever %d timed out after %s seconds, "
+                        "fusing the results of the other retrievers.",
+                        i + 1,
+                        self.retriever_timeout,
+                    )
+                    retriever_docs.append([])
 
         # Enforce that retrieved docs are Documents for each list in retriever_docs
         for i in range(len(retriever_docs)):
@@ -305,32 +438,27 @@ class EnsembleRetriever(BaseRetriever):
             msg = "Number of rank lists must be equal to the number of weights."
             raise ValueError(msg)
 
-        # Associate each doc's content with its RRF score for later sorting by it
+        # Map each unique doc key to a dense integer id in order of first appearance,
+        # so each key is hashed once and scores are accumulated in a flat list.
         # Duplicated contents across retrievers are collapsed & scored cumulatively
-        rrf_score: dict[str, float] = defaultdict(float)
+        doc_ids: dict[Any, int] = {}
+        unique_docs: list[Document] = []
+        rrf_scores: list[float] = []
         for doc_list, weight in zip(doc_lists, self.weights, strict=False):
             for rank, doc in enumerate(doc_list, start=1):
-                rrf_score[
-                    (
-                        doc.page_content
-                        if self.id_key is None
-                        else doc.metadata[self.id_key]
-                    )
-                ] += weight / (rank + self.c)
-
-        # Docs are deduplicated by their contents then sorted by their scores
-        all_docs = chain.from_iterable(doc_lists)
-        return sorted(
-            unique_by_key(
-                all_docs,
-                lambda doc: (
+                key = (
                     doc.page_content
                     if self.id_key is None
                     else doc.metadata[self.id_key]
-                ),
-            ),
-            reverse=True,
-            key=lambda doc: rrf_score[
-                doc.page_content if self.id_key is None else doc.metadata[self.id_key]
-            ],
+                )
+                doc_id = doc_ids.setdefault(key, len(unique_docs))
+                if doc_id == len(unique_docs):
+                    unique_docs.append(doc)
+                    rrf_scores.append(0.0)
+                rrf_scores[doc_id] += weight / (rank + self.c)
+
+        # Docs are sorted by their scores, ties keep the order of first appearance
+        ranking = sorted(
+            range(len(unique_docs)), key=rrf_scores.__getitem__, reverse=True
         )
+        return [unique_docs[doc_id] for doc_id in ranking]
@@ -1,18 +1,24 @@
 import asyncio
 import logging
 from collections.abc import Sequence
+from typing import Any, cast
 
 from langchain_core.callbacks import (
+    AsyncCallbackManager,
     AsyncCallbackManagerForRetrieverRun,
+    CallbackManager,
     CallbackManagerForRetrieverRun,
 )
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.output_parsers import BaseOutputParser
 from langchain_core.prompts import BasePromptTemplate
 from langchain_core.prompts.prompt import PromptTemplate
 from langchain_core.retrievers import BaseRetriever
-from langchain_core.runnables import Runnable
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+from langchain_core.vectorstores import VectorStoreRetriever
 from typing_extensions import override
 
 from langchain_classic.chains.llm import LLMChain
@@ -43,7 +49,16 @@ DEFAULT_QUERY_PROMPT = PromptTemplate(
 
 
 def _unique_documents(documents: Sequence[Document]) -> list[Document]:
-    return [doc for i, doc in enumerate(documents) if doc not in documents[:i]]
+    # Bucket by page_content so each document is only compared for equality with
+    # the few documents sharing its content; metadata may hold unhashable values.
+    seen: dict[str, list[Document]] = {}
+    unique = []
+    for doc in documents:
+        bucket = seen.setdefault(doc.page_content, [])
+        if doc not in bucket:
+            bucket.append(doc)
+            unique.append(doc)
+    return unique
 
 
 class MultiQueryRetriever(BaseRetriever):
@@ -59,6 +74,14 @@ class MultiQueryRetriever(BaseRetriever):
     """DEPRECATED. parser_key is no longer used and should not be specified."""
     include_original: bool = False
     """Whether to include the original query in the list of generated queries."""
+    batch_embed_queries: bool = False
+    """Whether to embed all generated queries in a single request.
+
+    Only used when `retriever` is a `VectorStoreRetriever` with the `similarity` or
+    `mmr` search type. The queries are embedded together with `embed_documents` and
+    searched by vector, so only enable this for embedding models that embed queries
+    and documents the same way.
+    """
 
     @classmethod
     def from_llm(
@@ -150,15 +173,17 @@ class MultiQueryRetriever(BaseRetriever):
         Returns:
             List of retrieved Documents
         """
-        document_lists = await asyncio.gather(
-            *(
-                self.retriever.ainvoke(
-                    query,
-                    config={"callbacks": run_manager.get_child()},
-                )
-                for query in queries
-            ),
-        )
+        if self.batch_embed_queries and (
+            self._get_search_by_vector(async_=True) is not None
+        ):
+            document_lists = await self._aretrieve_documents_by_vector(
+                queries, run_manager
+            )
+        else:
+            configs: list[RunnableConfig] = [
+                {"callbacks": run_manager.get_child()} for _ in queries
+            ]
+            document_lists = await self.retriever.abatch(queries, configs)
         return [doc for docs in document_lists for doc in docs]
 
     def _get_relevant_documents(
@@ -219,14 +244,121 @@ class MultiQueryRetriever(BaseRetriever):
         Returns:
             List of retrieved Documents
         """
-        documents = []
-        for query in queries:
-            docs = self.retriever.invoke(
-                query,
-                config={"callbacks": run_manager.get_child()},
+        if self.batch_embed_queries and self._get_search_by_vector() is not None:
+            document_lists = self._retrieve_documents_by_vector(queries, run_manager)
+        else:
+            configs: list[RunnableConfig] = [
+                {"callbacks": run_manager.get_child()} for _ in queries
+            ]
+            document_lists = self.retriever.batch(queries, configs)
+        return [doc for docs in document_lists for doc in docs]
+
+    def _get_search_by_vector(self, *, async_: bool = False) -> Any:
+        """Get the vector store's search-by-vector method, if it can be used."""
+        retriever = self.retriever
+        if (
+            not isinstance(retriever, VectorStoreRetriever)
+            or retriever.vectorstore.embeddings is None
+        ):
+            return None
+        vectorstore = retriever.vectorstore
+        if retriever.search_type == "similarity":
+            return (
+                vectorstore.asimilarity_search_by_vector
+                if async_
+                else vectorstore.similarity_search_by_vector
             )
-            documents.extend(docs)
-        return documents
+        if retriever.search_type == "mmr":
+            return (
+                vectorstore.amax_marginal_relevance_search_by_vector
+                if async_
+                else vectorstore.max_marginal_relevance_search_by_vector
+            )
+        return None
+
+    def _get_retriever_callback_config(self) -> dict[str, Any]:
+        """Tags and metadata the retriever would add to its own runs."""
+        retriever = cast("VectorStoreRetriever", self.retriever)
+        return {
+            "local_tags": retriever.tags,
+            "inheritable_metadata": retriever._get_ls_params(),  # noqa: SLF001
+            "local_metadata": retriever.metadata,
+        }
+
+    def _retrieve_documents_by_vector(
+        self, queries: list[str], run_manager: CallbackManagerForRetrieverRun
+    ) -> list[list[Document]]:
+        """Embed all queries in one request, then search the vector store by vector.
+
+        Each search is reported as a run of the retriever, as `retriever.batch`
+        would, so tracing is the same as without batched embedding.
+        """
+        retriever = cast("VectorStoreRetriever", self.retriever)
+        embeddings = cast("Embeddings", retriever.vectorstore.embeddings)
+        search_by_vector = self._get_search_by_vector()
+        callback_config = self._get_retriever_callback_config()
+        vectors = embeddings.embed_documents(queries)
+
+        def _search(query: str, vector: list[float]) -> list[Document]:
+            callback_manager = CallbackManager.configure(
+                run_manager.get_child(), None, **callback_config
+            )
+            search_run_manager = callback_manager.on_retriever_start(
+                None, query, name=retriever.get_name()
+            )
+            try:
+                documents = search_by_vector(vector, **retriever.search_kwargs)
+            except Exception as e:
+                search_run_manager.on_retriever_error(e)
+                raise
+            search_run_manager.on_retriever_end(documents)
+            return documents
+
+        if len(vectors) <= 1:
+            return [
+                _search(query, vector)
+                for query, vector in zip(queries, vectors, strict=True)
+            ]
+        with ContextThreadPoolExecutor(max_workers=len(vectors)) as executor:
+            return list(executor.map(_search, queries, vectors))
+
+    async def _aretrieve_documents_by_vector(
+        self, queries: list[str], run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> list[list[Document]]:
+        """Embed all queries in one request, then search the vector store by vector.
+
+        Each search is reported as a run of the retriever, as `retriever.abatch`
+        would, so tracing is the same as without batched embedding.
+        """
+        retriever = cast("VectorStoreRetriever", self.retriever)
+        embeddings = cast("Embeddings", retriever.vectorstore.embeddings)
+        search_by_vector = self._get_search_by_vector(async_=True)
+        callback_config = self._get_retriever_callback_config()
+        vectors = await embeddings.aembed_documents(queries)
+
+        async def _search(query: str, vector: list[float]) -> list[Document]:
+            callback_manager = AsyncCallbackManager.configure(
+                run_manager.get_child(), None, **callback_config
+            )
+            search_run_manager = await callback_manager.on_retriever_start(
+                None, query, name=retriever.get_name()
+            )
+            try:
+                documents = await search_by_vector(vector, **retriever.search_kwargs)
+            except Exception as e:
+                await search_run_manager.on_retriever_error(e)
+                raise
+            await search_run_manager.on_retriever_end(documents)
+            return documents
+
+        return list(
+            await asyncio.gather(
+                *(
+                    _search(query, vector)
+                    for query, vector in zip(queries, vectors, strict=True)
+                )
+            )
+        )
 
     def unique_union(self, documents: list[Document]) -> list[Document]:
         """Get unique Documents.
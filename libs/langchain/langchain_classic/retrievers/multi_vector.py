@@ -47,6 +47,15 @@ class MultiVectorRetriever(BaseRetriever):
     search_type: SearchType = SearchType.similarity
     """Type of search to perform (similarity / mmr)"""
 
+    parent_k: int | None = None
+    """Number of unique parent documents to return.
+
+    Several child chunks often point to the same parent, so `k` child hits can
+    resolve to fewer than `k` parents. If set, child hits are over-fetched (doubling
+    `k` on each attempt) until `parent_k` unique parents are found or the vector
+    store has no more matching chunks. If `None`, the parents of the `k` child hits
+    in `search_kwargs` are returned."""
+
     @model_validator(mode="before")
     @classmethod
     def _shim_docstore(cls, values: dict) -> Any:
@@ -75,29 +84,81 @@ class MultiVectorRetriever(BaseRetriever):
         Returns:
             List of relevant documents.
         """
+        ids = self._get_parent_ids(query)
+        docs = self.docstore.mget(ids)
+        return [d for d in docs if d is not None]
+
+    def _search(self, query: str, search_kwargs: dict) -> list[Document]:
+        """Search the vector store for child documents."""
         if self.search_type == SearchType.mmr:
-            sub_docs = self.vectorstore.max_marginal_relevance_search(
+            return self.vectorstore.max_marginal_relevance_search(
                 query,
-                **self.search_kwargs,
+                **search_kwargs,
             )
-        elif self.search_type == SearchType.similarity_score_threshold:
+        if self.search_type == SearchType.similarity_score_threshold:
             sub_docs_and_similarities = (
                 self.vectorstore.similarity_search_with_relevance_scores(
                     query,
-                    **self.search_kwargs,
+                    **search_kwargs,
                 )
             )
-            sub_docs = [sub_doc for sub_doc, _ in sub_docs_and_similarities]
-        else:
-            sub_docs = self.vectorstore.similarity_search(query, **self.search_kwargs)
-
-        # We do this to maintain the order of the IDs that are returned
-        ids = []
-        for d in sub_docs:
-            if self.id_key in d.metadata and d.metadata[self.id_key] not in ids:
-                ids.append(d.metadata[self.id_key])
-        docs = self.docstore.mget(ids)
-        return [d for d in docs if d is not None]
+            return [sub_doc for sub_doc, _ in sub_docs_and_similarities]
+        return self.vectorstore.similarity_search(query, **search_kwargs)
+
+    async def _asearch(self, query: str, search_kwargs: dict) -> list[Document]:
+        """Asynchronously search the vector store for child documents."""
+        if self.search_type == SearchType.mmr:
+            return await self.vectorstore.amax_marginal_relevance_search(
+                query,
+                **search_kwargs,
+            )
+        if self.search_type == SearchType.similarity_score_threshold:
+            sub_docs_and_similarities = (
+                await self.vectorstore.asimilarity_search_with_relevance_scores(
+                    query,
+                    **search_kwargs,
+                )
+            )
+            return [sub_doc for sub_doc, _ in sub_docs_and_similarities]
+        return await self.vectorstore.asimilarity_search(query, **search_kwargs)
+
+    def _unique_parent_ids(self, sub_docs: list[Document]) -> list[str]:
+        # An insertion-ordered dict keeps the order in which the IDs are returned
+        return list(
+            dict.fromkeys(
+                d.metadata[self.id_key] for d in sub_docs if self.id_key in d.metadata
+            )
+        )
+
+    def _get_search_kwargs(self, k: int) -> dict:
+        search_kwargs = {**self.search_kwargs, "k": k}
+        if self.search_type == SearchType.mmr:
+            search_kwargs["fetch_k"] = max(k, search_kwargs.get("fetch_k", 20))
+        return search_kwargs
+
+    def _get_parent_ids(self, query: str) -> list[str]:
+        if self.parent_k is None:
+            return self._unique_parent_ids(self._search(query, self.search_kwargs))
+        k = max(self.search_kwargs.get("k", 4), self.parent_k)
+        while True:
+            sub_docs = self._search(query, self._get_search_kwargs(k))
+            ids = self._unique_parent_ids(sub_docs)
+            if len(ids) >= self.parent_k or len(sub_docs) < k:
+                return ids[: self.parent_k]
+            k *= 2
+
+    async def _aget_parent_ids(self, query: str) -> list[str]:
+        if self.parent_k is None:
+            return self._unique_parent_ids(
+                await self._asearch(query, self.search_kwargs)
+            )
+        k = max(self.search_kwargs.get("k", 4), self.parent_k)
+        while True:
+            sub_docs = await self._asearch(query, self._get_search_kwargs(k))
+            ids = self._unique_parent_ids(sub_docs)
+            if len(ids) >= self.parent_k or len(sub_docs) < k:
+                return ids[: self.parent_k]
+            k *= 2
 
     @override
     async def _aget_relevant_documents(
@@ -114,29 +175,6 @@ class MultiVectorRetriever(BaseRetriever):
         Returns:
             List of relevant documents.
         """
-        if self.search_type == SearchType.mmr:
-            sub_docs = await self.vectorstore.amax_marginal_relevance_search(
-                query,
-                **self.search_kwargs,
-            )
-        elif self.search_type == SearchType.similarity_score_threshold:
-            sub_docs_and_similarities = (
-                await self.vectorstore.asimilarity_search_with_relevance_scores(
-                    query,
-                    **self.search_kwargs,
-                )
-            )
-            sub_docs = [sub_doc for sub_doc, _ in sub_docs_and_similarities]
-        else:
-            sub_docs = await self.vectorstore.asimilarity_search(
-                query,
-                **self.search_kwargs,
-            )
-
-        # We do this to maintain the order of the IDs that are returned
-        ids = []
-        for d in sub_docs:
-            if self.id_key in d.metadata and d.metadata[self.id_key] not in ids:
-                ids.append(d.metadata[self.id_key])
+        ids = await self._aget_parent_ids(query)
         docs = await self.docstore.amget(ids)
         return [d for d in docs if d is not None]
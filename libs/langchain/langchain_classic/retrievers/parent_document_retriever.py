@@ -1,8 +1,11 @@
+import asyncio
 import uuid
 from collections.abc import Sequence
+from concurrent.futures import Future
 from typing import Any
 
 from langchain_core.documents import Document
+from langchain_core.runnables.config import ContextThreadPoolExecutor, run_in_executor
 from langchain_text_splitters import TextSplitter
 
 from langchain_classic.retrievers import MultiVectorRetriever
@@ -73,13 +76,13 @@ class ParentDocumentRetriever(MultiVectorRetriever):
         metadata.
     """
 
-    def _split_docs_for_adding(
+    def _get_parents_with_ids(
         self,
         documents: list[Document],
         ids: list[str] | None = None,
         *,
         add_to_docstore: bool = True,
-    ) -> tuple[list[Document], list[tuple[str, Document]]]:
+    ) -> list[tuple[str, Document]]:
         if self.parent_splitter is not None:
             documents = self.parent_splitter.split_documents(documents)
         if ids is None:
@@ -95,11 +98,11 @@ class ParentDocumentRetriever(MultiVectorRetriever):
                 )
                 raise ValueError(msg)
             doc_ids = ids
+        return list(zip(doc_ids, documents, strict=True))
 
+    def _split_parents(self, full_docs: list[tuple[str, Document]]) -> list[Document]:
         docs = []
-        full_docs = []
-        for i, doc in enumerate(documents):
-            _id = doc_ids[i]
+        for _id, doc in full_docs:
             sub_docs = self.child_splitter.split_documents([doc])
             if self.child_metadata_fields is not None:
                 for _doc in sub_docs:
@@ -109,15 +112,27 @@ class ParentDocumentRetriever(MultiVectorRetriever):
             for _doc in sub_docs:
                 _doc.metadata[self.id_key] = _id
             docs.extend(sub_docs)
-            full_docs.append((_id, doc))
+        return docs
 
-        return docs, full_docs
+    def _split_docs_for_adding(
+        self,
+        documents: list[Document],
+        ids: list[str] | None = None,
+        *,
+        add_to_docstore: bool = True,
+    ) -> tuple[list[Document], list[tuple[str, Document]]]:
+        full_docs = self._get_parents_with_ids(
+            documents, ids, add_to_docstore=add_to_docstore
+        )
+        return self._split_parents(full_docs), full_docs
 
     def add_documents(
         self,
         documents: list[Document],
         ids: list[str] | None = None,
         add_to_docstore: bool = True,  # noqa: FBT001,FBT002
+        *,
+        batch_size: int | None = None,
         **kwargs: Any,
     ) -> None:
         """Adds documents to the docstore and vectorstores.
@@ -133,22 +148,47 @@ class ParentDocumentRetriever(MultiVectorRetriever):
                 This can be false if and only if `ids` are provided. You may want
                 to set this to False if the documents are already in the docstore
                 and you don't want to re-add them.
+            batch_size: If set, parent documents are ingested in batches of this
+                size, splitting the next batch into child chunks while the previous
+                batch is written to the vectorstore and the docstore. Use this to
+                bound memory and overlap splitting with embedding for large
+                corpora. If `None`, all documents are written at once.
             **kwargs: additional keyword arguments passed to the `VectorStore`.
         """
-        docs, full_docs = self._split_docs_for_adding(
+        full_docs = self._get_parents_with_ids(
             documents,
             ids,
             add_to_docstore=add_to_docstore,
         )
-        self.vectorstore.add_documents(docs, **kwargs)
-        if add_to_docstore:
-            self.docstore.mset(full_docs)
+        if batch_size is None:
+            self.vectorstore.add_documents(self._split_parents(full_docs), **kwargs)
+            if add_to_docstore:
+                self.docstore.mset(full_docs)
+            return
+
+        with ContextThreadPoolExecutor(max_workers=2) as executor:
+            pending: list[Future] = []
+            for i in range(0, len(full_docs), batch_size):
+                batch = full_docs[i : i + batch_size]
+                docs = self._split_parents(batch)
+                # Keep at most one batch in flight to bound memory
+                for future in pending:
+                    future.result()
+                pending = [
+                    executor.submit(self.vectorstore.add_documents, docs, **kwargs)
+                ]
+                if add_to_docstore:
+                    pending.append(executor.submit(self.docstore.mset, batch))
+            for future in pending:
+                future.result()
 
     async def aadd_documents(
         self,
         documents: list[Document],
         ids: list[str] | None = None,
         add_to_docstore: bool = True,  # noqa: FBT001,FBT002
+        *,
+        batch_size: int | None = None,
         **kwargs: Any,
     ) -> None:
         """Adds documents to the docstore and vectorstores.
@@ -164,13 +204,34 @@ class ParentDocumentRetriever(MultiVectorRetriever):
                 This can be false if and only if `ids` are provided. You may want
                 to set this to False if the documents are already in the docstore
                 and you don't want to re-add them.
+            batch_size: If set, parent documents are ingested in batches of this
+                size, splitting the next batch into child chunks (in a thread) while
+                the previous batch is written to the vectorstore and the docstore.
+                If `None`, all documents are written at once.
             **kwargs: additional keyword arguments passed to the `VectorStore`.
         """
-        docs, full_docs = self._split_docs_for_adding(
+        full_docs = self._get_parents_with_ids(
             documents,
             ids,
             add_to_docstore=add_to_docstore,
         )
-        await self.vectorstore.aadd_documents(docs, **kwargs)
-        if add_to_docstore:
-            await self.docstore.amset(full_docs)
+        if batch_size is None:
+            await self.vectorstore.aadd_documents(
+                self._split_parents(full_docs), **kwargs
+            )
+            if add_to_docstore:
+                await self.docstore.amset(full_docs)
+            return
+
+        pending: list[asyncio.Future] = []
+        for i in range(0, len(full_docs), batch_size):
+            batch = full_docs[i : i + batch_size]
+            docs = await run_in_executor(None, self._split_parents, batch)
+            # Keep at most one batch in flight to bound memory
+            await asyncio.gather(*pending)
+            pending = [
+                asyncio.ensure_future(self.vectorstore.aadd_documents(docs, **kwargs))
+            ]
+            if add_to_docstore:
+                pending.append(asyncio.ensure_future(self.docstore.amset(batch)))
+        await asyncio.gather(*pending)
@@ -1,4 +1,7 @@
+import contextlib
 import datetime
+from array import array
+from collections.abc import Sequence
 from copy import deepcopy
 from typing import Any
 
@@ -9,7 +12,7 @@ from langchain_core.callbacks import (
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.vectorstores import VectorStore
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, PrivateAttr
 from typing_extensions import override
 
 
@@ -18,6 +21,23 @@ def _get_hours_passed(time: datetime.datetime, ref_time: datetime.datetime) -> f
     return (time - ref_time).total_seconds() / 3600
 
 
+def _get_recency_scores(
+    decay_rate: float,
+    current_timestamp: float,
+    timestamps: Sequence[float],
+) -> list[float]:
+    """Compute `(1.0-decay_rate)**(hrs_passed)` for a batch of POSIX timestamps."""
+    try:
+        import numpy as np
+    except ImportError:
+        return [
+            (1.0 - decay_rate) ** ((current_timestamp - timestamp) / 3600)
+            for timestamp in timestamps
+        ]
+    hours_passed = (current_timestamp - np.asarray(timestamps, dtype=np.float64)) / 3600
+    return np.power(1.0 - decay_rate, hours_passed).tolist()
+
+
 class TimeWeightedVectorStoreRetriever(BaseRetriever):
     """Time Weighted Vector Store Retriever.
 
@@ -49,10 +69,39 @@ class TimeWeightedVectorStoreRetriever(BaseRetriever):
     None assigns no salience to documents not fetched from the vector store.
     """
 
+    max_memory_stream_size: int | None = None
+    """The maximum number of documents to keep in the memory stream.
+
+    When exceeded, the oldest documents are evicted from the memory stream and, when
+    their IDs are known, deleted from the vector store. None keeps all documents.
+    """
+
+    persist_batch_size: int | None = None
+    """Number of accessed documents after which `last_accessed_at` is persisted.
+
+    Retrieved documents whose `last_accessed_at` changed are re-added to the vector
+    store under their IDs once this many are pending, so that access times survive
+    restarts. Requires a vector store that upserts by ID. None never persists them;
+    call `persist_last_accessed` to persist them explicitly.
+    """
+
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
 
+    # `last_accessed_at` of each memory stream document as a POSIX timestamp
+    _last_accessed: array = PrivateAttr(default_factory=lambda: array("d"))
+    # `last_accessed_at` metadata value each timestamp was computed from
+    _last_accessed_values: list[Any] = PrivateAttr(default_factory=list)
+    # The memory stream list the timestamps were computed for
+    _indexed_stream: list[Document] | None = PrivateAttr(default=None)
+    # Vector store ID of each memory stream document, if known
+    _vector_ids: list[str | None] = PrivateAttr(default_factory=list)
+    # Number of documents evicted from the front of the memory stream
+    _buffer_offset: int = PrivateAttr(default=0)
+    # `buffer_idx` of documents whose `last_accessed_at` has not been persisted
+    _unpersisted: dict[int, None] = PrivateAttr(default_factory=dict)
+
     def _document_get_date(self, field: str, document: Document) -> datetime.datetime:
         """Return the value of the date field of a document."""
         if field in document.metadata:
@@ -61,18 +110,84 @@ class TimeWeightedVectorStoreRetriever(BaseRetriever):
             return document.metadata[field]
         return datetime.datetime.now()
 
+    def _sync_memory_stream(self) -> None:
+        """Rebuild the timestamp index if the memory stream was modified directly.
+
+        Replacing the list or changing its length rebuilds the index. Documents
+        replaced or edited in place are detected per document by
+        `_get_last_accessed`.
+        """
+        if self.memory_stream is self._indexed_stream and len(
+            self._last_accessed
+        ) == len(self.memory_stream):
+            return
+        if self.memory_stream is not self._indexed_stream:
+            # The IDs, offset and pending accesses belong to the previous list
+            self._vector_ids = []
+            self._unpersisted.clear()
+            self._buffer_offset = min(
+                (
+                    doc.metadata["buffer_idx"]
+                    for doc in self.memory_stream
+                    if "buffer_idx" in doc.metadata
+                ),
+                default=0,
+            )
+        self._indexed_stream = self.memory_stream
+        self._last_accessed_values = [
+            doc.metadata.get("last_accessed_at") for doc in self.memory_stream
+        ]
+        self._last_accessed = array(
+            "d",
+            (
+                self._document_get_date("last_accessed_at", doc).timestamp()
+                for doc in self.memory_stream
+            ),
+        )
+        self._vector_ids = (self._vector_ids + [None] * len(self.memory_stream))[
+            : len(self.memory_stream)
+        ]
+
+    def _get_last_accessed(self, position: int) -> float:
+        """Return the `last_accessed_at` timestamp of a memory stream document.
+
+        The cached timestamp is only used if the document still holds the value it
+        was computed from; otherwise it is recomputed.
+        """
+        value = self.memory_stream[position].metadata.get("last_accessed_at")
+        if value is None or value is not self._last_accessed_values[position]:
+            self._last_accessed[position] = self._document_get_date(
+                "last_accessed_at", self.memory_stream[position]
+            ).timestamp()
+            self._last_accessed_values[position] = value
+        return self._last_accessed[position]
+
+    def _get_position(self, buffer_idx: int) -> int | None:
+        """Return the position of a document in the memory stream, if not evicted."""
+        position = buffer_idx - self._buffer_offset
+        if 0 <= position < len(self.memory_stream):
+            return position
+        return None
+
     def _get_combined_score(
         self,
         document: Document,
         vector_relevance: float | None,
         current_time: datetime.datetime,
+        recency_score: float | None = None,
     ) -> float:
-        """Return the combined score for a document."""
-        hours_passed = _get_hours_passed(
-            current_time,
-            self._document_get_date("last_accessed_at", document),
-        )
-        score = (1.0 - self.decay_rate) ** hours_passed
+        """Return the combined score for a document.
+
+        `recency_score` is computed from the document's `last_accessed_at` unless
+        given, e.g. when computed for a batch of documents at once.
+        """
+        if recency_score is None:
+            hours_passed = _get_hours_passed(
+                current_time,
+                self._document_get_date("last_accessed_at", document),
+            )
+            recency_score = (1.0 - self.decay_rate) ** hours_passed
+        score = recency_score
         for key in self.other_score_keys:
             if key in document.metadata:
                 score += document.metadata[key]
@@ -82,6 +197,7 @@ class TimeWeightedVectorStoreRetriever(BaseRetriever):
 
     def get_salient_docs(self, query: str) -> dict[int, tuple[Document, float]]:
         """Return documents that are salient to the query."""
+        self._sync_memory_stream()
         docs_and_scores: list[tuple[Document, float]]
         docs_and_scores = self.vectorstore.similarity_search_with_relevance_scores(
             query,
@@ -91,12 +207,14 @@ class TimeWeightedVectorStoreRetriever(BaseRetriever):
         for fetched_doc, relevance in docs_and_scores:
             if "buffer_idx" in fetched_doc.metadata:
                 buffer_idx = fetched_doc.metadata["buffer_idx"]
-                doc = self.memory_stream[buffer_idx]
-                results[buffer_idx] = (doc, relevance)
+                position = self._get_position(buffer_idx)
+                if position is not None:
+                    results[buffer_idx] = (self.memory_stream[position], relevance)
         return results
 
     async def aget_salient_docs(self, query: str) -> dict[int, tuple[Document, float]]:
         """Return documents that are salient to the query."""
+        self._sync_memory_stream()
         docs_and_scores: list[tuple[Document, float]]
         docs_and_scores = (
             await self.vectorstore.asimilarity_search_with_relevance_scores(
@@ -108,29 +226,105 @@ class TimeWeightedVectorStoreRetriever(BaseRetriever):
         for fetched_doc, relevance in docs_and_scores:
             if "buffer_idx" in fetched_doc.metadata:
                 buffer_idx = fetched_doc.metadata["buffer_idx"]
-                doc = self.memory_stream[buffer_idx]
-                results[buffer_idx] = (doc, relevance)
+                position = self._get_position(buffer_idx)
+                if position is not None:
+                    results[buffer_idx] = (self.memory_stream[position], relevance)
         return results
 
     def _get_rescored_docs(
         self,
         docs_and_scores: dict[Any, tuple[Document, float | None]],
     ) -> list[Document]:
+        self._sync_memory_stream()
         current_time = datetime.datetime.now()
+        current_timestamp = current_time.timestamp()
+        # Recency of the memory stream documents is computed in one batch from the
+        # cached timestamps; other documents are scored one by one
+        indexed = {
+            buffer_idx: position
+            for buffer_idx in docs_and_scores
+            if (position := self._get_position(buffer_idx)) is not None
+        }
+        recency_scores = dict(
+            zip(
+                indexed,
+                _get_recency_scores(
+                    self.decay_rate,
+                    current_timestamp,
+                    [
+                        self._get_last_accessed(position)
+                        for position in indexed.values()
+                    ],
+                ),
+                strict=True,
+            )
+        )
         rescored_docs = [
-            (doc, self._get_combined_score(doc, relevance, current_time))
-            for doc, relevance in docs_and_scores.values()
+            (
+                buffer_idx,
+                self._get_combined_score(
+                    doc, relevance, current_time, recency_scores.get(buffer_idx)
+                ),
+            )
+            for buffer_idx, (doc, relevance) in docs_and_scores.items()
         ]
         rescored_docs.sort(key=lambda x: x[1], reverse=True)
         result = []
         # Ensure frequently accessed memories aren't forgotten
-        for doc, _ in rescored_docs[: self.k]:
-            # TODO: Update vector store doc once `update` method is exposed.
-            buffered_doc = self.memory_stream[doc.metadata["buffer_idx"]]
+        for buffer_idx, _ in rescored_docs[: self.k]:
+            position = self._get_position(buffer_idx)
+            if position is None:
+                continue
+            buffered_doc = self.memory_stream[position]
             buffered_doc.metadata["last_accessed_at"] = current_time
+            self._last_accessed[position] = current_timestamp
+            self._last_accessed_values[position] = current_time
+            if self.persist_batch_size is not None:
+                self._unpersisted[buffer_idx] = None
             result.append(buffered_doc)
         return result
 
+    def _pop_unpersisted(self) -> tuple[list[Document], list[str]]:
+        """Return the accessed documents with a known ID and clear the pending set."""
+        docs: list[Document] = []
+        ids: list[str] = []
+        for buffer_idx in self._unpersisted:
+            position = self._get_position(buffer_idx)
+            if position is None:
+                continue
+            vector_id = self._vector_ids[position]
+            if vector_id is not None:
+                docs.append(self.memory_stream[position])
+                ids.append(vector_id)
+        self._unpersisted.clear()
+        return docs, ids
+
+    def persist_last_accessed(self) -> None:
+        """Re-add accessed documents to the vector store to persist their access time.
+
+        Only documents added through `add_documents` (whose IDs are known) are
+        persisted.
+        """
+        docs, ids = self._pop_unpersisted()
+        if docs:
+            self.vectorstore.add_documents(docs, ids=ids)
+
+    async def apersist_last_accessed(self) -> None:
+        """Re-add accessed documents to the vector store to persist their access time.
+
+        Only documents added through `add_documents` (whose IDs are known) are
+        persisted.
+        """
+        docs, ids = self._pop_unpersisted()
+        if docs:
+            await self.vectorstore.aadd_documents(docs, ids=ids)
+
+    def _should_persist(self) -> bool:
+        return (
+            self.persist_batch_size is not None
+            and len(self._unpersisted) >= self.persist_batch_size
+        )
+
     @override
     def _get_relevant_documents(
         self,
@@ -144,7 +338,10 @@ class TimeWeightedVectorStoreRetriever(BaseRetriever):
         }
         # If a doc is considered salient, update the salience score
         docs_and_scores.update(self.get_salient_docs(query))
-        return self._get_rescored_docs(docs_and_scores)
+        result = self._get_rescored_docs(docs_and_scores)
+        if self._should_persist():
+            self.persist_last_accessed()
+        return result
 
     @override
     async def _aget_relevant_documents(
@@ -159,23 +356,73 @@ class TimeWeightedVectorStoreRetriever(BaseRetriever):
         }
         # If a doc is considered salient, update the salience score
         docs_and_scores.update(await self.aget_salient_docs(query))
-        return self._get_rescored_docs(docs_and_scores)
+        result = self._get_rescored_docs(docs_and_scores)
+        if self._should_persist():
+            await self.apersist_last_accessed()
+        return result
 
-    def add_documents(self, documents: list[Document], **kwargs: Any) -> list[str]:
-        """Add documents to vectorstore."""
-        current_time = kwargs.get("current_time")
+    def _prepare_documents(
+        self, documents: list[Document], current_time: datetime.datetime | None
+    ) -> list[Document]:
+        """Copy the documents and add them to the memory stream."""
+        self._sync_memory_stream()
         if current_time is None:
             current_time = datetime.datetime.now()
         # Avoid mutating input documents
         dup_docs = [deepcopy(d) for d in documents]
+        next_buffer_idx = self._buffer_offset + len(self.memory_stream)
         for i, doc in enumerate(dup_docs):
             if "last_accessed_at" not in doc.metadata:
                 doc.metadata["last_accessed_at"] = current_time
             if "created_at" not in doc.metadata:
                 doc.metadata["created_at"] = current_time
-            doc.metadata["buffer_idx"] = len(self.memory_stream) + i
+            doc.metadata["buffer_idx"] = next_buffer_idx + i
+            self._last_accessed.append(
+                self._document_get_date("last_accessed_at", doc).timestamp()
+            )
+            self._last_accessed_values.append(doc.metadata["last_accessed_at"])
         self.memory_stream.extend(dup_docs)
-        return self.vectorstore.add_documents(dup_docs, **kwargs)
+        self._vector_ids.extend([None] * len(dup_docs))
+        return dup_docs
+
+    def _record_ids_and_evict(self, n_docs: int, ids: list[str]) -> list[str]:
+        """Record the IDs of the last added documents and evict the oldest ones.
+
+        Returns:
+            The IDs of the evicted documents to delete from the vector store.
+        """
+        if len(ids) == n_docs and n_docs:
+            self._vector_ids[-n_docs:] = ids
+        if (
+            self.max_memory_stream_size is None
+            or len(self.memory_stream) <= self.max_memory_stream_size
+        ):
+            return []
+        n_evicted = len(self.memory_stream) - self.max_memory_stream_size
+        evicted_ids = [
+            vector_id
+            for vector_id in self._vector_ids[:n_evicted]
+            if vector_id is not None
+        ]
+        for buffer_idx in range(self._buffer_offset, self._buffer_offset + n_evicted):
+            self._unpersisted.pop(buffer_idx, None)
+        del self.memory_stream[:n_evicted]
+        del self._last_accessed[:n_evicted]
+        del self._last_accessed_values[:n_evicted]
+        del self._vector_ids[:n_evicted]
+        self._buffer_offset += n_evicted
+        return evicted_ids
+
+    def add_documents(self, documents: list[Document], **kwargs: Any) -> list[str]:
+        """Add documents to vectorstore."""
+        dup_docs = self._prepare_documents(documents, kwargs.get("current_time"))
+        ids = self.vectorstore.add_documents(dup_docs, **kwargs)
+        evicted_ids = self._record_ids_and_evict(len(dup_docs), ids)
+        if evicted_ids:
+            # Not every vector store supports deletion
+            with contextlib.suppress(NotImplementedError):
+                self.vectorstore.delete(evicted_ids)
+        return ids
 
     async def aadd_documents(
         self,
@@ -183,16 +430,11 @@ class TimeWeightedVectorStoreRetriever(BaseRetriever):
         **kwargs: Any,
     ) -> list[str]:
         """Add documents to vectorstore."""
-        current_time = kwargs.get("current_time")
-        if current_time is None:
-            current_time = datetime.datetime.now()
-        # Avoid mutating input documents
-        dup_docs = [deepcopy(d) for d in documents]
-        for i, doc in enumerate(dup_docs):
-            if "last_accessed_at" not in doc.metadata:
-                doc.metadata["last_accessed_at"] = current_time
-            if "created_at" not in doc.metadata:
-                doc.metadata["created_at"] = current_time
-            doc.metadata["buffer_idx"] = len(self.memory_stream) + i
-        self.memory_stream.extend(dup_docs)
-        return await self.vectorstore.aadd_documents(dup_docs, **kwargs)
+        dup_docs = self._prepare_documents(documents, kwargs.get("current_time"))
+        ids = await self.vectorstore.aadd_documents(dup_docs, **kwargs)
+        evicted_ids = self._record_ids_and_evict(len(dup_docs), ids)
+        if evicted_ids:
+            # Not every vector store supports deletion
+            with contextlib.suppress(NotImplementedError):
+                await self.vectorstore.adelete(evicted_ids)
+        return ids
@@ -148,3 +148,23 @@ def test_embedding_distance_eval_chain(
         reference=reference,
     )
     assert result["score"] < 1.0
+
+
+@pytest.mark.requires("openai", "tiktoken")
+def test_embedding_distance_eval_chain_batch(
+    embedding_distance_eval_chain: EmbeddingDistanceEvalChain,
+) -> None:
+    predictions = ["Hi", "A single cat", "Hi"]
+    references = ["Hello", "A single cat", "Goodbye"]
+    result = embedding_distance_eval_chain.evaluate_strings_batch(
+        predictions, references, batch_size=2
+    )
+    expected = [
+        embedding_distance_eval_chain.evaluate_strings(
+            prediction=prediction, reference=reference
+        )["score"]
+        for prediction, reference in zip(predictions, references, strict=True)
+    ]
+    assert np.allclose(result["scores"], expected, atol=1e-6)
+    assert np.isclose(result["mean"], np.mean(expected), atol=1e-6)
+    assert np.isclose(result["min"], 0.0, atol=1e-6)
@@ -1,13 +1,20 @@
 """Test functionality related to combining documents."""
 
+import asyncio
 import re
+import threading
+import time
 from typing import Any
 
 import pytest
 from langchain_core.documents import Document
 from langchain_core.prompts import PromptTemplate, aformat_document, format_document
+from typing_extensions import override
 
+from langchain_classic.chains.combine_documents.base import BaseCombineDocumentsChain
 from langchain_classic.chains.combine_documents.reduce import (
+    ReduceDocumentsChain,
+    _pack_docs,
     collapse_docs,
     split_list_of_docs,
 )
@@ -77,6 +84,128 @@ def test__split_list_works_correctly() -> None:
     assert doc_list == expected_result
 
 
+def _overhead_docs_len_func(docs: list[Document]) -> int:
+    # A prompt template and separators around the documents
+    return 5 + len("\n\n".join(d.page_content for d in docs))
+
+
+def _superadditive_docs_len_func(docs: list[Document]) -> int:
+    # Grows faster than the per-document lengths predict
+    return len(_fake_combine_docs_func(docs)) + len(docs) ** 2
+
+
+@pytest.mark.parametrize(
+    "length_func",
+    [_fake_docs_len_func, _overhead_docs_len_func, _superadditive_docs_len_func],
+)
+@pytest.mark.parametrize("token_max", [15, 20, 45])
+def test__pack_docs_matches_split_list(length_func: Any, token_max: int) -> None:
+    """Test that packing by per-document lengths gives the same groups."""
+    docs = [Document(page_content="x" * (1 + (i * 7) % 9)) for i in range(40)]
+    calls: list[int] = []
+
+    def _counting_len_func(docs: list[Document]) -> int:
+        calls.append(len(docs))
+        return length_func(docs)
+
+    assert _pack_docs(docs, _counting_len_func, token_max) == split_list_of_docs(
+        docs, length_func, token_max
+    )
+    # Each document is measured on its own instead of within growing groups
+    assert sum(calls) < 3 * len(docs) + 2 * token_max
+
+
+def test__pack_docs_long_single_doc() -> None:
+    """Test packing a doc longer than the context length."""
+    docs = [Document(page_content="foo"), Document(page_content="foo" * 100)]
+    with pytest.raises(
+        ValueError, match="A single document was longer than the context length"
+    ):
+        _pack_docs(docs, _fake_docs_len_func, 100)
+
+
+class _ConcatChain(BaseCombineDocumentsChain):
+    """Collapses documents to their first letters and tracks concurrent calls."""
+
+    active: int = 0
+    max_active: int = 0
+    lock: Any = None
+
+    @override
+    def prompt_length(self, docs: list[Document], **kwargs: Any) -> int | None:
+        return len(_fake_combine_docs_func(docs))
+
+    def _enter(self) -> None:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def _exit(self) -> None:
+        with self.lock:
+            self.active -= 1
+
+    @override
+    def combine_docs(self, docs: list[Document], **kwargs: Any) -> tuple[str, dict]:
+        self._enter()
+        time.sleep(0.01)
+        self._exit()
+        return "".join(d.page_content[0] for d in docs), {}
+
+    @override
+    async def acombine_docs(
+        self, docs: list[Document], **kwargs: Any
+    ) -> tuple[str, dict]:
+        # Runs on the event loop thread, so no lock is needed
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return "".join(d.page_content[0] for d in docs), {}
+
+
+def _make_concurrent_reduce_chain(
+    max_concurrency: int | None,
+) -> tuple[ReduceDocumentsChain, _ConcatChain]:
+    collapse_chain = _ConcatChain(lock=threading.Lock())
+    chain = ReduceDocumentsChain(
+        combine_documents_chain=_ConcatChain(lock=threading.Lock()),
+        collapse_documents_chain=collapse_chain,
+        token_max=40,
+        collapse_max_concurrency=max_concurrency,
+    )
+    return chain, collapse_chain
+
+
+# Four groups of ten documents collapse to "0123456789" each
+_CONCURRENT_COLLAPSE_DOCS = [Document(page_content=f"{i % 10}" * 4) for i in range(40)]
+
+
+@pytest.mark.parametrize(
+    ("max_concurrency", "expected_max_active"), [(None, 4), (2, 2)]
+)
+def test_reduce_documents_chain_collapses_concurrently(
+    max_concurrency: int | None, expected_max_active: int
+) -> None:
+    """Test that the groups of a collapse round are collapsed concurrently."""
+    chain, collapse_chain = _make_concurrent_reduce_chain(max_concurrency)
+
+    assert chain.combine_docs(_CONCURRENT_COLLAPSE_DOCS) == ("0000", {})
+    assert collapse_chain.max_active == expected_max_active
+
+
+@pytest.mark.parametrize(
+    ("max_concurrency", "expected_max_active"), [(None, 4), (2, 2)]
+)
+async def test_reduce_documents_chain_acollapses_concurrently(
+    max_concurrency: int | None, expected_max_active: int
+) -> None:
+    """Test that the groups of a collapse round are collapsed concurrently."""
+    chain, collapse_chain = _make_concurrent_reduce_chain(max_concurrency)
+
+    assert await chain.acombine_docs(_CONCURRENT_COLLAPSE_DOCS) == ("0000", {})
+    assert collapse_chain.max_active == expected_max_active
+
+
 def test__collapse_docs_no_metadata() -> None:
     """Test collapse documents functionality when no metadata."""
     docs = [
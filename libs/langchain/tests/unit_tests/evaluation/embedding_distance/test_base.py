@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from typing_extensions import override
+
+from langchain_classic.evaluation.embedding_distance import (
+    EmbeddingDistance,
+    EmbeddingDistanceEvalChain,
+)
+
+# The chain validates its embeddings against `OpenAIEmbeddings`, so it needs the
+# package even with fake embeddings.
+pytestmark = pytest.mark.requires("langchain_openai")
+
+
+class _CountingEmbeddings(DeterministicFakeEmbedding):
+    """Fake embeddings that record the texts of each `embed_documents` call."""
+
+    calls: list[list[str]] = []
+
+    @override
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return super().embed_documents(texts)
+
+
+class _ZeroEmbeddings(DeterministicFakeEmbedding):
+    """Fake embeddings that embed the empty string as the zero vector."""
+
+    @override
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [
+            [0.0] * self.size if not text else self.embed_query(text) for text in texts
+        ]
+
+
+@pytest.fixture
+def matrices() -> tuple[np.ndarray, np.ndarray]:
+    """Create two matrices of random vectors with some equal entries."""
+    rng = np.random.default_rng(0)
+    return rng.random((20, 10)).round(1), rng.random((20, 10)).round(1)
+
+
+@pytest.mark.parametrize("metric", list(EmbeddingDistance))
+def test_compute_scores_matches_compute_score(
+    metric: EmbeddingDistance,
+    matrices: tuple[np.ndarray, np.ndarray],
+) -> None:
+    chain = EmbeddingDistanceEvalChain(
+        embeddings=DeterministicFakeEmbedding(size=10), distance_metric=metric
+    )
+    a, b = matrices
+
+    scores = chain._compute_scores(a, b)
+
+    expected = [chain._compute_score(np.array([a[i], b[i]])) for i in range(len(a))]
+    assert np.allclose(scores, expected)
+
+
+async def test_evaluate_strings_batch() -> None:
+    embeddings = _CountingEmbeddings(size=10, calls=[])
+    chain = EmbeddingDistanceEvalChain(embeddings=embeddings)
+    predictions = ["a", "b", "c", "a", "b"]
+    references = ["b", "c", "d", "e", "b"]
+    expected = [
+        chain.evaluate_strings(prediction=p, reference=r)["score"]
+        for p, r in zip(predictions, references, strict=True)
+    ]
+    embeddings.calls.clear()
+
+    result = chain.evaluate_strings_batch(predictions, references, batch_size=2)
+    # Each of the five unique texts is embedded once, two per request
+    assert embeddings.calls == [["a", "b"], ["c", "d"], ["e"]]
+    embeddings.calls.clear()
+    async_result = await chain.aevaluate_strings_batch(
+        predictions, references, batch_size=2
+    )
+    assert embeddings.calls == [["a", "b"], ["c", "d"], ["e"]]
+
+    for output in (result, async_result):
+        assert np.allclose(output["scores"], expected)
+        assert output["mean"] == pytest.approx(np.mean(expected))
+        assert output["std"] == pytest.approx(np.std(expected))
+        assert output["min"] == pytest.approx(min(expected))
+        assert output["max"] == pytest.approx(max(expected))
+
+
+async def test_evaluate_strings_batch_empty() -> None:
+    embeddings = _CountingEmbeddings(size=10, calls=[])
+    chain = EmbeddingDistanceEvalChain(embeddings=embeddings)
+    expected = {"scores": [], "mean": None, "std": None, "min": None, "max": None}
+
+    assert chain.evaluate_strings_batch([], []) == expected
+    assert await chain.aevaluate_strings_batch([], []) == expected
+    assert embeddings.calls == []
+
+
+async def test_evaluate_strings_batch_length_mismatch() -> None:
+    chain = EmbeddingDistanceEvalChain(embeddings=DeterministicFakeEmbedding(size=10))
+
+    with pytest.raises(ValueError, match="2 predictions but 1 references"):
+        chain.evaluate_strings_batch(["a", "b"], ["a"])
+    with pytest.raises(ValueError, match="2 predictions but 1 references"):
+        await chain.aevaluate_strings_batch(["a", "b"], ["a"])
+
+
+async def test_zero_vector_cosine_distance_raises() -> None:
+    """A zero vector makes the cosine distance undefined in both code paths."""
+    chain = EmbeddingDistanceEvalChain(embeddings=_ZeroEmbeddings(size=10))
+
+    with pytest.raises(ValueError, match="NaN values found"):
+        chain.evaluate_strings(prediction="", reference="a")
+    with pytest.raises(ValueError, match="NaN values found"):
+        chain.evaluate_strings_batch(["a", ""], ["b", "a"])
+    with pytest.raises(ValueError, match="NaN values found"):
+        await chain.aevaluate_strings_batch(["a", ""], ["b", "a"])
@@ -1,5 +1,6 @@
 from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import (
     Any,
 )
@@ -12,6 +13,7 @@ from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.indexing.api import _abatch, _get_document_with_hash
 from langchain_core.vectorstores import VST, VectorStore
+from sqlalchemy import text
 from typing_extensions import override
 
 from langchain_classic.indexes import aindex, index
@@ -174,6 +176,33 @@ _JANUARY_FIRST = datetime(2021, 1, 1, tzinfo=timezone.utc).timestamp()
 _JANUARY_SECOND = datetime(2021, 1, 2, tzinfo=timezone.utc).timestamp()
 
 
+def test_record_manager_list_keys_uses_index(tmp_path: Path) -> None:
+    """Test that indexes missing from an existing table are created."""
+    db_url = f"sqlite:///{tmp_path / 'records.db'}"
+    record_manager = SQLRecordManager("kittens", db_url=db_url)
+    record_manager.create_schema()
+    with record_manager.engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_namespace_group_id_updated_at"))
+
+    record_manager = SQLRecordManager("kittens", db_url=db_url)
+    record_manager.create_schema()
+    with patch.object(record_manager, "get_time", return_value=_JANUARY_SECOND):
+        record_manager.update(["key1", "key2"], group_ids=["1", "2"])
+    assert record_manager.list_keys(group_ids=["2"], before=_JANUARY_SECOND + 1) == [
+        "key2"
+    ]
+
+    with record_manager.engine.connect() as connection:
+        plan = connection.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT key FROM upsertion_record "
+                "WHERE namespace = 'kittens' AND group_id IN ('1', '2') "
+                "AND updated_at < 1"
+            )
+        ).fetchall()
+    assert "ix_namespace_group_id_updated_at" in str(plan)
+
+
 def test_indexing_same_content(
     record_manager: SQLRecordManager,
     vector_store: InMemoryVectorStore,
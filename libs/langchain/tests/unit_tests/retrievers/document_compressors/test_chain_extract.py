@@ -1,5 +1,6 @@
 from langchain_core.documents import Document
 from langchain_core.language_models import FakeListChatModel
+from langchain_core.runnables import RunnableLambda
 
 from langchain_classic.retrievers.document_compressors import LLMChainExtractor
 
@@ -86,3 +87,21 @@ async def test_llm_chain_extractor_async() -> None:
         ),
     ]
     assert output == expected
+
+
+def test_llm_chain_extractor_caches_extractions() -> None:
+    documents = [Document(page_content="foo"), Document(page_content="bar")]
+    extracted: list[str] = []
+
+    def extract(chain_input: dict) -> str:
+        extracted.append(chain_input["context"])
+        return chain_input["context"].upper() if chain_input["context"] != "bar" else ""
+
+    doc_compressor = LLMChainExtractor(
+        llm_chain=RunnableLambda(extract), cache_size=10, max_concurrency=1
+    )
+    first = doc_compressor.compress_documents(documents, "query")
+    second = doc_compressor.compress_documents(documents, "query")
+
+    assert first == second == [Document(page_content="FOO")]
+    assert extracted == ["foo", "bar"]
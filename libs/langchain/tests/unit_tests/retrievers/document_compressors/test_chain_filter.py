@@ -1,5 +1,6 @@
 from langchain_core.documents import Document
 from langchain_core.language_models import FakeListChatModel
+from langchain_core.runnables import RunnableLambda
 
 from langchain_classic.retrievers.document_compressors import LLMChainFilter
 
@@ -46,3 +47,37 @@ async def test_llm_chain_extractor_async() -> None:
     )
     expected = documents[:2]
     assert output == expected
+
+
+def test_llm_chain_filter_stops_after_k_relevant_documents() -> None:
+    documents = [Document(page_content=str(i)) for i in range(10)]
+    judged: list[str] = []
+
+    def judge(chain_input: dict) -> bool:
+        judged.append(chain_input["context"])
+        return int(chain_input["context"]) % 2 == 0
+
+    doc_compressor = LLMChainFilter(
+        llm_chain=RunnableLambda(judge), k=2, max_concurrency=2
+    )
+    output = doc_compressor.compress_documents(documents, "even")
+
+    assert [doc.page_content for doc in output] == ["0", "2"]
+    assert sorted(judged) == ["0", "1", "2", "3"]
+
+
+async def test_llm_chain_filter_caches_judgements() -> None:
+    documents = [Document(page_content=str(i)) for i in range(4)]
+    judged: list[str] = []
+
+    def judge(chain_input: dict) -> bool:
+        judged.append(chain_input["context"])
+        return chain_input["context"] != "1"
+
+    doc_compressor = LLMChainFilter(llm_chain=RunnableLambda(judge), cache_size=10)
+    first = doc_compressor.compress_documents(documents, "query")
+    second = await doc_compressor.acompress_documents(documents, "query")
+    doc_compressor.compress_documents(documents[:1], "other query")
+
+    assert first == second == [documents[0], documents[2], documents[3]]
+    assert sorted(judged) == ["0", "0", "1", "2", "3"]
@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from typing_extensions import override
+
+from langchain_classic.retrievers.document_compressors import CrossEncoderReranker
+from langchain_classic.retrievers.document_compressors.cross_encoder import (
+    BaseCrossEncoder,
+)
+
+
+class FakeCrossEncoder(BaseCrossEncoder):
+    """Scores a pair by the integer in the document text."""
+
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
+    @override
+    def score(self, text_pairs: list[tuple[str, str]]) -> list[float]:
+        self.batches.append(len(text_pairs))
+        return [float(text) for _, text in text_pairs]
+
+
+DOCUMENTS = [Document(page_content=str(i % 7)) for i in range(20)]
+
+
+def test_cross_encoder_reranker_top_n() -> None:
+    model = FakeCrossEncoder()
+    reranker = CrossEncoderReranker(model=model, top_n=3)
+
+    output = reranker.compress_documents(DOCUMENTS, "query")
+
+    # Ties keep the input order
+    assert output == [DOCUMENTS[6], DOCUMENTS[13], DOCUMENTS[5]]
+    assert model.batches == [20]
+
+
+@pytest.mark.parametrize("use_executor", [True, False])
+async def test_cross_encoder_reranker_batches(*, use_executor: bool) -> None:
+    model = FakeCrossEncoder()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        reranker = CrossEncoderReranker(
+            model=model,
+            top_n=3,
+            batch_size=8,
+            executor=executor if use_executor else None,
+        )
+        sync_output = reranker.compress_documents(DOCUMENTS, "query")
+        async_output = await reranker.acompress_documents(DOCUMENTS, "query")
+
+    assert sync_output == async_output == [DOCUMENTS[6], DOCUMENTS[13], DOCUMENTS[5]]
+    assert sorted(model.batches) == [4, 4, 8, 8, 8, 8]
+
+
+async def test_cross_encoder_reranker_prefilter() -> None:
+    embeddings = DeterministicFakeEmbedding(size=16)
+    documents = [Document(page_content=str(i)) for i in range(10)]
+    model = FakeCrossEncoder()
+    reranker = CrossEncoderReranker(
+        model=model,
+        top_n=2,
+        prefilter_embeddings=embeddings,
+        prefilter_top_m=4,
+    )
+
+    sync_output = reranker.compress_documents(documents, "7")
+    async_output = await reranker.acompress_documents(documents, "7")
+
+    # Only the prefiltered documents are cross-encoded, including the exact match
+    assert model.batches == [4, 4]
+    assert sync_output == async_output
+    assert Document(page_content="7") in sync_output
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from langchain_classic.retrievers.document_compressors import EmbeddingsFilter
+
+pytest.importorskip("langchain_community", reason="langchain_community not installed")
+
+
+class _CountingEmbeddings(DeterministicFakeEmbedding):
+    """Fake embeddings that count how many texts and queries were embedded."""
+
+    num_documents: int = 0
+    num_queries: int = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.num_documents += len(texts)
+        return super().embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        self.num_queries += 1
+        return super().embed_query(text)
+
+
+def _cosine_similarity(x: list[list[float]], y: list[list[float]]) -> np.ndarray:
+    x_array, y_array = np.array(x), np.array(y)
+    norms = np.outer(np.linalg.norm(x_array, axis=1), np.linalg.norm(y_array, axis=1))
+    return np.asarray(x_array @ y_array.T / norms)
+
+
+def _make_documents(
+    embeddings: DeterministicFakeEmbedding, query: str
+) -> list[Document]:
+    query_embedding = {"query": query, "embedding": embeddings.embed_query(query)}
+    return [
+        Document(
+            page_content=text,
+            metadata={
+                "i": i,
+                "embedding": embeddings.embed_query(text),
+                "query_embedding": query_embedding,
+            },
+        )
+        for i, text in enumerate(["foo", "bar", "baz"])
+    ]
+
+
+def _make_filter(embeddings: DeterministicFakeEmbedding) -> EmbeddingsFilter:
+    return EmbeddingsFilter(
+        embeddings=embeddings,
+        similarity_fn=_cosine_similarity,
+        k=2,
+        document_embedding_key="embedding",
+        query_embedding_key="query_embedding",
+    )
+
+
+async def test_embeddings_filter_reuses_precomputed_embeddings() -> None:
+    embeddings = _CountingEmbeddings(size=16)
+    documents = _make_documents(embeddings, "foo")
+    embeddings.num_queries = 0
+    embeddings_filter = _make_filter(embeddings)
+
+    for output in (
+        embeddings_filter.compress_documents(documents, "foo"),
+        await embeddings_filter.acompress_documents(documents, "foo"),
+    ):
+        assert output[0].page_content == "foo"
+        assert len(output) == 2
+        # The embedding keys are removed from the returned metadata
+        assert all(set(doc.metadata) == {"i"} for doc in output)
+    assert embeddings.num_documents == 0
+    assert embeddings.num_queries == 0
+
+
+def test_embeddings_filter_embeds_mismatched_query() -> None:
+    embeddings = _CountingEmbeddings(size=16)
+    # The retriever searched with a different (e.g. rewritten) query
+    documents = _make_documents(embeddings, "bar")
+    embeddings.num_queries = 0
+
+    output = _make_filter(embeddings).compress_documents(documents, "foo")
+
+    assert output[0].page_content == "foo"
+    assert embeddings.num_queries == 1
+    assert embeddings.num_documents == 0
+
+
+def test_embeddings_filter_with_partial_metadata() -> None:
+    embeddings = _CountingEmbeddings(size=16)
+    documents = _make_documents(embeddings, "foo")
+    del documents[1].metadata["embedding"]
+    del documents[2].metadata["query_embedding"]
+    embeddings.num_queries = 0
+
+    output = _make_filter(embeddings).compress_documents(documents, "foo")
+
+    assert output[0].page_content == "foo"
+    assert all(set(doc.metadata) == {"i"} for doc in output)
+    # Vectors are only reused when every document carries them
+    assert embeddings.num_documents == len(documents)
+    assert embeddings.num_queries == 1
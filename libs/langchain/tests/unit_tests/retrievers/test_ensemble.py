@@ -1,4 +1,12 @@
-from langchain_core.callbacks.manager import CallbackManagerForRetrieverRun
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from langchain_core.callbacks.manager import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
 from typing_extensions import override
@@ -20,6 +28,31 @@ class MockRetriever(BaseRetriever):
         return self.docs
 
 
+class SlowRetriever(BaseRetriever):
+    docs: list[Document]
+    delay: float
+
+    @override
+    def _get_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: CallbackManagerForRetrieverRun | None = None,
+    ) -> list[Document]:
+        time.sleep(self.delay)
+        return self.docs
+
+    @override
+    async def _aget_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: AsyncCallbackManagerForRetrieverRun | None = None,
+    ) -> list[Document]:
+        await asyncio.sleep(self.delay)
+        return self.docs
+
+
 def test_invoke() -> None:
     documents1 = [
         Document(page_content="a", metadata={"id": 1}),
@@ -92,3 +125,119 @@ def test_invoke() -> None:
     # Additionally, the document with page_content "b" will be ranked 1st.
     assert len(ranked_documents) == 3
     assert ranked_documents[0].page_content == "b"
+
+
+def test_invoke_runs_retrievers_concurrently() -> None:
+    retrievers = [
+        SlowRetriever(docs=[Document(page_content=str(i))], delay=0.2) for i in range(4)
+    ]
+    ensemble_retriever = EnsembleRetriever(retrievers=retrievers)
+
+    start = time.perf_counter()
+    ranked_documents = ensemble_retriever.invoke("_")
+    elapsed = time.perf_counter() - start
+
+    assert [doc.page_content for doc in ranked_documents] == ["0", "1", "2", "3"]
+    assert elapsed < 0.6
+
+
+def test_invoke_fuses_partial_results_on_timeout() -> None:
+    fast = MockRetriever(docs=[Document(page_content="a")])
+    slow = SlowRetriever(docs=[Document(page_content="b")], delay=1)
+    ensemble_retriever = EnsembleRetriever(
+        retrievers=[fast, slow], retriever_timeout=0.1
+    )
+
+    start = time.perf_counter()
+    ranked_documents = ensemble_retriever.invoke("_")
+
+    assert time.perf_counter() - start < 0.5
+    assert [doc.page_content for doc in ranked_documents] == ["a"]
+
+
+def test_invoke_raises_when_all_retrievers_time_out() -> None:
+    slow = SlowRetriever(docs=[Document(page_content="b")], delay=1)
+    ensemble_retriever = EnsembleRetriever(retrievers=[slow], retriever_timeout=0.05)
+
+    with pytest.raises(TimeoutError):
+        ensemble_retriever.invoke("_")
+
+
+async def test_ainvoke_fuses_partial_results_on_timeout() -> None:
+    fast = MockRetriever(docs=[Document(page_content="a")])
+    slow = SlowRetriever(docs=[Document(page_content="b")], delay=1)
+    ensemble_retriever = EnsembleRetriever(
+        retrievers=[fast, slow], retriever_timeout=0.1
+    )
+
+    ranked_documents = await ensemble_retriever.ainvoke("_")
+
+    assert [doc.page_content for doc in ranked_documents] == ["a"]
+
+
+def test_invoke_reuses_executor() -> None:
+    retrievers = [MockRetriever(docs=[Document(page_content=str(i))]) for i in range(2)]
+    ensemble_retriever = EnsembleRetriever(retrievers=retrievers)
+
+    ensemble_retriever.invoke("_")
+    executor = ensemble_retriever._executor
+    ensemble_retriever.invoke("_")
+
+    assert executor is not None
+    assert ensemble_retriever._executor is executor
+
+
+def test_invoke_with_executor() -> None:
+    retrievers = [MockRetriever(docs=[Document(page_content=str(i))]) for i in range(2)]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ensemble_retriever = EnsembleRetriever(retrievers=retrievers, executor=executor)
+        for _ in range(2):
+            ranked_documents = ensemble_retriever.invoke("_")
+            assert [doc.page_content for doc in ranked_documents] == ["0", "1"]
+
+    assert ensemble_retriever._executor is None
+
+
+def test_invoke_limits_concurrency() -> None:
+    retrievers = [
+        SlowRetriever(docs=[Document(page_content=str(i))], delay=0.1) for i in range(4)
+    ]
+    ensemble_retriever = EnsembleRetriever(retrievers=retrievers)
+
+    start = time.perf_counter()
+    ranked_documents = ensemble_retriever.invoke("_", config={"max_concurrency": 2})
+    elapsed = time.perf_counter() - start
+
+    assert [doc.page_content for doc in ranked_documents] == ["0", "1", "2", "3"]
+    assert elapsed >= 0.2
+
+
+def test_invoke_skips_retrievers_not_started_before_timeout() -> None:
+    retrievers = [
+        MockRetriever(docs=[Document(page_content="a")]),
+        SlowRetriever(docs=[Document(page_content="b")], delay=1),
+        MockRetriever(docs=[Document(page_content="c")]),
+    ]
+    ensemble_retriever = EnsembleRetriever(retrievers=retrievers, retriever_timeout=0.1)
+
+    ranked_documents = ensemble_retriever.invoke("_", config={"max_concurrency": 1})
+
+    # The third retriever never started, since the second one held the only slot
+    assert [doc.page_content for doc in ranked_documents] == ["a"]
+
+
+def test_weighted_reciprocal_rank_accumulates_duplicates() -> None:
+    ensemble_retriever = EnsembleRetriever(
+        retrievers=[MockRetriever(docs=[]), MockRetriever(docs=[])],
+        weights=[0.3, 0.7],
+        c=0,
+    )
+    doc_lists = [
+        [Document(page_content="a"), Document(page_content="b")],
+        [Document(page_content="c"), Document(page_content="b")],
+    ]
+
+    ranked_documents = ensemble_retriever.weighted_reciprocal_rank(doc_lists)
+
+    # b: 0.3/2 + 0.7/2 = 0.5, c: 0.7/1 = 0.7, a: 0.3/1 = 0.3
+    assert [doc.page_content for doc in ranked_documents] == ["c", "b", "a"]
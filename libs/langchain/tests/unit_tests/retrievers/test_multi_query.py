@@ -1,8 +1,17 @@
+from typing import Any
+from uuid import UUID
+
 import pytest
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.runnables import RunnableLambda
+from langchain_core.vectorstores import InMemoryVectorStore
+from typing_extensions import override
 
 from langchain_classic.retrievers.multi_query import (
     LineListOutputParser,
+    MultiQueryRetriever,
     _unique_documents,
 )
 
@@ -52,3 +61,112 @@ def test__unique_documents(documents: list[Document], expected: list[Document])
 def test_line_list_output_parser(text: str, expected: list[str]) -> None:
     parser = LineListOutputParser()
     assert parser.parse(text) == expected
+
+
+class _CountingEmbeddings(DeterministicFakeEmbedding):
+    embed_documents_calls: int = 0
+    embed_query_calls: int = 0
+
+    @override
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embed_documents_calls += 1
+        return super().embed_documents(texts)
+
+    @override
+    def embed_query(self, text: str) -> list[float]:
+        self.embed_query_calls += 1
+        return super().embed_query(text)
+
+
+@pytest.mark.parametrize("batch_embed_queries", [True, False])
+def test_retrieve_documents_batch_embed_queries(
+    *,
+    batch_embed_queries: bool,
+) -> None:
+    embeddings = _CountingEmbeddings(size=8)
+    vectorstore = InMemoryVectorStore(embedding=embeddings)
+    vectorstore.add_texts(["foo", "bar", "baz"])
+    embeddings.embed_documents_calls = 0
+    retriever = MultiQueryRetriever(
+        retriever=vectorstore.as_retriever(search_kwargs={"k": 1}),
+        llm_chain=RunnableLambda(lambda _: ["foo", "bar", "foo"]),
+        batch_embed_queries=batch_embed_queries,
+    )
+
+    documents = retriever.invoke("question")
+
+    assert [doc.page_content for doc in documents] == ["foo", "bar"]
+    if batch_embed_queries:
+        assert embeddings.embed_documents_calls == 1
+        assert embeddings.embed_query_calls == 0
+    else:
+        assert embeddings.embed_query_calls == 3
+
+
+async def test_aretrieve_documents_batch_embed_queries() -> None:
+    embeddings = _CountingEmbeddings(size=8)
+    vectorstore = InMemoryVectorStore(embedding=embeddings)
+    await vectorstore.aadd_texts(["foo", "bar", "baz"])
+    embeddings.embed_documents_calls = 0
+    retriever = MultiQueryRetriever(
+        retriever=vectorstore.as_retriever(search_kwargs={"k": 1}),
+        llm_chain=RunnableLambda(lambda _: ["baz", "bar"]),
+        batch_embed_queries=True,
+    )
+
+    documents = await retriever.ainvoke("question")
+
+    assert [doc.page_content for doc in documents] == ["baz", "bar"]
+    assert embeddings.embed_documents_calls == 1
+
+
+class _RetrieverRunRecorder(BaseCallbackHandler):
+    def __init__(self) -> None:
+        self.runs: list[tuple[str, UUID | None]] = []
+        self.ended: list[list[str]] = []
+
+    @override
+    def on_retriever_start(
+        self,
+        serialized: dict[str, Any],
+        query: str,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.runs.append((query, parent_run_id))
+
+    @override
+    def on_retriever_end(self, documents: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self.ended.append([doc.page_content for doc in documents])
+
+
+@pytest.mark.parametrize("batch_embed_queries", [True, False])
+async def test_retrieve_documents_traces_sub_queries(
+    *,
+    batch_embed_queries: bool,
+) -> None:
+    vectorstore = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=8))
+    await vectorstore.aadd_texts(["foo", "bar", "baz"])
+    retriever = MultiQueryRetriever(
+        retriever=vectorstore.as_retriever(search_kwargs={"k": 1}),
+        llm_chain=RunnableLambda(lambda _: ["foo", "bar"]),
+        batch_embed_queries=batch_embed_queries,
+    )
+
+    recorder = _RetrieverRunRecorder()
+    retriever.invoke("question", config={"callbacks": [recorder]})
+    async_recorder = _RetrieverRunRecorder()
+    await retriever.ainvoke("question", config={"callbacks": [async_recorder]})
+
+    for runs, ended in (
+        (recorder.runs, recorder.ended),
+        (async_recorder.runs, async_recorder.ended),
+    ):
+        # The multi-query run and a child run for each generated query
+        (root_query, root_parent), *sub_runs = runs
+        assert (root_query, root_parent) == ("question", None)
+        assert sorted(query for query, _ in sub_runs) == ["bar", "foo"]
+        assert all(parent is not None for _, parent in sub_runs)
+        assert sorted(ended) == [["bar"], ["foo"], ["foo", "bar"]]
@@ -2,6 +2,8 @@ from collections.abc import Callable
 from typing import Any
 
 from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore as CoreInMemoryVectorStore
 from typing_extensions import override
 
 from langchain_classic.retrievers.multi_vector import MultiVectorRetriever, SearchType
@@ -132,3 +134,28 @@ async def test_multi_vector_retriever_similarity_search_with_score_async() -> No
     await retriever.docstore.amset(list(zip(["1"], documents, strict=False)))
     results = retriever.invoke("1")
     assert len(results) == 0
+
+
+async def test_multi_vector_retriever_parent_k_over_fetches() -> None:
+    vectorstore = CoreInMemoryVectorStore(DeterministicFakeEmbedding(size=8))
+    vectorstore.add_documents(
+        [Document(page_content="x", metadata={"doc_id": "a"})] * 4
+        + [Document(page_content="y", metadata={"doc_id": "b"})]
+    )
+    docstore = InMemoryStore()
+    docstore.mset(
+        [("a", Document(page_content="parent a")), ("b", Document(page_content="b"))]
+    )
+
+    retriever = MultiVectorRetriever(
+        vectorstore=vectorstore, docstore=docstore, search_kwargs={"k": 2}
+    )
+    assert [doc.page_content for doc in retriever.invoke("x")] == ["parent a"]
+
+    retriever.parent_k = 2
+    assert [doc.page_content for doc in retriever.invoke("x")] == ["parent a", "b"]
+    results = await retriever.ainvoke("x")
+    assert [doc.page_content for doc in results] == ["parent a", "b"]
+
+    retriever.parent_k = 1
+    assert [doc.page_content for doc in retriever.invoke("x")] == ["parent a"]
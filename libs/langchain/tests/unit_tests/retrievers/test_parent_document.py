@@ -2,6 +2,8 @@ from collections.abc import Sequence
 from typing import Any
 
 from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore as CoreInMemoryVectorStore
 from langchain_text_splitters.character import CharacterTextSplitter
 from typing_extensions import override
 
@@ -46,3 +48,25 @@ def test_parent_document_retriever_initialization() -> None:
     results = retriever.invoke("0")
     assert len(results) > 0
     assert results[0].page_content == "test document"
+
+
+async def test_parent_document_retriever_batch_size() -> None:
+    documents = [Document(page_content=f"parent {i}") for i in range(5)]
+    for use_async in (False, True):
+        vectorstore = CoreInMemoryVectorStore(DeterministicFakeEmbedding(size=8))
+        store = InMemoryStore()
+        retriever = ParentDocumentRetriever(
+            vectorstore=vectorstore,
+            docstore=store,
+            child_splitter=CharacterTextSplitter(chunk_size=400),
+        )
+        if use_async:
+            await retriever.aadd_documents(documents, batch_size=2)
+        else:
+            retriever.add_documents(documents, batch_size=2)
+
+        assert len(vectorstore.store) == 5
+        assert sorted(doc.page_content for doc in store.store.values()) == [
+            doc.page_content for doc in documents
+        ]
+        assert retriever.invoke("parent 3")[0].page_content == "parent 3"
@@ -1,13 +1,13 @@
 """Tests for the time-weighted retriever class."""
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from datetime import datetime, timedelta
 from typing import Any
 
 import pytest
 from langchain_core.documents import Document
-from langchain_core.embeddings import Embeddings
-from langchain_core.vectorstores import VectorStore
+from langchain_core.embeddings import DeterministicFakeEmbedding, Embeddings
+from langchain_core.vectorstores import InMemoryVectorStore, VectorStore
 from typing_extensions import override
 
 from langchain_classic.retrievers.time_weighted_retriever import (
@@ -201,3 +201,158 @@ async def test_aadd_documents(
         time_weighted_retriever.memory_stream[-1].page_content
         == documents[0].page_content
     )
+
+
+class ScoredInMemoryVectorStore(InMemoryVectorStore):
+    """In-memory vector store with cosine similarity rescaled to [0, 1]."""
+
+    @override
+    def _select_relevance_score_fn(self) -> Callable[[float], float]:
+        return lambda score: (score + 1) / 2
+
+
+def test_rescored_docs_match_combined_score(
+    time_weighted_retriever: TimeWeightedVectorStoreRetriever,
+) -> None:
+    memories = time_weighted_retriever.memory_stream
+    for i, doc in enumerate(memories):
+        doc.metadata["last_accessed_at"] = datetime(2023, 4, 14, 12 - i, 0)
+    current_time = datetime.now()
+    docs_and_scores = {
+        doc.metadata["buffer_idx"]: (doc, 0.1 * i) for i, doc in enumerate(memories)
+    }
+    expected = sorted(
+        memories,
+        key=lambda doc: time_weighted_retriever._get_combined_score(
+            doc, docs_and_scores[doc.metadata["buffer_idx"]][1], current_time
+        ),
+        reverse=True,
+    )
+    time_weighted_retriever.k = 2
+
+    rescored = time_weighted_retriever._get_rescored_docs(docs_and_scores)
+
+    assert [doc.metadata["buffer_idx"] for doc in rescored] == [
+        doc.metadata["buffer_idx"] for doc in expected[:2]
+    ]
+
+
+def test_rescored_docs_after_memory_stream_changes(
+    time_weighted_retriever: TimeWeightedVectorStoreRetriever,
+) -> None:
+    def _most_recent() -> int:
+        docs_and_scores = {
+            doc.metadata["buffer_idx"]: (doc, None)
+            for doc in time_weighted_retriever.memory_stream
+        }
+        rescored = time_weighted_retriever._get_rescored_docs(docs_and_scores)
+        return rescored[0].metadata["buffer_idx"]
+
+    time_weighted_retriever.k = 1
+    # Index the timestamps; the retrieved document is then the most recent one
+    assert _most_recent() == 0
+
+    # Replace the memory stream with a list of the same length
+    memories = _get_example_memories()
+    memories[2].metadata["last_accessed_at"] = datetime.now() + timedelta(hours=1)
+    time_weighted_retriever.memory_stream = memories
+    assert _most_recent() == 2
+
+    # Edit a document in place
+    memories[3].metadata["last_accessed_at"] = datetime.now() + timedelta(hours=2)
+    assert _most_recent() == 3
+
+    # Replace a document in place
+    memories[1] = Document(
+        page_content="bar",
+        metadata={
+            "buffer_idx": 1,
+            "last_accessed_at": datetime.now() + timedelta(hours=3),
+        },
+    )
+    assert _most_recent() == 1
+
+
+async def test_max_memory_stream_size() -> None:
+    vectorstore = ScoredInMemoryVectorStore(
+        embedding=DeterministicFakeEmbedding(size=8)
+    )
+    retriever = TimeWeightedVectorStoreRetriever(
+        vectorstore=vectorstore, max_memory_stream_size=3
+    )
+
+    retriever.add_documents([Document(page_content=str(i)) for i in range(2)])
+    await retriever.aadd_documents([Document(page_content=str(i)) for i in range(2, 5)])
+
+    assert [doc.page_content for doc in retriever.memory_stream] == ["2", "3", "4"]
+    assert [doc.metadata["buffer_idx"] for doc in retriever.memory_stream] == [2, 3, 4]
+    assert sorted(doc["text"] for doc in vectorstore.store.values()) == [
+        "2",
+        "3",
+        "4",
+    ]
+    assert {doc.page_content for doc in retriever.invoke("3")} == {"2", "3", "4"}
+
+
+def test_replace_memory_stream_after_eviction() -> None:
+    vectorstore = ScoredInMemoryVectorStore(
+        embedding=DeterministicFakeEmbedding(size=8)
+    )
+    retriever = TimeWeightedVectorStoreRetriever(
+        vectorstore=vectorstore, max_memory_stream_size=2, k=4
+    )
+    retriever.add_documents([Document(page_content=f"d{i}") for i in range(4)])
+    retriever.invoke("d3")
+
+    # Replace the memory stream; the vector store still holds the evicted-era
+    # documents with buffer_idx 2 and 3
+    retriever.memory_stream = [
+        Document(
+            page_content=f"s{i}",
+            metadata={"buffer_idx": i, "last_accessed_at": datetime.now()},
+        )
+        for i in range(2)
+    ]
+
+    # The new documents are retrievable, and stale vector store hits are not
+    # mapped onto them
+    assert sorted(doc.page_content for doc in retriever.invoke("d3")) == ["s0", "s1"]
+    assert retriever._unpersisted == {}
+
+    # New documents continue after the replaced stream
+    retriever.add_documents([Document(page_content="s2")])
+    assert [doc.metadata["buffer_idx"] for doc in retriever.memory_stream] == [1, 2]
+
+
+def test_persist_last_accessed() -> None:
+    vectorstore = ScoredInMemoryVectorStore(
+        embedding=DeterministicFakeEmbedding(size=8)
+    )
+    retriever = TimeWeightedVectorStoreRetriever(
+        vectorstore=vectorstore, k=1, persist_batch_size=2
+    )
+    ids = retriever.add_documents(
+        [Document(page_content="foo"), Document(page_content="bar")],
+        current_time=datetime(2023, 4, 14, 12, 0),
+    )
+    upserts: list[list[str]] = []
+    add_documents = vectorstore.add_documents
+
+    def _record_add_documents(documents: list[Document], **kwargs: Any) -> list[str]:
+        upserts.append(kwargs["ids"])
+        return add_documents(documents, **kwargs)
+
+    object.__setattr__(vectorstore, "add_documents", _record_add_documents)
+
+    retriever.invoke("foo")
+    # Not persisted until a batch of accessed documents is pending
+    assert upserts == []
+
+    retriever.persist_last_accessed()
+    assert upserts == [ids[:1]]
+
+    retriever.k = 2
+    retriever.invoke("bar")
+    assert sorted(upserts[1]) == sorted(ids)
+    for doc in vectorstore.get_by_ids(ids):
+        assert datetime.now() - timedelta(hours=1) < doc.metadata["last_accessed_at"]
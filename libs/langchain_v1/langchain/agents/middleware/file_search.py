@@ -8,8 +8,12 @@ from __future__ import annotations
 
 import fnmatch
 import json
+import os
 import re
+import sqlite3
 import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import suppress
 from datetime import datetime, timezone
 from pathlib import Path
@@ -84,6 +88,260 @@ def _match_include_pattern(basename: str, pattern: str) -> bool:
     return any(fnmatch.fnmatch(basename, candidate) for candidate in expanded)
 
 
+_MAX_QUERY_TRIGRAMS = 64
+"""Upper bound on trigrams used to filter candidates; extra trigrams only narrow."""
+
+_FILES_PER_SCAN_TASK = 64
+"""Number of files handed to a worker process per scan task."""
+
+
+_NUMERIC_ESCAPE = re.compile(
+    r"\\(?:x[0-9a-fA-F]{0,2}|u[0-9a-fA-F]{0,4}|U[0-9a-fA-F]{0,8}|N\{[^}]*\}?"
+    r"|0[0-7]{0,2}|[0-7]{3}|[0-9]{1,2})"
+)
+"""Hex, unicode, named and octal escapes and backreferences, matched as a whole."""
+
+
+def _escape_length(pattern: str, start: int) -> int:
+    """Return the length of the escape sequence starting at `pattern[start]`.
+
+    `pattern[start]` is the backslash. Numeric escapes span several characters,
+    none of which are literal text of the match.
+    """
+    match = _NUMERIC_ESCAPE.match(pattern, start)
+    return match.end() - start if match else 2
+
+
+def _extract_required_literals(pattern: str) -> list[str]:
+    """Return literal substrings that every match of a regex must contain.
+
+    The extraction is conservative: only literal runs outside groups and character
+    classes are collected, and patterns with alternations or inline flags yield no
+    literals, in which case every file is a candidate.
+    """
+    if "|" in pattern or "(?" in pattern:
+        return []
+
+    literals: list[str] = []
+    current: list[str] = []
+
+    def _flush() -> None:
+        if current:
+            literals.append("".join(current))
+            current.clear()
+
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1 : i + 2]
+            # Escaped punctuation is literal; letters and digits start classes,
+            # anchors, numeric escapes or backreferences, which end the literal run.
+            if depth == 0 and escaped and not escaped.isalnum() and not escaped.isspace():
+                current.append(escaped)
+            else:
+                _flush()
+            i += _escape_length(pattern, i)
+        elif char == "[":
+            _flush()
+            i += 1
+            if pattern[i : i + 1] == "^":
+                i += 1
+            if pattern[i : i + 1] == "]":
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            i += 1
+        elif char == "(":
+            _flush()
+            depth += 1
+            i += 1
+        elif char == ")":
+            _flush()
+            depth = max(depth - 1, 0)
+            i += 1
+        elif char in "*?{":
+            # The previous atom may be absent or repeated, so it cannot be part of
+            # a required run.
+            if current:
+                current.pop()
+            _flush()
+            if char == "{":
+                end = pattern.find("}", i)
+                i = end + 1 if end != -1 else i + 1
+            else:
+                i += 1
+        elif char in ".^$+":
+            _flush()
+            i += 1
+        else:
+            if depth == 0:
+                current.append(char)
+            i += 1
+    _flush()
+    return literals
+
+
+def _get_trigrams(text: str) -> set[str]:
+    """Return the set of 3-character substrings of `text`."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _search_file(regex: re.Pattern[str], file_path: str) -> list[tuple[int, str]]:
+    """Return `(line_number, line)` pairs of a file matching `regex`."""
+    try:
+        content = Path(file_path).read_text()
+    except (UnicodeDecodeError, PermissionError, FileNotFoundError):
+        return []
+
+    return [
+        (line_num, line)
+        for line_num, line in enumerate(content.splitlines(), 1)
+        if regex.search(line)
+    ]
+
+
+def _search_files(pattern: str, file_paths: list[str]) -> list[list[tuple[int, str]]]:
+    """Search several files with one regex; runs in worker processes."""
+    regex = re.compile(pattern)
+    return [_search_file(regex, file_path) for file_path in file_paths]
+
+
+class _TrigramIndex:
+    """Persistent inverted trigram index over the files below a root directory.
+
+    The index is stored in SQLite and refreshed incrementally: files are re-read only
+    when their modification time or size changed since they were last indexed.
+    """
+
+    def __init__(self, index_path: str, root_path: Path, max_file_size_bytes: int) -> None:
+        self.root_path = root_path
+        self.max_file_size_bytes = max_file_size_bytes
+        self._excluded_paths: set[str] = set()
+        if index_path != ":memory:":
+            resolved = Path(index_path).resolve()
+            self._excluded_paths = {
+                str(resolved),
+                f"{resolved}-journal",
+                f"{resolved}-wal",
+                f"{resolved}-shm",
+            }
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(index_path, check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS files (
+                    id INTEGER PRIMARY KEY,
+                    path TEXT NOT NULL UNIQUE,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    searchable INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS trigrams (
+                    trigram TEXT NOT NULL,
+                    file_id INTEGER NOT NULL,
+                    PRIMARY KEY (trigram, file_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS trigrams_file_id ON trigrams (file_id);
+                """
+            )
+
+    def candidate_files(self, base_full: Path, pattern: str) -> list[Path]:
+        """Refresh the index below `base_full` and return files that may match."""
+        base_relative = base_full.relative_to(self.root_path).as_posix()
+        trigrams = sorted(
+            set().union(
+                *(_get_trigrams(literal) for literal in _extract_required_literals(pattern))
+            )
+        )[:_MAX_QUERY_TRIGRAMS]
+
+        with self._lock:
+            self._refresh(base_full, base_relative)
+            if trigrams:
+                placeholders = ", ".join("?" * len(trigrams))
+                rows = self._conn.execute(
+                    "SELECT path FROM files WHERE searchable AND id IN ("  # noqa: S608
+                    f"SELECT file_id FROM trigrams WHERE trigram IN ({placeholders}) "
+                    "GROUP BY file_id HAVING COUNT(*) = ?)",
+                    (*trigrams, len(trigrams)),
+                ).fetchall()
+            else:
+                rows = self._conn.execute("SELECT path FROM files WHERE searchable").fetchall()
+
+        return [
+            self.root_path / path
+            for (path,) in rows
+            if _is_within(path, base_relative) and path != base_relative
+        ]
+
+    def _refresh(self, base_full: Path, base_relative: str) -> None:
+        """Re-index new or modified files below `base_full` and drop deleted ones."""
+        indexed = {
+            path: (file_id, mtime_ns, size)
+            for file_id, path, mtime_ns, size in self._conn.execute(
+                "SELECT id, path, mtime_ns, size FROM files"
+            )
+            if _is_within(path, base_relative)
+        }
+
+        with self._conn:
+            for file_path in self._walk(base_full):
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                relative = file_path.relative_to(self.root_path).as_posix()
+                previous = indexed.pop(relative, None)
+                if previous is not None:
+                    if previous[1:] == (stat.st_mtime_ns, stat.st_size):
+                        continue
+                    self._delete(previous[0])
+                self._add(relative, file_path, stat.st_mtime_ns, stat.st_size)
+
+            for file_id, _, _ in indexed.values():
+                self._delete(file_id)
+
+    def _walk(self, base_full: Path) -> list[Path]:
+        if base_full.is_file():
+            return [base_full]
+        files: list[Path] = []
+        for dirpath, _, filenames in os.walk(base_full):
+            for filename in filenames:
+                file_path = Path(dirpath) / filename
+                if str(file_path) not in self._excluded_paths and file_path.is_file():
+                    files.append(file_path)
+        return files
+
+    def _add(self, relative: str, file_path: Path, mtime_ns: int, size: int) -> None:
+        content = None
+        if size <= self.max_file_size_bytes:
+            with suppress(UnicodeDecodeError, PermissionError, FileNotFoundError):
+                content = file_path.read_text()
+
+        cursor = self._conn.execute(
+            "INSERT INTO files (path, mtime_ns, size, searchable) VALUES (?, ?, ?, ?)",
+            (relative, mtime_ns, size, content is not None),
+        )
+        if content:
+            self._conn.executemany(
+                "INSERT INTO trigrams (trigram, file_id) VALUES (?, ?)",
+                ((trigram, cursor.lastrowid) for trigram in _get_trigrams(content)),
+            )
+
+    def _delete(self, file_id: int) -> None:
+        self._conn.execute("DELETE FROM trigrams WHERE file_id = ?", (file_id,))
+        self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+
+def _is_within(path: str, base_relative: str) -> bool:
+    """Return True if the root-relative `path` is `base_relative` or below it."""
+    if base_relative in {"", "."}:
+        return True
+    return path == base_relative or path.startswith(base_relative + "/")
+
+
 class FilesystemFileSearchMiddleware(AgentMiddleware):
     """Provides Glob and Grep search over filesystem files.
 
@@ -115,6 +373,8 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
         root_path: str,
         use_ripgrep: bool = True,
         max_file_size_mb: int = 10,
+        index_path: str | None = None,
+        max_workers: int = 1,
     ) -> None:
         """Initialize the search middleware.
 
@@ -124,10 +384,32 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
 
                 Falls back to Python if `ripgrep` unavailable.
             max_file_size_mb: Maximum file size to search in MB.
+            index_path: SQLite file for a trigram index used by the Python search.
+
+                The index is created if missing and refreshed by modification time
+                on every search, so only new or changed files are re-read. Files
+                that cannot contain the literal parts of a pattern are skipped
+                without being read. Pass `':memory:'` for a non-persistent index.
+
+                Defaults to `None`, which scans every file.
+            max_workers: Number of processes used by the Python search to scan
+                candidate files.
+
+                Defaults to `1`, which scans in the current process.
         """
+        if max_workers < 1:
+            msg = f"max_workers must be at least 1, got {max_workers}."
+            raise ValueError(msg)
+
         self.root_path = Path(root_path).resolve()
         self.use_ripgrep = use_ripgrep
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
+        self.max_workers = max_workers
+        self._index = (
+            _TrigramIndex(index_path, self.root_path, self.max_file_size_bytes)
+            if index_path is not None
+            else None
+        )
 
         # Create tool instances as closures that capture self
         @tool
@@ -321,37 +603,53 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
         if not base_full.exists():
             return {}
 
-        regex = re.compile(pattern)
-        results: dict[str, list[tuple[int, str]]] = {}
+        if self._index is not None:
+            # The index skips files too large or undecodable to search
+            candidates = [
+                file_path
+                for file_path in self._index.candidate_files(base_full, pattern)
+                if not include or _match_include_pattern(file_path.name, include)
+            ]
+        else:
+            candidates = []
+            # Walk directory tree
+            for file_path in base_full.rglob("*"):
+                if not file_path.is_file():
+                    continue
+
+                # Check include filter
+                if include and not _match_include_pattern(file_path.name, include):
+                    continue
+
+                # Skip files that are too large
+                if file_path.stat().st_size > self.max_file_size_bytes:
+                    continue
+
+                candidates.append(file_path)
 
-        # Walk directory tree
-        for file_path in base_full.rglob("*"):
-            if not file_path.is_file():
-                continue
-
-            # Check include filter
-            if include and not _match_include_pattern(file_path.name, include):
-                continue
-
-            # Skip files that are too large
-            if file_path.stat().st_size > self.max_file_size_bytes:
-                continue
-
-            try:
-                content = file_path.read_text()
-            except (UnicodeDecodeError, PermissionError):
-                continue
-
-            # Search content
-            for line_num, line in enumerate(content.splitlines(), 1):
-                if regex.search(line):
-                    virtual_path = "/" + str(file_path.relative_to(self.root_path))
-                    if virtual_path not in results:
-                        results[virtual_path] = []
-                    results[virtual_path].append((line_num, line))
+        results: dict[str, list[tuple[int, str]]] = {}
+        for file_path, matches in zip(
+            candidates, self._scan_files(pattern, candidates), strict=True
+        ):
+            if matches:
+                virtual_path = "/" + str(file_path.relative_to(self.root_path))
+                results[virtual_path] = matches
 
         return results
 
+    def _scan_files(self, pattern: str, files: list[Path]) -> list[list[tuple[int, str]]]:
+        """Search files for `pattern`, in worker processes if configured."""
+        paths = [str(file_path) for file_path in files]
+        if self.max_workers == 1 or len(paths) <= _FILES_PER_SCAN_TASK:
+            return _search_files(pattern, paths)
+
+        chunks = [
+            paths[i : i + _FILES_PER_SCAN_TASK] for i in range(0, len(paths), _FILES_PER_SCAN_TASK)
+        ]
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+            chunk_results = executor.map(_search_files, [pattern] * len(chunks), chunks)
+            return [matches for chunk in chunk_results for matches in chunk]
+
     def _format_grep_results(
         self,
         results: dict[str, list[tuple[int, str]]],
@@ -1,5 +1,6 @@
 """Summarization middleware."""
 
+import bisect
 import uuid
 import warnings
 from collections.abc import Callable, Iterable, Mapping
@@ -128,6 +129,15 @@ def _get_approximate_token_counter(model: BaseChatModel) -> TokenCounter:
     return count_tokens_approximately
 
 
+def _get_message_token_count_key(message: AnyMessage) -> tuple[str, str, int] | None:
+    """Build the memo key for a message's token count, or `None` if it has no ID."""
+    if message.id is None:
+        return None
+    content = message.content
+    content_hash = hash(content) if isinstance(content, str) else hash(repr(content))
+    return message.id, message.type, content_hash
+
+
 class SummarizationMiddleware(AgentMiddleware):
     """Summarizes conversation history when token limits are approached.
 
@@ -245,8 +255,13 @@ class SummarizationMiddleware(AgentMiddleware):
         self.keep = self._validate_context_size(keep, "keep")
         if token_counter is count_tokens_approximately:
             self.token_counter = _get_approximate_token_counter(self.model)
+            # The approximate counter rounds per message, so list counts are sums of
+            # per-message counts and can be memoized message by message.
+            self._additive_token_counter: TokenCounter | None = self.token_counter
         else:
             self.token_counter = token_counter
+            self._additive_token_counter = None
+        self._message_token_counts: dict[tuple[str, str, int], int] = {}
         self.summary_prompt = summary_prompt
         self.trim_tokens_to_summarize = trim_tokens_to_summarize
 
@@ -269,7 +284,7 @@ class SummarizationMiddleware(AgentMiddleware):
         messages = state["messages"]
         self._ensure_message_ids(messages)
 
-        total_tokens = self.token_counter(messages)
+        total_tokens = self._count_tokens(messages)
         if not self._should_summarize(messages, total_tokens):
             return None
 
@@ -297,7 +312,7 @@ class SummarizationMiddleware(AgentMiddleware):
         messages = state["messages"]
         self._ensure_message_ids(messages)
 
-        total_tokens = self.token_counter(messages)
+        total_tokens = self._count_tokens(messages)
         if not self._should_summarize(messages, total_tokens):
             return None
 
@@ -371,27 +386,36 @@ class SummarizationMiddleware(AgentMiddleware):
         if target_token_count <= 0:
             target_token_count = 1
 
-        if self.token_counter(messages) <= target_token_count:
-            return 0
+        prefix_counts = self._get_prefix_token_counts(messages)
+        if prefix_counts is not None:
+            total_tokens = prefix_counts[-1]
+            if total_tokens <= target_token_count:
+                return 0
+            # The suffix starting at `i` holds `total - prefix_counts[i]` tokens, so the
+            # earliest index that keeps the suffix within budget is found by bisection.
+            cutoff_candidate = bisect.bisect_left(prefix_counts, total_tokens - target_token_count)
+        else:
+            if self.token_counter(messages) <= target_token_count:
+                return 0
 
-        # Use binary search to identify the earliest message index that keeps the
-        # suffix within the token budget.
-        left, right = 0, len(messages)
-        cutoff_candidate = len(messages)
-        max_iterations = len(messages).bit_length() + 1
-        for _ in range(max_iterations):
-            if left >= right:
-                break
-
-            mid = (left + right) // 2
-            if self.token_counter(messages[mid:]) <= target_token_count:
-                cutoff_candidate = mid
-                right = mid
-            else:
-                left = mid + 1
-
-        if cutoff_candidate == len(messages):
-            cutoff_candidate = left
+            # Use binary search to identify the earliest message index that keeps the
+            # suffix within the token budget.
+            left, right = 0, len(messages)
+            cutoff_candidate = len(messages)
+            max_iterations = len(messages).bit_length() + 1
+            for _ in range(max_iterations):
+                if left >= right:
+                    break
+
+                mid = (left + right) // 2
+                if self.token_counter(messages[mid:]) <= target_token_count:
+                    cutoff_candidate = mid
+                    right = mid
+                else:
+                    left = mid + 1
+
+            if cutoff_candidate == len(messages):
+                cutoff_candidate = left
 
         if cutoff_candidate >= len(messages):
             if len(messages) == 1:
@@ -401,6 +425,43 @@ class SummarizationMiddleware(AgentMiddleware):
         # Advance past any ToolMessages to avoid splitting AI/Tool pairs
         return self._find_safe_cutoff_point(messages, cutoff_candidate)
 
+    def _count_tokens(self, messages: list[AnyMessage]) -> int:
+        """Count tokens in `messages`, reusing memoized per-message counts if possible."""
+        prefix_counts = self._get_prefix_token_counts(messages)
+        if prefix_counts is not None:
+            return prefix_counts[-1]
+        return self.token_counter(messages)
+
+    def _get_prefix_token_counts(self, messages: list[AnyMessage]) -> list[int] | None:
+        """Return cumulative token counts for `messages`, memoizing per-message counts.
+
+        Counts are keyed by message ID, type and content hash, so only messages that
+        are new since the previous turn are counted. The memo is replaced on every call
+        and therefore never holds more than the current history.
+
+        Returns `None` if the configured token counter is not known to be additive, in
+        which case callers count message lists directly.
+        """
+        if (
+            self._additive_token_counter is None
+            or self.token_counter is not self._additive_token_counter
+        ):
+            return None
+
+        cached_counts = self._message_token_counts
+        message_counts: dict[tuple[str, str, int], int] = {}
+        prefix_counts = [0]
+        for message in messages:
+            key = _get_message_token_count_key(message)
+            count = cached_counts.get(key) if key is not None else None
+            if count is None:
+                count = self.token_counter([message])
+            if key is not None:
+                message_counts[key] = count
+            prefix_counts.append(prefix_counts[-1] + count)
+        self._message_token_counts = message_counts
+        return prefix_counts
+
     def _get_profile_limits(self) -> int | None:
         """Retrieve max input token limit from the model profile."""
         try:
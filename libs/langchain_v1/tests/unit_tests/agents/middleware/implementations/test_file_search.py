@@ -8,6 +8,7 @@ import pytest
 from langchain.agents.middleware.file_search import (
     FilesystemFileSearchMiddleware,
     _expand_include_patterns,
+    _extract_required_literals,
     _is_valid_include_pattern,
     _match_include_pattern,
 )
@@ -122,6 +123,155 @@ class TestFilesystemGrepSearch:
         assert result == "No matches found"
 
 
+class TestIndexedGrepSearch:
+    """Tests for the trigram-indexed and multi-process Python search."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("hello", ["hello"]),
+            ("def.*:", ["def", ":"]),
+            (r"foo\.bar", ["foo.bar"]),
+            ("colou?r", ["colo", "r"]),
+            ("[abc]xyz", ["xyz"]),
+            ("(foo)bar", ["bar"]),
+            (r"\bword\b", ["word"]),
+            ("foo|bar", []),
+            ("(?i)hello", []),
+            (r"\x41bc", ["bc"]),
+            (r"caf\u00e9s", ["caf", "s"]),
+            (r"\N{LATIN SMALL LETTER E}x", ["x"]),
+            (r"(a)b\1cd", ["b", "cd"]),
+            (r"\123abc", ["abc"]),
+            (r"\0foo", ["foo"]),
+        ],
+    )
+    def test_extract_required_literals(self, pattern: str, expected: list[str]) -> None:
+        """Only literal runs that every match must contain are extracted."""
+        assert _extract_required_literals(pattern) == expected
+
+    def test_indexed_search_matches_full_scan(self, tmp_path: Path) -> None:
+        """Indexed search returns the same results as scanning every file."""
+        root = tmp_path / "root"
+        (root / "pkg").mkdir(parents=True)
+        (root / "pkg" / "a.py").write_text("def hello():\n    pass\n", encoding="utf-8")
+        (root / "pkg" / "b.py").write_text("HELLO = 1\ncolor = 2\n", encoding="utf-8")
+        (root / "c.txt").write_text("hello world\ncolour\n", encoding="utf-8")
+
+        plain = FilesystemFileSearchMiddleware(root_path=str(root), use_ripgrep=False)
+        indexed = FilesystemFileSearchMiddleware(
+            root_path=str(root), use_ripgrep=False, index_path=str(tmp_path / "index.db")
+        )
+
+        for pattern in ["hello", "(?i)hello", "colou?r", r"def \w+\(", "missing"]:
+            for path in ["/", "/pkg"]:
+                for output_mode in ["files_with_matches", "content", "count"]:
+                    kwargs = {"pattern": pattern, "path": path, "output_mode": output_mode}
+                    assert indexed.grep_search.func(**kwargs) == plain.grep_search.func(**kwargs)
+
+    @pytest.mark.parametrize(
+        ("pattern", "content"),
+        [
+            (r"\x41bc", "Abc\n"),
+            (r"caf\u00e9", "un café\n"),
+            (r"(ab)\1", "abab\n"),
+        ],
+    )
+    def test_indexed_search_with_numeric_escapes(
+        self, tmp_path: Path, pattern: str, content: str
+    ) -> None:
+        """Characters of numeric escapes and backreferences are not required literals."""
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "match.txt").write_text(content, encoding="utf-8")
+        (root / "other.txt").write_text("nothing here\n", encoding="utf-8")
+
+        indexed = FilesystemFileSearchMiddleware(
+            root_path=str(root), use_ripgrep=False, index_path=str(tmp_path / "index.db")
+        )
+
+        assert indexed.grep_search.func(pattern=pattern) == "/match.txt"
+
+    def test_index_is_refreshed_incrementally(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Only new or modified files are re-read, and deleted files are dropped."""
+        index_path = str(tmp_path / "index.db")
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "keep.txt").write_text("needle\n", encoding="utf-8")
+        (root / "change.txt").write_text("haystack\n", encoding="utf-8")
+        (root / "delete.txt").write_text("needle\n", encoding="utf-8")
+
+        middleware = FilesystemFileSearchMiddleware(
+            root_path=str(root), use_ripgrep=False, index_path=index_path
+        )
+        assert middleware.grep_search.func(pattern="needle") == "/delete.txt\n/keep.txt"
+
+        (root / "change.txt").write_text("needle in the haystack\n", encoding="utf-8")
+        (root / "delete.txt").unlink()
+        (root / "new.txt").write_text("another needle\n", encoding="utf-8")
+
+        read_files: list[str] = []
+        original_read_text = Path.read_text
+
+        def tracking_read_text(self: Path, *args: Any, **kwargs: Any) -> str:
+            read_files.append(self.name)
+            return original_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", tracking_read_text)
+
+        # A new instance reuses the persisted index
+        middleware = FilesystemFileSearchMiddleware(
+            root_path=str(root), use_ripgrep=False, index_path=index_path
+        )
+        result = middleware.grep_search.func(pattern="needle")
+
+        assert result == "/change.txt\n/keep.txt\n/new.txt"
+        # Indexing reads the two changed files, scanning reads the three candidates
+        assert sorted(read_files) == [
+            "change.txt",
+            "change.txt",
+            "keep.txt",
+            "new.txt",
+            "new.txt",
+        ]
+
+    def test_index_skips_large_files(self, tmp_path: Path) -> None:
+        """Files above the size limit are never returned by the index."""
+        (tmp_path / "large.txt").write_text("x" * (2 * 1024 * 1024), encoding="utf-8")
+        (tmp_path / "small.txt").write_text("x", encoding="utf-8")
+
+        middleware = FilesystemFileSearchMiddleware(
+            root_path=str(tmp_path),
+            use_ripgrep=False,
+            max_file_size_mb=1,
+            index_path=":memory:",
+        )
+
+        assert middleware.grep_search.func(pattern="x") == "/small.txt"
+
+    def test_multiprocess_search_matches_serial_search(self, tmp_path: Path) -> None:
+        """Scanning with worker processes returns the same results."""
+        for i in range(200):
+            content = f"line {i}\nmatch {i}\n" if i % 3 == 0 else f"line {i}\n"
+            (tmp_path / f"file{i:03}.txt").write_text(content, encoding="utf-8")
+
+        serial = FilesystemFileSearchMiddleware(root_path=str(tmp_path), use_ripgrep=False)
+        parallel = FilesystemFileSearchMiddleware(
+            root_path=str(tmp_path), use_ripgrep=False, max_workers=2
+        )
+
+        expected = serial.grep_search.func(pattern=r"match \d+", output_mode="content")
+        assert parallel.grep_search.func(pattern=r"match \d+", output_mode="content") == expected
+        assert expected.count("\n") == 66
+
+    def test_invalid_max_workers(self, tmp_path: Path) -> None:
+        """Reject non-positive worker counts."""
+        with pytest.raises(ValueError, match="max_workers"):
+            FilesystemFileSearchMiddleware(root_path=str(tmp_path), max_workers=0)
+
+
 class TestFilesystemGlobSearch:
     """Tests for filesystem-backed glob search."""
 
@@ -887,3 +887,48 @@ def test_summarization_middleware_cutoff_at_start_of_tool_sequence() -> None:
     # Index 2 is an AIMessage (safe cutoff point), so no adjustment needed
     cutoff = middleware._find_safe_cutoff(messages, messages_to_keep=4)
     assert cutoff == 2
+
+
+def test_summarization_middleware_memoizes_default_token_counts() -> None:
+    """Test per-message token counts are reused across turns for the default counter."""
+    middleware = SummarizationMiddleware(
+        model=MockChatModel(), trigger=("tokens", 10_000), keep=("tokens", 40)
+    )
+    default_counter = middleware.token_counter
+    counted: list[str | None] = []
+
+    def counting_token_counter(messages):
+        messages = list(messages)
+        counted.extend(message.id for message in messages)
+        return default_counter(messages)
+
+    middleware.token_counter = counting_token_counter
+    middleware._additive_token_counter = counting_token_counter
+
+    messages: list[AnyMessage] = [
+        HumanMessage(content=f"message number {i}", id=str(i)) for i in range(10)
+    ]
+    assert middleware.before_model({"messages": messages}, None) is None
+    assert counted == [str(i) for i in range(10)]
+
+    # Only the new message is counted on the next turn
+    counted.clear()
+    messages.append(AIMessage(content="a reply", id="10"))
+    assert middleware.before_model({"messages": messages}, None) is None
+    assert counted == ["10"]
+
+    # Edited content invalidates the memoized count for that message
+    counted.clear()
+    messages[0] = HumanMessage(content="edited", id="0")
+    middleware._count_tokens(messages)
+    assert counted == ["0"]
+
+    # Cutoff search reuses the memo and matches the non-memoized search
+    counted.clear()
+    cutoff = middleware._find_token_based_cutoff(messages)
+    assert counted == []
+
+    middleware._additive_token_counter = None
+    assert middleware._find_token_based_cutoff(messages) == cutoff
+    assert sum(default_counter([m]) for m in messages[cutoff:]) <= 40
+    assert sum(default_counter([m]) for m in messages[cutoff - 1 :]) > 40
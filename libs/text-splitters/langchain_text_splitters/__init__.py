@@ -21,6 +21,7 @@ from langchain_text_splitters.html import (
     HTMLHeaderTextSplitter,
     HTMLSectionSplitter,
     HTMLSemanticPreservingSplitter,
+    StreamingHTMLHeaderSplitter,
 )
 from langchain_text_splitters.json import RecursiveJsonSplitter
 from langchain_text_splitters.jsx import JSFrameworkTextSplitter
@@ -61,6 +62,7 @@ __all__ = [
     "RecursiveJsonSplitter",
     "SentenceTransformersTokenTextSplitter",
     "SpacyTextSplitter",
+    "StreamingHTMLHeaderSplitter",
     "TextSplitter",
     "TokenTextSplitter",
     "Tokenizer",
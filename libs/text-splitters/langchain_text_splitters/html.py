@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import copy
+import os
 import pathlib
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from io import StringIO
 from typing import (
     IO,
@@ -261,14 +264,17 @@ class HTMLHeaderTextSplitter:
             final_meta = {k: v[0] for k, v in active_headers.items()}
             return Document(page_content=final_text, metadata=final_meta)
 
-        # We'll use a stack for DFS traversal
-        stack = [body]
+        # We'll use a stack of (node, dom_depth) pairs for DFS traversal, so the
+        # depth of each node is known without walking its parents.
+        stack = [(body, len(list(body.parents)))]
         while stack:
-            node = stack.pop()
+            node, dom_depth = stack.pop()
             children = list(node.children)
 
             stack.extend(
-                child for child in reversed(children) if isinstance(child, Tag)
+                (child, dom_depth + 1)
+                for child in reversed(children)
+                if isinstance(child, Tag)
             )
 
             tag = getattr(node, "name", None)
@@ -282,8 +288,6 @@ class HTMLHeaderTextSplitter:
             if not node_text:
                 continue
 
-            dom_depth = len(list(node.parents))
-
             # If this node is one of our headers
             if tag in self.header_tags:
                 # If we're aggregating, finalize whatever chunk we had
@@ -427,22 +431,29 @@ class HTMLSectionSplitter:
         sections: list[dict[str, str | None]] = []
 
         headers = _find_all_tags(soup, name=["body", *header_names])
+        if not headers:
+            return sections
+
+        # Walk the document once from the first header, switching to the next
+        # section whenever the next header is reached.
+        section_contents: list[list[str]] = [[] for _ in headers]
+        section_content = section_contents[0]
+        next_header = 1
+        for element in headers[0].next_elements:
+            if next_header < len(headers) and element is headers[next_header]:
+                section_content = section_contents[next_header]
+                next_header += 1
+            elif isinstance(element, str):
+                section_content.append(element)
 
         for i, header in enumerate(headers):
             if i == 0:
                 current_header = "#TITLE#"
                 current_header_tag = "h1"
-                section_content: list[str] = []
             else:
                 current_header = header.text.strip()
                 current_header_tag = header.name
-                section_content = []
-            for element in header.next_elements:
-                if i + 1 < len(headers) and element == headers[i + 1]:
-                    break
-                if isinstance(element, str):
-                    section_content.append(element)
-            content = " ".join(section_content).strip()
+            content = " ".join(section_contents[i]).strip()
 
             if content:
                 sections.append(
@@ -515,6 +526,349 @@ class HTMLSectionSplitter:
         ]
 
 
+# Tags whose text is not part of the readable page content.
+_SKIPPED_TAGS = frozenset({"head", "noscript", "script", "style", "template"})
+
+# Inline tags continue the current line of text instead of starting a new one.
+_INLINE_TAGS = frozenset(
+    {
+        "a",
+        "abbr",
+        "b",
+        "bdi",
+        "bdo",
+        "br",
+        "cite",
+        "code",
+        "data",
+        "dfn",
+        "em",
+        "font",
+        "i",
+        "kbd",
+        "mark",
+        "q",
+        "s",
+        "samp",
+        "small",
+        "span",
+        "strong",
+        "sub",
+        "sup",
+        "time",
+        "u",
+        "var",
+    }
+)
+
+
+class _HeaderSectionTarget:
+    """lxml parser target that turns parser events into header-scoped Documents.
+
+    Only the open-element stack, the active headers and the current chunk are kept
+    in memory; finished `Document` objects are collected in `documents` until the
+    caller drains them.
+    """
+
+    def __init__(
+        self, header_mapping: dict[str, str], max_chunk_size: int | None
+    ) -> None:
+        self.header_mapping = header_mapping
+        self.max_chunk_size = max_chunk_size
+        self.documents: list[Document] = []
+        # Dictionary of active headers:
+        #   key = user-defined header name (e.g. "Header 1")
+        #   value = tuple of header_text, level, dom_depth
+        self._active_headers: dict[str, tuple[str, int, int]] = {}
+        self._depth = 0
+        self._skip_depth = 0
+        self._header: tuple[str, int] | None = None
+        self._line: list[str] = []
+        self._line_depth = 0
+        self._chunk: list[str] = []
+        self._chunk_size = 0
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:  # noqa: ARG002
+        self._depth += 1
+        if self._skip_depth or tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in self.header_mapping:
+            # The chunk is only flushed once the header turns out to have text
+            self._flush_line()
+            self._header = (tag, self._depth)
+        elif tag == "br":
+            # Line breaks separate words but do not start a new line
+            if self._line:
+                self._line.append(" ")
+        elif tag not in _INLINE_TAGS:
+            self._flush_line()
+
+    def end(self, tag: str) -> None:
+        if self._skip_depth:
+            self._skip_depth -= 1
+        elif self._header is not None and self._header[1] == self._depth:
+            self._end_header()
+        elif tag not in _INLINE_TAGS:
+            self._flush_line()
+        self._depth -= 1
+
+    def data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if not self._line:
+            self._line_depth = self._depth
+        self._line.append(data)
+
+    def close(self) -> None:
+        self._flush_line()
+        self._flush_chunk()
+
+    def _metadata(self) -> dict[str, str]:
+        return {k: v[0] for k, v in self._active_headers.items()}
+
+    def _end_header(self) -> None:
+        tag, dom_depth = cast("tuple[str, int]", self._header)
+        self._header = None
+        header_text = " ".join("".join(self._line).split())
+        self._line.clear()
+        if not header_text:
+            return
+        self._flush_chunk()
+
+        # Determine numeric level (h1->1, h2->2, etc.)
+        try:
+            level = int(tag[1:])
+        except ValueError:
+            level = 9999
+
+        # Remove any active headers that are at or deeper than this new level
+        self._active_headers = {
+            k: v for k, v in self._active_headers.items() if v[1] < level
+        }
+        self._active_headers[self.header_mapping[tag]] = (
+            header_text,
+            level,
+            dom_depth,
+        )
+        self.documents.append(
+            Document(page_content=header_text, metadata=self._metadata())
+        )
+
+    def _flush_line(self) -> None:
+        if self._header is not None or not self._line:
+            return
+        line = " ".join("".join(self._line).split())
+        self._line.clear()
+        if not line:
+            return
+
+        # Headers go out of scope once text appears above their DOM depth
+        if any(self._line_depth < d for _, _, d in self._active_headers.values()):
+            self._flush_chunk()
+            self._active_headers = {
+                k: v
+                for k, v in self._active_headers.items()
+                if self._line_depth >= v[2]
+            }
+
+        if (
+            self.max_chunk_size is not None
+            and self._chunk
+            and self._chunk_size + len(line) > self.max_chunk_size
+        ):
+            self._flush_chunk()
+        self._chunk.append(line)
+        self._chunk_size += len(line) + 3
+
+    def _flush_chunk(self) -> None:
+        if self._chunk:
+            self.documents.append(
+                Document(
+                    page_content="  \n".join(self._chunk), metadata=self._metadata()
+                )
+            )
+            self._chunk.clear()
+            self._chunk_size = 0
+
+
+@beta()
+class StreamingHTMLHeaderSplitter:
+    """Split HTML into header-scoped Documents in a single streaming pass.
+
+    Unlike `HTMLHeaderTextSplitter`, which builds a BeautifulSoup tree of the whole
+    page before walking it, this splitter feeds the input to lxml's event-driven
+    HTML parser in blocks and emits each chunk as soon as the next header (or the
+    chunk size limit) is reached. No document tree is built, so memory stays
+    bounded by the size of a single chunk even for very large pages.
+
+    Text is emitted in document order: each block-level element starts a new line
+    and lines under the same header hierarchy are joined into one chunk, as in the
+    aggregated output of `HTMLHeaderTextSplitter`. The contents of `<head>`,
+    `<script>`, `<style>`, `<noscript>` and `<template>` are skipped.
+
+    Requires `lxml` package.
+
+    Example:
+        ```python
+        from langchain_text_splitters import StreamingHTMLHeaderSplitter
+
+        splitter = StreamingHTMLHeaderSplitter(
+            headers_to_split_on=[("h1", "Main Topic"), ("h2", "Sub Topic")],
+            max_chunk_size=4000,
+        )
+
+        for document in splitter.lazy_split_file("large_page.html"):
+            ...
+
+        # Split many files in parallel, one list of Documents per file.
+        results = splitter.split_files(["a.html", "b.html"], max_workers=4)
+        ```
+    """
+
+    def __init__(
+        self,
+        headers_to_split_on: list[tuple[str, str]],
+        *,
+        max_chunk_size: int | None = None,
+        block_size: int = 64 * 1024,
+        encoding: str = "utf-8",
+    ) -> None:
+        """Create a new `StreamingHTMLHeaderSplitter`.
+
+        Args:
+            headers_to_split_on: A list of `(header_tag, header_name)` pairs
+                representing the headers that define splitting boundaries, e.g.
+                `[("h1", "Header 1"), ("h2", "Header 2")]`.
+            max_chunk_size: If set, a chunk is emitted early once adding the next
+                line would make it longer than this many characters. Lines are
+                never split, so a single longer line still forms its own chunk.
+            block_size: Number of characters read from the input per parser feed.
+            encoding: Encoding used to read file paths.
+        """
+        self.headers_to_split_on = sorted(
+            headers_to_split_on, key=lambda x: int(x[0][1:])
+        )
+        self.header_mapping = dict(self.headers_to_split_on)
+        self.max_chunk_size = max_chunk_size
+        self.block_size = block_size
+        self.encoding = encoding
+
+    def lazy_split_text(self, text: str) -> Iterator[Document]:
+        """Lazily split an HTML string into `Document` objects.
+
+        Args:
+            text: The HTML text to split.
+
+        Yields:
+            `Document` objects in document order.
+        """
+        return self.lazy_split_file(StringIO(text))
+
+    def lazy_split_file(
+        self, file: str | os.PathLike[str] | IO[str]
+    ) -> Iterator[Document]:
+        """Lazily split HTML content from a file into `Document` objects.
+
+        The file is read `block_size` characters at a time and each `Document` is
+        yielded as soon as it is complete.
+
+        Args:
+            file: A file path or a file-like object containing HTML content.
+
+        Yields:
+            `Document` objects in document order.
+        """
+        if not _HAS_LXML:
+            msg = "Unable to import lxml, please install with `pip install lxml`."
+            raise ImportError(msg)
+        if isinstance(file, (str, os.PathLike)):
+            with pathlib.Path(file).open(encoding=self.encoding) as f:
+                yield from self._stream(f)
+        else:
+            yield from self._stream(file)
+
+    def _stream(self, file: IO[str]) -> Iterator[Document]:
+        target = _HeaderSectionTarget(self.header_mapping, self.max_chunk_size)
+        parser = etree.HTMLParser(target=target, no_network=True)
+        fed = False
+        while block := file.read(self.block_size):
+            if not fed and not block.strip():
+                continue
+            parser.feed(block)
+            fed = True
+            yield from target.documents
+            target.documents.clear()
+        if fed:
+            parser.close()
+            yield from target.documents
+
+    def split_text(self, text: str) -> list[Document]:
+        """Split an HTML string into a list of `Document` objects.
+
+        Args:
+            text: The HTML text to split.
+
+        Returns:
+            A list of split `Document` objects.
+        """
+        return list(self.lazy_split_text(text))
+
+    def split_text_from_file(
+        self, file: str | os.PathLike[str] | IO[str]
+    ) -> list[Document]:
+        """Split HTML content from a file into a list of `Document` objects.
+
+        Args:
+            file: A file path or a file-like object containing HTML content.
+
+        Returns:
+            A list of split `Document` objects.
+        """
+        return list(self.lazy_split_file(file))
+
+    def split_files(
+        self,
+        files: Sequence[str | os.PathLike[str]],
+        *,
+        max_workers: int | None = None,
+        chunksize: int = 1,
+    ) -> list[list[Document]]:
+        """Split many HTML files in parallel using a process pool.
+
+        Parsing is CPU bound, so the files are distributed over worker processes
+        rather than threads.
+
+        Args:
+            files: Paths of the HTML files to split.
+            max_workers: Maximum number of worker processes. Defaults to the number
+                of CPUs.
+            chunksize: Number of files sent to a worker process at a time. Larger
+                values reduce inter-process overhead for many small files.
+
+        Returns:
+            One list of `Document` objects per file, in the order of `files`.
+        """
+        if len(files) <= 1 or max_workers == 1:
+            return [self.split_text_from_file(file) for file in files]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return [
+                [
+                    Document(page_content=page_content, metadata=metadata)
+                    for page_content, metadata in chunks
+                ]
+                for chunks in executor.map(
+                    partial(_split_file_to_tuples, self), files, chunksize=chunksize
+                )
+            ]
+
+
+def _split_file_to_tuples(
+    splitter: StreamingHTMLHeaderSplitter, file: str | os.PathLike[str]
+) -> list[tuple[str, dict[str, str]]]:
+    # Plain tuples are much cheaper to send back from a worker than Documents.
+    return [(doc.page_content, doc.metadata) for doc in splitter.lazy_split_file(file)]
+
+
 @beta()
 class HTMLSemanticPreservingSplitter(BaseDocumentTransformer):
     """Split HTML content preserving semantic structure.
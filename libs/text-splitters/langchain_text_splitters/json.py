@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import copy
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from langchain_core.documents import Document
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 
 class RecursiveJsonSplitter:
     """Splits JSON data into smaller, structured chunks while preserving hierarchy.
@@ -16,6 +19,9 @@ class RecursiveJsonSplitter:
     JSON-formatted strings based on configurable maximum and minimum chunk sizes.
     It supports nested JSON structures, optionally converts lists into dictionaries
     for better chunking, and allows the creation of document objects for further use.
+
+    The serialized size of each subtree is computed once and chunk sizes are tracked
+    as items are added, so splitting takes linear time in the size of the input.
     """
 
     max_chunk_size: int = 2000
@@ -47,20 +53,31 @@ class RecursiveJsonSplitter:
         )
 
     @staticmethod
-    def _json_size(data: dict[str, Any]) -> int:
-        """Calculate the size of the serialized JSON object."""
-        return len(json.dumps(data))
-
-    @staticmethod
-    def _set_nested_dict(
+    def _key_size(key: Any) -> int:  # noqa: ANN401
+        """Calculate the size of a serialized dictionary key."""
+        if isinstance(key, str):
+            return len(json.dumps(key))
+        # Non-string keys are serialized as strings, e.g. `1` as `"1"`
+        return len(json.dumps({key: 0})) - len("{: 0}")
+
+    @classmethod
+    def _set_nested_dict_with_size(
+        cls,
         d: dict[str, Any],
         path: list[str],
         value: Any,  # noqa: ANN401
-    ) -> None:
-        """Set a value in a nested dictionary based on the given path."""
+        value_size: int,
+    ) -> int:
+        """Set a value in a nested dictionary and return the serialized size added."""
+        added = 0
         for key in path[:-1]:
+            if key not in d:
+                # `"key": {}`, preceded by `, ` if the dictionary is not empty
+                added += (2 if d else 0) + cls._key_size(key) + 4
             d = d.setdefault(key, {})
+        added += (2 if d else 0) + cls._key_size(path[-1]) + 2 + value_size
         d[path[-1]] = value
+        return added
 
     def _list_to_dict_preprocessing(
         self,
@@ -78,36 +95,99 @@ class RecursiveJsonSplitter:
         # Base case: the item is neither a dict nor a list, so return it unchanged
         return data
 
-    def _json_split(
-        self,
+    @staticmethod
+    def _is_node(
         data: Any,  # noqa: ANN401
-        current_path: list[str] | None = None,
-        chunks: list[dict[str, Any]] | None = None,
-    ) -> list[dict[str, Any]]:
-        """Split json into maximum size dictionaries while preserving structure."""
-        current_path = current_path or []
-        chunks = chunks if chunks is not None else [{}]
+        *,
+        convert_lists: bool,
+    ) -> bool:
+        """Whether `data` is split into its items rather than kept as a value."""
+        return isinstance(data, dict) or (convert_lists and isinstance(data, list))
+
+    @staticmethod
+    def _items(data: dict[str, Any] | list[Any]) -> Iterable[tuple[str, Any]]:
         if isinstance(data, dict):
-            for key, value in data.items():
-                new_path = [*current_path, key]
-                chunk_size = self._json_size(chunks[-1])
-                size = self._json_size({key: value})
-                remaining = self.max_chunk_size - chunk_size
+            return data.items()
+        return ((str(i), item) for i, item in enumerate(data))
 
-                if size < remaining:
+    def _value_size(
+        self,
+        value: Any,  # noqa: ANN401
+        sizes: dict[int, int],
+        *,
+        convert_lists: bool,
+    ) -> int:
+        """Calculate the serialized size of a value, caching it for dictionaries.
+
+        Lists are measured as the dictionaries they are converted to if
+        `convert_lists` is set.
+        """
+        if not self._is_node(value, convert_lists=convert_lists):
+            return len(json.dumps(value))
+        size = sizes.get(id(value))
+        if size is None:
+            items = [
+                self._key_size(k)
+                + 2
+                + self._value_size(v, sizes, convert_lists=convert_lists)
+                for k, v in self._items(value)
+            ]
+            # `{` + items joined by `, ` + `}`
+            size = 2 + sum(items) + 2 * max(len(items) - 1, 0)
+            sizes[id(value)] = size
+        return size
+
+    def lazy_split_json(
+        self,
+        json_data: dict[str, Any],
+        convert_lists: bool = False,  # noqa: FBT001,FBT002
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily split JSON into JSON chunks.
+
+        Yields the same chunks as `split_json`, each one as soon as it is complete.
+        """
+        sizes: dict[int, int] = {}
+        chunk: dict[str, Any] = {}
+        chunk_size = 2  # len("{}")
+
+        def _split(data: Any, path: list[str]) -> Iterator[dict[str, Any]]:  # noqa: ANN401
+            nonlocal chunk, chunk_size
+            if not self._is_node(data, convert_lists=convert_lists):
+                # handle single item
+                chunk_size += self._set_nested_dict_with_size(
+                    chunk,
+                    path,
+                    data,
+                    self._value_size(data, sizes, convert_lists=convert_lists),
+                )
+                return
+            for key, value in self._items(data):
+                new_path = [*path, key]
+                value_size = self._value_size(value, sizes, convert_lists=convert_lists)
+                # Size of `{key: value}`
+                size = self._key_size(key) + value_size + 4
+
+                if size < self.max_chunk_size - chunk_size:
                     # Add item to current chunk
-                    self._set_nested_dict(chunks[-1], new_path, value)
+                    if convert_lists:
+                        value = self._list_to_dict_preprocessing(value)  # noqa: PLW2901
+                    chunk_size += self._set_nested_dict_with_size(
+                        chunk, new_path, value, value_size
+                    )
                 else:
                     if chunk_size >= self.min_chunk_size:
                         # Chunk is big enough, start a new chunk
-                        chunks.append({})
+                        yield chunk
+                        chunk = {}
+                        chunk_size = 2
 
                     # Iterate
-                    self._json_split(value, new_path, chunks)
-        else:
-            # handle single item
-            self._set_nested_dict(chunks[-1], current_path, data)
-        return chunks
+                    yield from _split(value, new_path)
+
+        yield from _split(json_data, [])
+        # Skip the last chunk if it's empty
+        if chunk:
+            yield chunk
 
     def split_json(
         self,
@@ -115,15 +195,7 @@ class RecursiveJsonSplitter:
         convert_lists: bool = False,  # noqa: FBT001,FBT002
     ) -> list[dict[str, Any]]:
         """Splits JSON into a list of JSON chunks."""
-        if convert_lists:
-            chunks = self._json_split(self._list_to_dict_preprocessing(json_data))
-        else:
-            chunks = self._json_split(json_data)
-
-        # Remove the last chunk if it's empty
-        if not chunks[-1]:
-            chunks.pop()
-        return chunks
+        return list(self.lazy_split_json(json_data, convert_lists=convert_lists))
 
     def split_text(
         self,
@@ -132,7 +204,7 @@ class RecursiveJsonSplitter:
         ensure_ascii: bool = True,  # noqa: FBT001,FBT002
     ) -> list[str]:
         """Splits JSON into a list of JSON formatted strings."""
-        chunks = self.split_json(json_data=json_data, convert_lists=convert_lists)
+        chunks = self.lazy_split_json(json_data=json_data, convert_lists=convert_lists)
 
         # Convert to string
         return [json.dumps(chunk, ensure_ascii=ensure_ascii) for chunk in chunks]
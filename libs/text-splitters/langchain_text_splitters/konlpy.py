@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Any
+import re
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, SimpleQueue
+from typing import TYPE_CHECKING, Any, Literal
 
 from langchain_text_splitters.base import TextSplitter
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 try:
     import konlpy
 
@@ -13,30 +19,123 @@ try:
 except ImportError:
     _HAS_KONLPY = False
 
+# A sentence ends at terminal punctuation (optionally followed by closing quotes or
+# brackets) before whitespace, or at a line break right after a common Korean
+# sentence-final ending. A period after a digit is not a boundary, so numbered
+# list items ("1. 항목") and decimals stay intact.
+_SENTENCE_END = re.compile(
+    r"(?<!\d)[.!?…。！？]+[\"'”’)\]」』]*(?=\s)"  # noqa: RUF001
+    r"|(?<=[다요죠까음함임됨])(?=[ \t]*\n)"
+)
+_PARAGRAPH_BOUNDARY = re.compile(r"\n\s*\n")
+
+
+def split_korean_sentences(text: str) -> list[str]:
+    """Split Korean text into sentences using punctuation and ending rules.
+
+    This is a fast rule-based alternative to Kkma's morphological sentence
+    splitter. It does not need `konlpy` or a JVM.
+
+    Args:
+        text: The text to split.
+
+    Returns:
+        The stripped, non-empty sentences in order.
+    """
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        sentence = text[start : match.end()].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+    tail = text[start:].strip()
+    if tail:
+        sentences.append(tail)
+    return sentences
+
+
+class _KkmaSentenceSegmenter:
+    """Kkma sentence splitter that is safe to call from several threads.
+
+    Each concurrent call borrows its own `Kkma` instance from a pool, and new
+    instances are only created when every existing one is busy.
+    """
+
+    def __init__(self) -> None:
+        if not _HAS_KONLPY:
+            msg = """
+                Konlpy is not installed, please install it with
+                `pip install konlpy`
+                """
+            raise ImportError(msg)
+        self._pool: SimpleQueue[Any] = SimpleQueue()
+        self._pool.put(konlpy.tag.Kkma())
+
+    def __call__(self, text: str) -> list[str]:
+        try:
+            kkma = self._pool.get_nowait()
+        except Empty:
+            kkma = konlpy.tag.Kkma()
+        try:
+            sentences: list[str] = kkma.sentences(text)
+            return sentences
+        finally:
+            self._pool.put(kkma)
+
 
 class KonlpyTextSplitter(TextSplitter):
-    """Splitting text using Konlpy package.
+    """Splitting text into Korean sentences.
 
-    It is good for splitting Korean text.
+    It is good for splitting Korean text. By default sentences are found with a
+    fast rule-based segmenter; Kkma from the Konlpy package can be used instead
+    for morphological sentence splitting.
     """
 
     def __init__(
         self,
         separator: str = "\n\n",
+        *,
+        segmenter: Literal["regex", "kkma"] | Callable[[str], list[str]] = "regex",
+        max_workers: int | None = None,
         **kwargs: Any,
     ) -> None:
-        """Initialize the Konlpy text splitter."""
+        """Initialize the Konlpy text splitter.
+
+        Args:
+            separator: Separator used to join sentences into chunks.
+            segmenter: Sentence segmenter to use. `"regex"` uses the rule-based
+                `split_korean_sentences`, `"kkma"` uses Konlpy's `Kkma` (requires
+                `konlpy` and a JVM), and a callable is used as is.
+            max_workers: If greater than 1, the paragraphs of the text (split on
+                blank lines) are segmented concurrently on this many threads. This
+                helps with the Kkma segmenter, whose JVM calls release the GIL; the
+                regex segmenter gains nothing from it.
+            **kwargs: Additional keyword arguments to pass to `TextSplitter`.
+        """
         super().__init__(**kwargs)
         self._separator = separator
-        if not _HAS_KONLPY:
-            msg = """
-                Konlpy is not installed, please install it with
-                `pip install konlpy`
-                """
-            raise ImportError(msg)
-        self.kkma = konlpy.tag.Kkma()
+        self._max_workers = max_workers
+        if segmenter == "regex":
+            self._segmenter: Callable[[str], list[str]] = split_korean_sentences
+        elif segmenter == "kkma":
+            self._segmenter = _KkmaSentenceSegmenter()
+        elif isinstance(segmenter, str):
+            msg = f"Unknown segmenter: {segmenter!r}"  # type: ignore[unreachable]
+            raise ValueError(msg)
+        else:
+            self._segmenter = segmenter
 
     def split_text(self, text: str) -> list[str]:
         """Split incoming text and return chunks."""
-        splits = self.kkma.sentences(text)
+        # Sentences never span a blank line, so paragraphs are segmented
+        # independently; this keeps each segmenter call small and lets them run
+        # concurrently.
+        paragraphs = [p for p in _PARAGRAPH_BOUNDARY.split(text) if p.strip()]
+        if self._max_workers is not None and self._max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                sentence_lists = list(executor.map(self._segmenter, paragraphs))
+        else:
+            sentence_lists = [self._segmenter(p) for p in paragraphs]
+        splits = [sentence for sentences in sentence_lists for sentence in sentences]
         return self._merge_splits(splits, self._separator)
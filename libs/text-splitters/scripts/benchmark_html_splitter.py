@@ -0,0 +1,98 @@
+"""Benchmark the HTML header splitters on large synthetic pages.
+
+Compares `HTMLHeaderTextSplitter` (full BeautifulSoup tree) with the single-pass
+`StreamingHTMLHeaderSplitter`, and times `split_files` over many pages.
+
+Usage:
+    python scripts/benchmark_html_splitter.py --size-mb 20
+    python scripts/benchmark_html_splitter.py --size-mb 2 --files 32 --workers 4
+"""
+
+import argparse
+import random
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+from langchain_text_splitters import HTMLHeaderTextSplitter, StreamingHTMLHeaderSplitter
+
+HEADERS = [("h1", "Header 1"), ("h2", "Header 2"), ("h3", "Header 3")]
+
+
+def make_page(size_mb: float, seed: int) -> str:
+    """Build an HTML page of nested sections of roughly `size_mb` megabytes."""
+    rng = random.Random(seed)
+    target = int(size_mb * 1_000_000)
+    parts = ["<html><head><title>Benchmark</title></head><body>"]
+    size = 0
+    while size < target:
+        level = rng.choice((1, 2, 2, 3, 3, 3))
+        words = " ".join(
+            "".join(rng.choices("abcdefghijklmnop", k=rng.randint(3, 9)))
+            for _ in range(rng.randint(20, 120))
+        )
+        part = (
+            f"<div><h{level}>Section {size}</h{level}>"
+            f"<p>{words} <b>bold</b> <a href='#'>link</a>.</p></div>"
+        )
+        parts.append(part)
+        size += len(part)
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=float, default=20)
+    parser.add_argument("--files", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-chunk-size", type=int, default=4000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    page = make_page(args.size_mb, args.seed)
+    size_mb = len(page) / 1_000_000
+    streaming = StreamingHTMLHeaderSplitter(HEADERS, max_chunk_size=args.max_chunk_size)
+
+    started = time.perf_counter()
+    num_docs = len(HTMLHeaderTextSplitter(HEADERS).split_text(page))
+    elapsed = time.perf_counter() - started
+    print(  # noqa: T201
+        f"HTMLHeaderTextSplitter:      {size_mb:.1f} MB -> {num_docs:,} docs "
+        f"in {elapsed:.2f}s"
+    )
+
+    started = time.perf_counter()
+    first_doc = None
+    num_docs = 0
+    for _ in streaming.lazy_split_text(page):
+        if first_doc is None:
+            first_doc = time.perf_counter() - started
+        num_docs += 1
+    elapsed = time.perf_counter() - started
+    print(  # noqa: T201
+        f"StreamingHTMLHeaderSplitter: {size_mb:.1f} MB -> {num_docs:,} docs "
+        f"in {elapsed:.2f}s (first doc after {first_doc or 0:.3f}s)"
+    )
+
+    if args.files:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i in range(args.files):
+                path = Path(tmp) / f"page_{i}.html"
+                path.write_text(make_page(args.size_mb, args.seed + i), "utf-8")
+                paths.append(path)
+            for workers in (1, args.workers):
+                started = time.perf_counter()
+                results = streaming.split_files(paths, max_workers=workers)
+                elapsed = time.perf_counter() - started
+                print(  # noqa: T201
+                    f"split_files(max_workers={workers}): {args.files} files -> "
+                    f"{sum(map(len, results)):,} docs in {elapsed:.2f}s"
+                )
+
+
+if __name__ == "__main__":
+    main()
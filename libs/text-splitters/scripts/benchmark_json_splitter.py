@@ -0,0 +1,71 @@
+"""Benchmark `RecursiveJsonSplitter` on a large synthetic JSON export.
+
+Usage:
+    python scripts/benchmark_json_splitter.py --size-mb 50
+    python scripts/benchmark_json_splitter.py --size-mb 50 --convert-lists
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Any
+
+from langchain_text_splitters import RecursiveJsonSplitter
+
+
+def make_export(size_mb: float, seed: int) -> dict[str, Any]:
+    """Build an export of nested user records of roughly `size_mb` megabytes."""
+    rng = random.Random(seed)
+    target = int(size_mb * 1_000_000)
+    users: dict[str, Any] = {}
+    size = 0
+    while size < target:
+        user_id = f"user_{len(users)}"
+        users[user_id] = {
+            "name": "".join(rng.choices("abcdefghijklmnop", k=12)),
+            "profile": {
+                "bio": " ".join(
+                    "".join(rng.choices("abcdefghijklmnop", k=rng.randint(3, 9)))
+                    for _ in range(rng.randint(5, 40))
+                ),
+                "age": rng.randint(18, 90),
+            },
+            "orders": [
+                {"id": rng.randint(1, 10**9), "total": round(rng.random() * 100, 2)}
+                for _ in range(rng.randint(0, 10))
+            ],
+        }
+        size += len(json.dumps(users[user_id])) + len(user_id) + 6
+    return {"export": {"users": users}}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=float, default=50)
+    parser.add_argument("--max-chunk-size", type=int, default=2000)
+    parser.add_argument("--convert-lists", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = make_export(args.size_mb, args.seed)
+    size_mb = len(json.dumps(data)) / 1_000_000
+    splitter = RecursiveJsonSplitter(max_chunk_size=args.max_chunk_size)
+
+    started = time.perf_counter()
+    first_chunk = None
+    num_chunks = 0
+    for _ in splitter.lazy_split_json(data, convert_lists=args.convert_lists):
+        if first_chunk is None:
+            first_chunk = time.perf_counter() - started
+        num_chunks += 1
+    elapsed = time.perf_counter() - started
+
+    print(  # noqa: T201
+        f"{size_mb:.1f} MB -> {num_chunks:,} chunks in {elapsed:.2f}s "
+        f"({size_mb / elapsed:.1f} MB/s, first chunk after {first_chunk or 0:.3f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark `KonlpyTextSplitter` sentence segmenters on a large Korean corpus.
+
+Compares the rule-based default segmenter with Kkma (if `konlpy` is installed),
+with and without concurrent paragraph segmentation.
+
+Usage:
+    python scripts/benchmark_konlpy_splitter.py --size-mb 5
+    python scripts/benchmark_konlpy_splitter.py --size-mb 0.2 --kkma --workers 4
+"""
+
+import argparse
+import random
+import time
+
+from langchain_text_splitters import KonlpyTextSplitter
+
+SUBJECTS = ["오늘 회의는", "새 검색 모델은", "이 문서는", "고객 문의가", "배포 일정이"]
+PREDICATES = [
+    "예정대로 진행되었다.",
+    "생각보다 빠르게 끝났습니다.",
+    "다시 검토해야 할까요?",
+    "정말 놀라웠어요!",
+    "다음 주로 미뤄졌습니다.",
+]
+
+
+def make_corpus(size_mb: float, seed: int) -> str:
+    """Build Korean paragraphs of roughly `size_mb` megabytes (UTF-8)."""
+    rng = random.Random(seed)
+    target = int(size_mb * 1_000_000)
+    paragraphs = []
+    size = 0
+    while size < target:
+        paragraph = " ".join(
+            f"{rng.choice(SUBJECTS)} {rng.randint(1, 999)}번 항목에서 "
+            f"{rng.choice(PREDICATES)}"
+            for _ in range(rng.randint(3, 12))
+        )
+        paragraphs.append(paragraph)
+        size += len(paragraph.encode()) + 2
+    return "\n\n".join(paragraphs)
+
+
+def run(name: str, splitter: KonlpyTextSplitter, text: str, size_mb: float) -> None:
+    started = time.perf_counter()
+    num_chunks = len(splitter.split_text(text))
+    elapsed = time.perf_counter() - started
+    print(  # noqa: T201
+        f"{name:<22} {size_mb:.2f} MB -> {num_chunks:,} chunks in {elapsed:.2f}s "
+        f"({size_mb / elapsed:.2f} MB/s)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=float, default=5)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--kkma", action="store_true")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    text = make_corpus(args.size_mb, args.seed)
+    size_mb = len(text.encode()) / 1_000_000
+    kwargs = {"chunk_size": args.chunk_size, "chunk_overlap": 0}
+
+    run("regex", KonlpyTextSplitter(**kwargs), text, size_mb)
+    if args.kkma:
+        run("kkma", KonlpyTextSplitter(segmenter="kkma", **kwargs), text, size_mb)
+        run(
+            f"kkma (workers={args.workers})",
+            KonlpyTextSplitter(segmenter="kkma", max_workers=args.workers, **kwargs),
+            text,
+            size_mb,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import copy
 import random
 import re
 import string
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pytest
@@ -23,9 +25,11 @@ from langchain_text_splitters.html import (
     HTMLHeaderTextSplitter,
     HTMLSectionSplitter,
     HTMLSemanticPreservingSplitter,
+    StreamingHTMLHeaderSplitter,
 )
 from langchain_text_splitters.json import RecursiveJsonSplitter
 from langchain_text_splitters.jsx import JSFrameworkTextSplitter
+from langchain_text_splitters.konlpy import KonlpyTextSplitter, split_korean_sentences
 from langchain_text_splitters.markdown import (
     ExperimentalMarkdownSyntaxTextSplitter,
     MarkdownHeaderTextSplitter,
@@ -2956,6 +2960,89 @@ def test_section_aware_happy_path_splitting_based_on_header_1_2() -> None:
     assert docs[2].metadata["Header 2"] == "Baz"
 
 
+_STREAMING_HTML = """<!DOCTYPE html>
+<html>
+<head><title>Ignored</title></head>
+<body>
+    <h1>Introduction</h1>
+    <p>Welcome to the introduction section.</p>
+    <div>
+        <h2>Background</h2>
+        <p>Some background details here.</p>
+        <p>More background.</p>
+    </div>
+    <h1>Conclusion</h1>
+    <p>Final thoughts.</p>
+</body>
+</html>"""
+
+
+@pytest.mark.requires("bs4")
+@pytest.mark.requires("lxml")
+@pytest.mark.parametrize("block_size", [1, 7, 64 * 1024])
+@pytest.mark.parametrize(
+    "html",
+    [
+        _STREAMING_HTML,
+        # An empty header neither splits the chunk nor changes the metadata
+        "<h1>A</h1><p>x</p><h1></h1><p>z</p>",
+        "<h1>A</h1><p>x</p><h2> </h2><p>z</p><h2>B</h2><p>w</p>",
+        # Line breaks are inline whitespace, not block boundaries
+        "<h1>A</h1><p>x<br>y</p><div>q<br/>r</div>",
+    ],
+)
+def test_streaming_html_header_splitter_matches_header_text_splitter(
+    html: str, block_size: int
+) -> None:
+    headers_to_split_on = [("h1", "Header 1"), ("h2", "Header 2")]
+    with suppress_langchain_beta_warning():
+        splitter = StreamingHTMLHeaderSplitter(
+            headers_to_split_on, block_size=block_size
+        )
+
+    expected = HTMLHeaderTextSplitter(headers_to_split_on).split_text(html)
+    assert splitter.split_text(html) == expected
+
+
+@pytest.mark.requires("lxml")
+def test_streaming_html_header_splitter_chunks() -> None:
+    html_string = """
+        <h1>Foo</h1>
+        <p>Hello <b>bold</b> world!</p>
+        <script>var x = 1;</script>
+        <style>p { color: red; }</style>
+        <p>one</p><p>two</p><p>three</p>
+    """
+    with suppress_langchain_beta_warning():
+        splitter = StreamingHTMLHeaderSplitter([("h1", "Header 1")], max_chunk_size=20)
+
+    assert splitter.split_text(html_string) == [
+        Document(page_content="Foo", metadata={"Header 1": "Foo"}),
+        Document(page_content="Hello bold world!", metadata={"Header 1": "Foo"}),
+        Document(page_content="one  \ntwo  \nthree", metadata={"Header 1": "Foo"}),
+    ]
+    assert splitter.split_text("  ") == []
+
+
+@pytest.mark.requires("lxml")
+def test_streaming_html_header_splitter_split_files(tmp_path: Path) -> None:
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"page_{i}.html"
+        path.write_text(f"<h1>Page {i}</h1><p>Body {i}</p>", encoding="utf-8")
+        paths.append(path)
+    with suppress_langchain_beta_warning():
+        splitter = StreamingHTMLHeaderSplitter([("h1", "Header 1")])
+
+    results = splitter.split_files(paths, max_workers=2)
+
+    assert results == [splitter.split_text_from_file(path) for path in paths]
+    assert results[2] == [
+        Document(page_content="Page 2", metadata={"Header 1": "Page 2"}),
+        Document(page_content="Body 2", metadata={"Header 1": "Page 2"}),
+    ]
+
+
 @pytest.mark.requires("bs4")
 @pytest.mark.requires("lxml")
 def test_happy_path_splitting_based_on_header_with_font_size() -> None:
@@ -3177,6 +3264,41 @@ def test_split_json_many_calls() -> None:
     assert chunk1 == chunk1_output
 
 
+def test_split_json_exact_chunks() -> None:
+    """Test the chunk boundaries of the json text splitter."""
+    data = {
+        "a": "x" * 10,
+        "b": {"c": "y" * 10, "d": {"e": "z" * 10, 1: [1, 2]}},
+        "f": "é" * 3,
+    }
+    splitter = RecursiveJsonSplitter(max_chunk_size=30, min_chunk_size=15)
+
+    chunks = splitter.split_json(data)
+    assert chunks == [
+        {"a": "x" * 10},
+        {"b": {"c": "y" * 10}},
+        {"b": {"d": {"e": "z" * 10}}},
+        {"b": {"d": {1: [1, 2]}}},
+        {"f": "é" * 3},
+    ]
+    assert list(splitter.lazy_split_json(data)) == chunks
+
+
+def test_split_json_convert_lists_does_not_modify_input() -> None:
+    """Test that converting lists leaves the input data unchanged."""
+    data: dict[str, Any] = {"items": [{"id": i, "tags": ["x", "y"]} for i in range(5)]}
+    expected = copy.deepcopy(data)
+    splitter = RecursiveJsonSplitter(max_chunk_size=60, min_chunk_size=30)
+
+    chunks = splitter.split_json(data, convert_lists=True)
+    assert data == expected
+    merged: dict[str, Any] = {}
+    for chunk in chunks:
+        for key, value in chunk["items"].items():
+            merged.setdefault(key, {}).update(value)
+    assert merged == {str(i): {"id": i, "tags": {"0": "x", "1": "y"}} for i in range(5)}
+
+
 def test_powershell_code_splitter_short_code() -> None:
     splitter = RecursiveCharacterTextSplitter.from_language(
         Language.POWERSHELL, chunk_size=60, chunk_overlap=0
@@ -3879,3 +4001,46 @@ def test_character_text_splitter_chunk_size_effect(
         keep_separator=False,
     )
     assert splitter.split_text(text) == expected
+
+
+def test_split_korean_sentences() -> None:
+    text = (
+        '오늘은 날씨가 좋다. 내일도 좋을까? "정말 좋네요!" 그가 말했다.\n'
+        "1. 첫 번째 항목은 3.14입니다\n"
+        "회의록 작성함\n"
+        "줄바꿈된 문장이\n"
+        "이어집니다"
+    )
+
+    assert split_korean_sentences(text) == [
+        "오늘은 날씨가 좋다.",
+        "내일도 좋을까?",
+        '"정말 좋네요!"',
+        "그가 말했다.",
+        "1. 첫 번째 항목은 3.14입니다",
+        "회의록 작성함",
+        "줄바꿈된 문장이\n이어집니다",
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_konlpy_text_splitter_regex_segmenter(max_workers: int | None) -> None:
+    text = "첫 문장입니다. 둘째 문장입니다.\n\n\n새 문단입니다! 마지막 문장"
+    splitter = KonlpyTextSplitter(
+        chunk_size=20, chunk_overlap=0, max_workers=max_workers
+    )
+
+    assert splitter.split_text(text) == [
+        "첫 문장입니다.\n\n둘째 문장입니다.",
+        "새 문단입니다!\n\n마지막 문장",
+    ]
+
+
+def test_konlpy_text_splitter_custom_segmenter() -> None:
+    splitter = KonlpyTextSplitter(
+        separator=" ", segmenter=str.split, chunk_size=5, chunk_overlap=0
+    )
+    assert splitter.split_text("가 나 다\n\n라 마 바") == ["가 나 다", "라 마 바"]
+
+    with pytest.raises(ValueError, match="Unknown segmenter"):
+        KonlpyTextSplitter(segmenter="okt")  # type: ignore[arg-type]
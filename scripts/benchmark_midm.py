@@ -0,0 +1,172 @@
+"""Mi:dm 서빙 벤치마크 스크립트.
+
+- throughput: 동시 사용자 수(기본 1/8/32)별로 ChatMidm의 처리량을 측정하고,
+  동적 배칭을 사용하지 않는 경우(max_batch_size=1)와 비교합니다.
+- prefill: RAG 시스템 프롬프트를 공유하는 요청의 prefill 지연 시간을
+  프리픽스 KV 캐시 사용 여부에 따라 비교합니다.
+
+사용법:
+    python scripts/benchmark_midm.py --model-path app/models/midm --device-map cpu
+    python scripts/benchmark_midm.py --mode prefill --model-path app/models/midm
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.models import ChatMidm  # noqa: E402
+
+QUESTIONS = [
+    "pgvector가 무엇인지 설명해 주세요.",
+    "LangChain의 Retriever는 어떤 역할을 하나요?",
+    "RAG 시스템에서 청크 크기는 어떻게 정하나요?",
+    "임베딩 모델을 바꾸면 무엇을 다시 해야 하나요?",
+]
+
+
+# app/service/rag_service.create_rag_chain의 시스템 프롬프트
+RAG_SYSTEM_PROMPT = """당신은 유용한 AI 어시스턴트입니다.
+주어진 컨텍스트를 기반으로 사용자의 질문에 정확하고 도움이 되는 답변을 제공하세요.
+컨텍스트에 없는 정보는 추측하지 말고, 모른다고 답변하세요.
+답변의 마지막에 참고한 문서의 출처를 명시하세요.
+
+컨텍스트:
+{context}"""
+
+
+def run_benchmark(
+    model: ChatMidm, users: int, requests_per_user: int
+) -> tuple[float, float, float]:
+    """동시 사용자 수만큼 스레드에서 요청을 보내고 처리량을 측정합니다.
+
+    Args:
+        model: 벤치마크할 ChatMidm 인스턴스.
+        users: 동시 사용자 수.
+        requests_per_user: 사용자당 요청 수.
+
+    Returns:
+        (경과 시간(초), 초당 요청 수, 초당 생성 토큰 수) 튜플.
+    """
+    total_requests = users * requests_per_user
+    inputs = [
+        [HumanMessage(content=QUESTIONS[i % len(QUESTIONS)])]
+        for i in range(total_requests)
+    ]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as executor:
+        results = list(executor.map(model.invoke, inputs))
+    elapsed = time.perf_counter() - start
+
+    output_tokens = sum(
+        result.usage_metadata["output_tokens"]
+        for result in results
+        if result.usage_metadata
+    )
+    return elapsed, total_requests / elapsed, output_tokens / elapsed
+
+
+def run_prefill_benchmark(
+    model: ChatMidm, requests: int, context_repeat: int
+) -> list[float]:
+    """시스템 프롬프트를 공유하는 요청을 순차로 보내 요청별 지연 시간을 측정합니다.
+
+    생성 토큰을 1개로 제한하므로 지연 시간은 대부분 prefill 시간입니다.
+
+    Args:
+        model: 벤치마크할 ChatMidm 인스턴스.
+        requests: 요청 수.
+        context_repeat: 요청별 컨텍스트 길이를 늘리기 위한 반복 횟수.
+
+    Returns:
+        요청별 지연 시간(초) 리스트.
+    """
+    latencies = []
+    for i in range(requests):
+        context = f"[문서 {i}] " + QUESTIONS[i % len(QUESTIONS)] * context_repeat
+        messages = [
+            SystemMessage(content=RAG_SYSTEM_PROMPT.format(context=context)),
+            HumanMessage(content=QUESTIONS[i % len(QUESTIONS)]),
+        ]
+        start = time.perf_counter()
+        model.invoke(messages, max_tokens=1)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main() -> None:
+    """벤치마크를 실행하고 결과 표를 출력합니다."""
+    parser = argparse.ArgumentParser(description="Mi:dm 서빙 벤치마크")
+    parser.add_argument("--mode", choices=["throughput", "prefill"], default="throughput")
+    parser.add_argument("--model-path", default=None, help="로컬 모델 경로")
+    parser.add_argument("--device-map", default="cpu", help="디바이스 매핑")
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests-per-user", type=int, default=2)
+    parser.add_argument("--max-tokens", type=int, default=64)
+    parser.add_argument("--max-batch-size", type=int, default=8)
+    parser.add_argument("--max-batch-wait-ms", type=float, default=10.0)
+    parser.add_argument("--prefill-requests", type=int, default=10)
+    parser.add_argument("--context-repeat", type=int, default=2)
+    parser.add_argument("--prefix-cache-mb", type=float, default=256.0)
+    args = parser.parse_args()
+
+    if args.mode == "prefill":
+        print(f"{'설정':<24}{'첫 요청(ms)':>12}{'이후 평균(ms)':>14}")
+        for name, prefix_cache_mb in [
+            ("프리픽스 캐시 없음", 0.0),
+            ("프리픽스 캐시", args.prefix_cache_mb),
+        ]:
+            model = ChatMidm(
+                model_path=args.model_path,
+                device_map=args.device_map,
+                do_sample=False,
+                prefix_cache_mb=prefix_cache_mb,
+            )
+            latencies = run_prefill_benchmark(
+                model, args.prefill_requests, args.context_repeat
+            )
+            # 첫 요청은 모델 로딩, 두 번째 요청은 프리픽스 prefill을 포함
+            steady = latencies[2:] or latencies
+            print(
+                f"{name:<24}{latencies[0] * 1000:>12.1f}"
+                f"{sum(steady) / len(steady) * 1000:>14.1f}"
+            )
+        return
+
+    configs = {
+        "배칭 없음": 1,
+        f"동적 배칭 (최대 {args.max_batch_size})": args.max_batch_size,
+    }
+
+    print(f"{'설정':<24}{'동시 사용자':>10}{'시간(s)':>10}{'req/s':>10}{'tok/s':>10}")
+    for name, max_batch_size in configs.items():
+        model = ChatMidm(
+            model_path=args.model_path,
+            device_map=args.device_map,
+            max_tokens=args.max_tokens,
+            do_sample=False,
+            max_batch_size=max_batch_size,
+            max_batch_wait_ms=args.max_batch_wait_ms,
+        )
+        # 모델 로딩 시간이 측정에 포함되지 않도록 워밍업
+        model.invoke([HumanMessage(content=QUESTIONS[0])])
+
+        for users in args.users:
+            elapsed, requests_per_second, tokens_per_second = run_benchmark(
+                model, users, args.requests_per_user
+            )
+            print(
+                f"{name:<24}{users:>10}{elapsed:>10.2f}"
+                f"{requests_per_second:>10.2f}{tokens_per_second:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
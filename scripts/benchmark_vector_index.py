@@ -0,0 +1,193 @@
+"""pgvector ANN 인덱스 벤치마크 스크립트.
+
+로컬 Postgres의 벤치마크 전용 컬렉션에 무작위 벡터를 채운 뒤(기본 100만 행),
+정확 검색(순차 스캔)과 HNSW/IVFFlat 인덱스 검색의 p50/p99 지연 시간과
+recall@k를 ef_search/probes 값별로 비교합니다.
+
+앱 서버를 한 번 실행하여 PGVector 테이블이 만들어져 있어야 합니다.
+
+사용법:
+    python scripts/benchmark_vector_index.py --method hnsw --ef-search 20,40,80,160
+    python scripts/benchmark_vector_index.py --method ivfflat --probes 1,5,10,20
+    python scripts/benchmark_vector_index.py --rows 100000 --dimensions 256
+"""
+
+import argparse
+import io
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+import psycopg2
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.app import get_connection_string  # noqa: E402
+from app.repository.vector_repository import PGVectorIndexManager  # noqa: E402
+
+COLLECTION_NAME = "benchmark_vector_index"
+
+
+def _random_vectors(rng: np.random.Generator, n: int, dimensions: int) -> np.ndarray:
+    """정규화된 무작위 벡터를 생성합니다."""
+    vectors = rng.standard_normal((n, dimensions)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _format_vector(vector: np.ndarray) -> str:
+    return "[" + ",".join(f"{x:.6f}" for x in vector) + "]"
+
+
+def load_collection(
+    connection_string: str, rows: int, dimensions: int, batch_size: int, seed: int
+) -> None:
+    """벤치마크 컬렉션을 만들고 COPY로 무작위 벡터를 채웁니다 (이미 채워져 있으면 건너뜀)."""
+    conn = psycopg2.connect(connection_string)
+    conn.autocommit = True
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT uuid FROM langchain_pg_collection WHERE name = %s", (COLLECTION_NAME,)
+    )
+    row = cursor.fetchone()
+    if row is None:
+        collection_id = str(uuid.uuid4())
+        cursor.execute(
+            "INSERT INTO langchain_pg_collection (uuid, name, cmetadata) "
+            "VALUES (%s, %s, '{}')",
+            (collection_id, COLLECTION_NAME),
+        )
+    else:
+        collection_id = str(row[0])
+
+    cursor.execute(
+        "SELECT count(*) FROM langchain_pg_embedding WHERE collection_id = %s",
+        (collection_id,),
+    )
+    existing = cursor.fetchone()[0]
+    if existing >= rows:
+        print(f"📦 기존 데이터 사용: {existing:,}행")
+        cursor.close()
+        conn.close()
+        return
+
+    rng = np.random.default_rng(seed)
+    started = time.perf_counter()
+    for start in range(existing, rows, batch_size):
+        n = min(batch_size, rows - start)
+        buffer = io.StringIO()
+        for i, vector in enumerate(_random_vectors(rng, n, dimensions)):
+            buffer.write(
+                f"bench-{start + i}\t{collection_id}\t{_format_vector(vector)}\t"
+                f"doc {start + i}\t{{}}\n"
+            )
+        buffer.seek(0)
+        cursor.copy_from(
+            buffer,
+            "langchain_pg_embedding",
+            columns=("id", "collection_id", "embedding", "document", "cmetadata"),
+        )
+        print(f"\r📥 적재 중: {start + n:,}/{rows:,}행", end="", flush=True)
+    print(f"\n✅ 적재 완료 ({time.perf_counter() - started:.1f}s)")
+    cursor.execute("ANALYZE langchain_pg_embedding")
+    cursor.close()
+    conn.close()
+
+
+def exact_search(
+    connection_string: str, queries: np.ndarray, k: int
+) -> tuple[list[set[str]], list[float]]:
+    """인덱스를 끈 순차 스캔으로 정답 top-k와 지연 시간을 구합니다."""
+    conn = psycopg2.connect(connection_string)
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT uuid FROM langchain_pg_collection WHERE name = %s", (COLLECTION_NAME,)
+    )
+    collection_id = str(cursor.fetchone()[0])
+    truths, latencies = [], []
+    for query in queries:
+        started = time.perf_counter()
+        cursor.execute("SET LOCAL enable_indexscan = off")
+        cursor.execute(
+            "SELECT id FROM langchain_pg_embedding WHERE collection_id = %s "
+            "ORDER BY embedding <=> %s::vector LIMIT %s",
+            (collection_id, _format_vector(query), k),
+        )
+        truths.append({row[0] for row in cursor.fetchall()})
+        conn.rollback()
+        latencies.append(time.perf_counter() - started)
+    cursor.close()
+    conn.close()
+    return truths, latencies
+
+
+def _percentiles(latencies: list[float]) -> str:
+    p50, p99 = np.percentile(np.asarray(latencies) * 1000, [50, 99])
+    return f"p50 {p50:8.2f}ms | p99 {p99:8.2f}ms"
+
+
+def main() -> None:
+    """벤치마크를 실행합니다."""
+    parser = argparse.ArgumentParser(description="pgvector ANN 인덱스 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--method", choices=("hnsw", "ivfflat"), default="hnsw")
+    parser.add_argument("--ef-search", default="20,40,80,160")
+    parser.add_argument("--probes", default="1,5,10,20")
+    parser.add_argument("--m", type=int, default=16)
+    parser.add_argument("--ef-construction", type=int, default=64)
+    parser.add_argument("--maintenance-work-mem", default="2GB")
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    connection_string = get_connection_string()
+    load_collection(
+        connection_string, args.rows, args.dimensions, args.batch_size, args.seed
+    )
+
+    queries = _random_vectors(
+        np.random.default_rng(args.seed + 1), args.queries, args.dimensions
+    )
+    print(f"\n🔍 정확 검색 (순차 스캔, {args.queries}개 쿼리)")
+    truths, latencies = exact_search(connection_string, queries, args.k)
+    print(f"  exact            | {_percentiles(latencies)} | recall@{args.k} 1.000")
+
+    manager = PGVectorIndexManager(
+        connection_string, collection_name=COLLECTION_NAME, dimensions=args.dimensions
+    )
+    started = time.perf_counter()
+    result = manager.ensure_index(
+        method=args.method,
+        m=args.m,
+        ef_construction=args.ef_construction,
+        maintenance_work_mem=args.maintenance_work_mem,
+    )
+    state = "구축" if result["created"] else "기존 인덱스 사용"
+    print(f"\n🏗️  {args.method} 인덱스 {state} ({time.perf_counter() - started:.1f}s)")
+
+    setting_name = "ef_search" if args.method == "hnsw" else "probes"
+    values = args.ef_search if args.method == "hnsw" else args.probes
+    print(f"\n⚡ {args.method} 검색 ({setting_name}별)")
+    for value in (int(v) for v in values.split(",")):
+        latencies, recalls = [], []
+        for query, truth in zip(queries, truths):
+            started = time.perf_counter()
+            results = manager.search_with_scores(
+                query.tolist(), k=args.k, **{setting_name: value}
+            )
+            latencies.append(time.perf_counter() - started)
+            recalls.append(len(truth & {doc.id for doc, _ in results}) / args.k)
+        print(
+            f"  {setting_name}={value:<6} | {_percentiles(latencies)} "
+            f"| recall@{args.k} {np.mean(recalls):.3f}"
+        )
+    manager.close()
+
+
+if __name__ == "__main__":
+    main()